@@ -28,7 +28,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from game_ui import GomokuUI, main as ui_main
 from gomoku_game import GomokuGame, Player
-from ai_player import AIPlayer
 
 
 def run_server(host="0.0.0.0", port=12345):
@@ -18,6 +18,21 @@ class AIPlayer:
         self.player = player
         self.opponent = Player.WHITE if player == Player.BLACK else Player.BLACK
         self.difficulty = difficulty
+        self.reset()
+        
+        # Difficulty settings
+        self.difficulty_settings = {
+            "easy": {"max_depth": 3, "time_limit": 2.0, "use_smart_moves": False, "max_candidates": 25},
+            "medium": {"max_depth": 5, "time_limit": 5.0, "use_smart_moves": True, "max_candidates": 45},
+            "hard": {"max_depth": 7, "time_limit": 8.0, "use_smart_moves": True, "max_candidates": 55},
+            "expert": {"max_depth": 9, "time_limit": 15.0, "use_smart_moves": True, "max_candidates": 70}
+        }
+        
+        if difficulty not in self.difficulty_settings:
+            raise ValueError(f"Invalid difficulty: {difficulty}. Must be one of {list(self.difficulty_settings.keys())}")
+    
+    def reset(self):
+        """Clear search statistics so the player can be reused for a new game"""
         self.nodes_evaluated = 0
         self.search_time = 0
         
@@ -37,17 +52,6 @@ class AIPlayer:
             "current_depth": 0,
             "is_thinking": False
         }
-        
-        # Difficulty settings
-        self.difficulty_settings = {
-            "easy": {"max_depth": 3, "time_limit": 2.0, "use_smart_moves": False, "max_candidates": 25},
-            "medium": {"max_depth": 5, "time_limit": 5.0, "use_smart_moves": True, "max_candidates": 45},
-            "hard": {"max_depth": 7, "time_limit": 8.0, "use_smart_moves": True, "max_candidates": 55},
-            "expert": {"max_depth": 9, "time_limit": 15.0, "use_smart_moves": True, "max_candidates": 70}
-        }
-        
-        if difficulty not in self.difficulty_settings:
-            raise ValueError(f"Invalid difficulty: {difficulty}. Must be one of {list(self.difficulty_settings.keys())}")
     
     def get_move(self, game: GomokuGame) -> Tuple[int, int]:
         """
@@ -14,6 +14,16 @@ from typing import Dict, List, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
 
+# Outgoing messages drop the whitespace after separators; reconnect payloads
+# carry the whole board, and clients parse either form
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def _encode_frame(message: Dict[str, Any]) -> bytes:
+    """Stamp and newline-frame a message for the wire"""
+    # Stamp every message so clients can estimate their clock skew
+    return (_encode_json({**message, "timestamp": time.time()}) + "\n").encode('utf-8')
+
 
 class ServerMessageType(Enum):
     """Server message types"""
@@ -231,7 +241,7 @@ class DedicatedGomokuServer:
                     line, buffer = buffer.split(b'\n', 1)
                     if line:
                         try:
-                            message = json.loads(line.decode('utf-8'))
+                            message = json.loads(line)  # bytes are decoded as UTF-8
                             self._queue_message(client_id, message)
                         except json.JSONDecodeError:
                             print(f"⚠️  Invalid JSON from {client_id}")
@@ -283,6 +293,17 @@ class DedicatedGomokuServer:
         # Update last ping time
         self.players[client_id].last_ping = time.time()
         
+        # Several non-urgent messages sent in one write
+        if msg_type == "batch":
+            for batched_message in data.get("messages", []):
+                if not isinstance(batched_message, dict) or batched_message.get("type") == "batch":
+                    continue  # Batches carry plain messages only
+                try:
+                    self._handle_message(client_id, batched_message)
+                except Exception as e:
+                    print(f"⚠️  Message processing error: {e}")
+            return
+        
         if msg_type == "ping":
             self._send_to_client(client_id, {"type": "pong", "data": {}})
         
@@ -453,15 +474,20 @@ class DedicatedGomokuServer:
                     })
     
     def _send_to_client(self, client_id: str, message: Dict[str, Any]):
+        if client_id not in self.players:
+            return False
+        return self._send_frame(client_id, _encode_frame(message))
+    
+    def _send_frame(self, client_id: str, frame: bytes):
+        """Write an already encoded frame to a client"""
         if client_id not in self.players:
             return False
         try:
             player = self.players[client_id]
             if not player.socket:
                 return False
-            message_json = json.dumps(message) + "\n"
             with self.send_lock:
-                player.socket.send(message_json.encode('utf-8'))
+                player.socket.send(frame)
             return True
         except Exception as e:
             print(f"⚠️ Send error to {client_id}: {e}")
@@ -484,12 +510,14 @@ class DedicatedGomokuServer:
         
         room = self.rooms[room_id]
         msg_type = message.get("type", "unknown")
+        # Every recipient gets the same bytes, so encode the frame once
+        frame = _encode_frame(message)
         sent_count = 0
         for client_id in room.players:
             if client_id != exclude_client:
                 player = self.players.get(client_id)
                 if player and player.socket:
-                    self._send_to_client(client_id, message)
+                    self._send_frame(client_id, frame)
                     sent_count += 1
                 else:
                     print(f"⚠️ Cannot broadcast {msg_type} to {player.name if player else client_id} - no socket")
@@ -607,12 +635,9 @@ class DedicatedGomokuServer:
         # Update server's board state with the new move
         room.game_state["board"][row][col] = player_id
         
-        # Debug: Count stones on board
-        stone_count = sum(cell != 0 for row_data in room.game_state["board"] for cell in row_data)
-        print(f"📍 Move at ({row}, {col}) by {player.name} (ID: {player_id}). Board now has {stone_count} stones")
-
         # Save move
         room.game_state["moves"].append({"player": player.name, "row": row, "col": col})
+        print(f"📍 Move at ({row}, {col}) by {player.name} (ID: {player_id}). Move {len(room.game_state['moves'])} of the game")
         room.game_state["current_player"] = 3 - room.game_state.get("current_player", 1)
 
         # Reset timer for the next turn
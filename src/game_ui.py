@@ -8,38 +8,53 @@ import sys
 import os
 import time
 import threading
+import queue
 import math
-from typing import Tuple, Optional, Dict, Any
-from enum import Enum
+import heapq
+from operator import itemgetter
+from typing import Tuple, Optional, Dict, Any, List, Iterable
+from enum import Enum, IntEnum
 
-from gomoku_game import GomokuGame, Player, GameState
-from ai_player import AIPlayer, RandomAI
-from stable_client import StableGomokuClient
-from server_config import get_server_config, ServerConfig, ServerType
+from gomoku_game import GomokuGame, Player, GameState, Move
+
+# AI (ai_player), networking (stable_client) and server configuration
+# (server_config) are imported where first needed, so offline sessions
+# start without loading them
 
 # Initialize pygame mixer for sounds
 pygame.mixer.init()
 
+# Posted by the AI worker thread when a move is ready
+AI_DONE_EVENT = pygame.event.custom_type()
+
+# Frame rate while animating or playing, and while a menu sits unchanged
+ACTIVE_FPS = 60
+IDLE_FPS = 10
+
+# Timer event that toggles the text input cursor
+CURSOR_BLINK_EVENT = pygame.event.custom_type()
+CURSOR_BLINK_MS = 500
+
 
-class UIState(Enum):
+class UIState(IntEnum):
     """UI state enumeration"""
-    MAIN_MENU = "main_menu"
-    GAME_MODE_SELECT = "game_mode_select"
-    AI_DIFFICULTY_SELECT = "ai_difficulty_select"
-    AI_PLAYER_COUNT_SELECT = "ai_player_count_select"
-    NETWORK_SETUP = "network_setup"
-    PLAYER_NAME_INPUT = "player_name_input"
-    SERVER_SELECT = "server_select"
-    LOBBY_BROWSER = "lobby_browser"
-    ROOM_CREATE = "room_create"
-    ROOM_WAITING = "room_waiting"
-    GAMEPLAY = "gameplay"
-    GAME_OVER = "game_over"
-    PAUSE_MENU = "pause_menu"
-    SETTINGS = "settings"
-    ABOUT = "about"
-    CONNECTION_LOST = "connection_lost"
-    OPPONENT_DISCONNECTED = "opponent_disconnected"
+    MAIN_MENU = 1
+    GAME_MODE_SELECT = 2
+    AI_DIFFICULTY_SELECT = 3
+    AI_PLAYER_COUNT_SELECT = 4
+    NETWORK_SETUP = 5
+    PLAYER_NAME_INPUT = 6
+    SERVER_SELECT = 7
+    LOBBY_BROWSER = 8
+    ROOM_CREATE = 9
+    ROOM_WAITING = 10
+    GAMEPLAY = 11
+    GAME_OVER = 12
+    PAUSE_MENU = 13
+    SETTINGS = 14
+    ABOUT = 15
+    CONNECTION_LOST = 16
+    OPPONENT_DISCONNECTED = 17
 
 
 class GameMode(Enum):
@@ -49,6 +64,63 @@ class GameMode(Enum):
     NETWORK_GAME = "network_game"
 
 
+# Screens whose only per-frame change is button hover animation; these can
+# present just the buttons that changed instead of flipping the whole window
+STATIC_MENU_STATES = {
+    UIState.MAIN_MENU: "main_menu",
+    UIState.GAME_MODE_SELECT: "game_mode",
+    UIState.AI_DIFFICULTY_SELECT: "ai_difficulty",
+    UIState.AI_PLAYER_COUNT_SELECT: "ai_player_count",
+    UIState.SETTINGS: "settings",
+    UIState.ABOUT: "about",
+}
+
+# Text input screens: like the static menus, except for the typed text and
+# the blinking cursor
+TEXT_INPUT_STATES = {
+    UIState.PLAYER_NAME_INPUT: "player_name_input",
+    UIState.ROOM_CREATE: "room_create",
+}
+
+
+# Events where only the most recent one per frame matters (e.g. for hover
+# state, only the latest mouse position is relevant)
+COMPRESSIBLE_EVENT_TYPES = {pygame.MOUSEMOTION, pygame.VIDEORESIZE, pygame.ACTIVEEVENT}
+
+# Event types each kind of screen reacts to; other events are not dispatched to it
+BUTTON_EVENT_TYPES = frozenset({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP})
+KEYBOARD_SCREEN_EVENT_TYPES = BUTTON_EVENT_TYPES | {pygame.KEYDOWN}
+
+# Minimum gap between two ESC (or two Enter-submit) presses that both count
+KEY_DEGLITCH_MS = 200
+
+# Player member per stored value, for restoring saved or server boards; members
+# map to themselves so already-decoded payloads need no isinstance branch
+PLAYER_BY_VALUE = {**{player.value: player for player in Player}, **{player: player for player in Player}}
+# Network games are two-player; any other cell value from the server is empty
+NETWORK_PLAYER_BY_VALUE = {0: Player.EMPTY, 1: Player.BLACK, 2: Player.WHITE}
+GAME_STATE_BY_VALUE = {**{state.value: state for state in GameState}, **{state: state for state in GameState}}
+
+# Stone colour and game info symbol per player
+PLAYER_COLORS = {
+    Player.BLACK: (0, 0, 0),           # Black
+    Player.WHITE: (255, 255, 255),    # White
+    Player.RED: (220, 38, 38),        # Red
+    Player.BLUE: (37, 99, 235),       # Blue
+    Player.GREEN: (34, 197, 94)       # Green
+}
+PLAYER_SYMBOLS = {
+    Player.BLACK: "●",
+    Player.WHITE: "○",
+    Player.RED: "◆",
+    Player.BLUE: "■",
+    Player.GREEN: "▲"
+}
+
+# Screens drawn over the in-game background image
+GAME_BACKGROUND_STATES = {UIState.GAMEPLAY, UIState.PAUSE_MENU, UIState.GAME_OVER}
+
+
 class Colors:
     """Modern color constants"""
     WHITE = (255, 255, 255)
@@ -78,17 +150,73 @@ class Colors:
 class Button:
     """Modern button class with improved UI/UX"""
     
+    # Press states: a click is reported once per press, then ignored
+    # until the button is released and DEBOUNCE_MS has passed
+    IDLE, PRESSED, DEBOUNCE = range(3)
+    DEBOUNCE_MS = 50
+    
+    # Buttons are drawn every frame; fixed slots make attribute access cheaper
+    __slots__ = ("rect", "font", "color", "text_color", "_text", "_text_surface",
+                 "_text_shadow", "_text_rect", "_text_shadow_rect", "hovered", "enabled",
+                 "hover_alpha", "_press_state", "_last_transition_tick", "dirty",
+                 "_drawn_signature", "_hover_overlay", "_border_idle", "_border_hover",
+                 "_shadow_rect", "_shadow_surface", "draw_rect")
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  font: pygame.font.Font, color: Tuple[int, int, int] = Colors.LIGHT_GRAY,
                  text_color: Tuple[int, int, int] = Colors.BLACK):
         self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
         self.font = font
         self.color = color
         self.text_color = text_color
+        self.text = text  # Renders the cached text surfaces
         self.hovered = False
         self.enabled = True
         self.hover_alpha = 0
+        self._press_state = Button.IDLE
+        self._last_transition_tick = 0
+        self.dirty = True  # Whether the last draw looked different from the one before
+        self._drawn_signature = None
+        
+        # Hover overlay pre-filled with the lightened button color
+        hover_color = tuple(min(255, channel + 20) for channel in color)
+        self._hover_overlay = pygame.Surface(self.rect.size)
+        self._hover_overlay.fill(hover_color)
+        self._hover_overlay = self._hover_overlay.convert()
+        
+        # Border overlays with their alpha baked in (idle and hovered)
+        self._border_idle = self._build_border_surface(Colors.DARK_GRAY, 100)
+        self._border_hover = self._build_border_surface(Colors.ACCENT, 200)
+        
+        # Drop shadow, offset down-right for depth
+        self._shadow_rect = self.rect.move(3, 3)
+        self._shadow_surface = pygame.Surface(self.rect.size)
+        self._shadow_surface.fill(Colors.BLACK)
+        self._shadow_surface = self._shadow_surface.convert()
+        self._shadow_surface.set_alpha(30)
+        
+        # Screen area covered by the button, including its drop shadow
+        self.draw_rect = self.rect.union(self._shadow_rect)
+    
+    @property
+    def text(self) -> str:
+        return self._text
+    
+    @text.setter
+    def text(self, value: str):
+        """Set the label and re-render its cached surfaces"""
+        self._text = value
+        self._text_surface = self.font.render(value, True, self.text_color).convert_alpha()
+        self._text_shadow = self.font.render(value, True, (0, 0, 0)).convert_alpha()
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+        self._text_shadow_rect = self._text_rect.move(1, 1)
+    
+    def _build_border_surface(self, color: Tuple[int, int, int], alpha: int) -> pygame.Surface:
+        """Build a translucent border overlay that darkens the button face"""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        surface.fill((0, 0, 0, alpha))
+        pygame.draw.rect(surface, (*color, alpha), surface.get_rect(), 2)
+        return surface.convert_alpha()
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events, return True if clicked"""
@@ -99,16 +227,42 @@ class Button:
             self.hovered = self.rect.collidepoint(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.rect.collidepoint(event.pos):
-                return True
+                now = pygame.time.get_ticks()
+                settled = now - self._last_transition_tick >= Button.DEBOUNCE_MS
+                # A settled second press means the release went to another screen
+                if self._press_state == Button.IDLE or settled:
+                    self._set_press_state(Button.PRESSED, now)
+                    return True
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1 and self._press_state == Button.PRESSED:
+                self._set_press_state(Button.DEBOUNCE, pygame.time.get_ticks())
         return False
     
+    def _set_press_state(self, state: int, tick: int):
+        """Move the press state machine and remember when it happened"""
+        self._press_state = state
+        self._last_transition_tick = tick
+    
+    def _next_hover_alpha(self) -> int:
+        """Hover highlight alpha for the next frame of the fade animation"""
+        if self.hovered and self.enabled:
+            return min(255, self.hover_alpha + 15)
+        return max(0, self.hover_alpha - 15)
+    
+    def needs_redraw(self) -> bool:
+        """Whether the next draw would look different from the last one"""
+        signature = (self._next_hover_alpha(), self.hovered, self.enabled, self.text, self.color)
+        return signature != self._drawn_signature
+    
     def draw(self, screen: pygame.Surface):
         """Draw the button with modern effects"""
         # Update hover animation
-        if self.hovered and self.enabled:
-            self.hover_alpha = min(255, self.hover_alpha + 15)
-        else:
-            self.hover_alpha = max(0, self.hover_alpha - 15)
+        self.hover_alpha = self._next_hover_alpha()
+        
+        # Track whether this frame's appearance differs from the last one
+        signature = (self.hover_alpha, self.hovered, self.enabled, self.text, self.color)
+        self.dirty = signature != self._drawn_signature
+        self._drawn_signature = signature
         
         # Base button color
         if not self.enabled:
@@ -117,49 +271,23 @@ class Button:
             base_color = self.color
         
         # Draw shadow for depth
-        shadow_rect = pygame.Rect(self.rect.x + 3, self.rect.y + 3, self.rect.width, self.rect.height)
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height))
-        shadow_surface.set_alpha(30)
-        shadow_surface.fill(Colors.BLACK)
-        screen.blit(shadow_surface, shadow_rect)
+        screen.blit(self._shadow_surface, self._shadow_rect)
         
         # Draw button with rounded corners effect (using gradient-like border)
         pygame.draw.rect(screen, base_color, self.rect)
         
         # Hover effect with smooth transition
         if self.hover_alpha > 0 and self.enabled:
-            hover_overlay = pygame.Surface((self.rect.width, self.rect.height))
-            hover_overlay.set_alpha(self.hover_alpha // 2)
-            hover_color = (min(255, base_color[0] + 20), 
-                          min(255, base_color[1] + 20), 
-                          min(255, base_color[2] + 20))
-            hover_overlay.fill(hover_color)
-            screen.blit(hover_overlay, self.rect)
+            self._hover_overlay.set_alpha(self.hover_alpha // 2)
+            screen.blit(self._hover_overlay, self.rect)
         
         # Modern border (thinner, softer)
-        border_color = Colors.ACCENT if self.hovered and self.enabled else Colors.DARK_GRAY
-        border_alpha = 200 if self.hovered and self.enabled else 100
-        border_surface = pygame.Surface((self.rect.width, self.rect.height))
-        border_surface.set_alpha(border_alpha)
-        pygame.draw.rect(border_surface, border_color, border_surface.get_rect(), 2)
+        border_surface = self._border_hover if self.hovered and self.enabled else self._border_idle
         screen.blit(border_surface, self.rect)
         
         # Text with shadow for better readability
-        text_surface = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        
-        # Text shadow
-        shadow_text = self.font.render(self.text, True, (0, 0, 0))
-        shadow_rect = text_rect.copy()
-        shadow_rect.x += 1
-        shadow_rect.y += 1
-        shadow_surf = pygame.Surface(shadow_text.get_size())
-        shadow_surf.set_alpha(50)
-        shadow_surf.fill((0, 0, 0))
-        screen.blit(shadow_text, shadow_rect)
-        
-        # Main text
-        screen.blit(text_surface, text_rect)
+        screen.blit(self._text_shadow, self._text_shadow_rect)
+        screen.blit(self._text_surface, self._text_rect)
 
 
 class GomokuUI:
@@ -175,6 +303,7 @@ class GomokuUI:
         self.BOARD_OFFSET_X = 60
         self.BOARD_OFFSET_Y = 100
         self.CELL_SIZE = self.BOARD_SIZE // GomokuGame.BOARD_SIZE
+        self.PROGRESS_BAR_WIDTH = 400  # Disconnect screen progress bars
         
         # Center the window on screen
         import os
@@ -184,12 +313,49 @@ class GomokuUI:
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         pygame.display.set_caption("Gomoku - Five in a Row")
         
+        # Static board layer (background, border and grid), rendered once
+        self._board_surface = None
+        self._build_board_surface()
+        
+        # Pre-rendered stone sprites, one per player colour
+        self._stone_sprites = {}
+        self._build_stone_sprites()
+        
+        # Screen position of every cell's top-left corner, indexed [row][col]
+        self._cell_toplefts = [[(self.BOARD_OFFSET_X + col * self.CELL_SIZE,
+                                 self.BOARD_OFFSET_Y + row * self.CELL_SIZE)
+                                for col in range(GomokuGame.BOARD_SIZE)]
+                               for row in range(GomokuGame.BOARD_SIZE)]
+        
+        # Stone blits for the occupied cells, keyed on (board, move count);
+        # code writing board cells directly must reset the key
+        self._stone_layer_key = None
+        self._stone_blits = []
+        
+        # Pre-rendered vignette edges for the default gradient background
+        self._vignette_strips = []
+        self._build_vignette()
+        
+        # About page text, composed on first visit
+        self._about_surface = None
+        
+        # Default menu background (base color + gradient + vignette), rendered once
+        self._bg_gradient = None
+        self._build_gradient_background()
+        
         # Initialize fonts (increased sizes for better visibility)
         self.font_large = pygame.font.Font(None, 56)   # Increased from 42
         self.font_medium = pygame.font.Font(None, 36)  # Increased from 28
         self.font_small = pygame.font.Font(None, 28)   # Increased from 22
         self.font_info = pygame.font.Font(None, 32)    # New: for game info
         
+        # Rendered text keyed by (font, text, color) for labels redrawn every frame
+        self._text_cache = {}
+        self._text_shapes = {}  # First rendering per (font, text), recoloured for other colours
+        self._word_widths = {}  # Pixel width per (font, word) for text wrapping
+        self._wrapped_lines = {}  # Wrapped lines per (font, text, max width)
+        self._placed_text = {}  # (surface, topleft) for centred labels, keyed by text and centre
+        
         # Game state
         self.ui_state = UIState.MAIN_MENU
         self.game_mode = None
@@ -200,13 +366,22 @@ class GomokuUI:
         self.is_network_game = False
         self.pause_initiator = None  # Tracks who initiated the pause
         # === Turn Timer ===
+        # Local timers use time.monotonic(), snapshotted once per frame
+        self._frame_now = time.monotonic()
         self.turn_start_time = None
         self.move_time_limit = 30  # seconds (changed from 20 to 30)
         self.elapsed_before_pause = 0  # how much time elapsed before pausing
+        # Monotonic deadline of the running move, derived when the timer fields change
+        self._turn_timer_key = None
+        self._turn_deadline = None
 
+        # Pause info HUD rows, rebuilt when names, allowances or the turn change
+        self._pause_info_rows = []
+        self._pause_info_key = None
+        self._pause_info_dirty = True
+        
         # Pause control per player
         self.paused = False
-        self.pause_sent = False
         self.pause_start_time = None
         self.pause_allowance = {Player.BLACK: 2, Player.WHITE: 2}  # tokens
         self.per_pause_limit = 30  # seconds (limit per individual pause, not cumulative)
@@ -215,7 +390,11 @@ class GomokuUI:
         # AI threading
         self.ai_thinking = False
         self.ai_thread = None
-        self.ai_move_result = None
+        self._active_ai = None  # AI player whose search is running
+        self._ai_pool = {}  # AIPlayer per (player, difficulty), kept across new games
+        self.ai_result_queue = queue.Queue()  # Moves produced by the AI worker
+        self._ai_move_ready = False  # Set when AI_DONE_EVENT delivers a move
+        self._ai_move = None
         self.thinking_start_time = 0
         self.my_player = Player.BLACK
         self.waiting_for_network = False
@@ -225,8 +404,15 @@ class GomokuUI:
         self.pause_icon_color = (200, 200, 200)  # Light gray color for the icon
         self.show_all_players = False  # Whether to show all players or just current
         
+        # Static HUD panels (timer box, pause info boxes)
+        self._build_hud_surfaces()
+        self._build_overlay_surfaces()
+        self._build_instruction_blits()
+        
         # AI Debug viewer
         self.ai_debug_enabled = False  # Toggle with 'D' key
+        # Extra state dumps on rarely used and network paths; GOMOKU_DEBUG=1 enables them
+        self.verbose_debug = bool(os.environ.get("GOMOKU_DEBUG"))
         self.ai_debug_stats = None  # Store last AI statistics
         
         # Player names for display
@@ -236,11 +422,14 @@ class GomokuUI:
         }
         
         # Server configuration
-        self.server_config_manager = get_server_config()
+        self._server_config_manager = None  # Loaded on first use
         self.selected_server_config = None
+        self._server_text_cache = {}  # Server row text surfaces keyed by config fields
+        self._server_text_version = -1  # Config manager version the cache was built for
         
         # UI elements
         self.buttons = {}
+        self._button_rects = {}
         self.text_inputs = {}
         self.messages = []
         self.last_move_pos = None
@@ -248,12 +437,28 @@ class GomokuUI:
         # Game state management
         self.saved_game_exists = False
         self.check_saved_game()
+        # Saves are written off the UI thread; only the newest pending snapshot matters
+        self._save_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._save_worker, daemon=True).start()
         
         # Lobby and networking state
         self.player_name = ""
-        self.current_room_list = []
+        self._room_rects = []
+        self._room_surface_cache = {}  # Rendered (name, info) text per room row
+        self._room_waiting_key = None  # Room fields the waiting screen labels were built from
+        self._game_over_key = None  # Result the game over text was laid out for
+        self._game_info_key = None  # Turn state the game info panel was laid out for
+        self._game_info_layout = None
+        self._ai_debug_key = None  # Stats the AI debug panel text was laid out for
+        self._ai_debug_blits = None
+        self._reason_layout_key = None  # disconnect_reason the wrapped lines were built for
+        self._reason_layout = []
+        self._game_over_blits = []
+        self._room_waiting_labels = []
+        self.current_room_list = []  # Also lays out _room_rects
         self.selected_room = None
         self.room_info = None
+        self.network_game_info = None  # Set when the server starts a network game
         
         # Room & reconnection state
         self.room_id = None
@@ -262,6 +467,18 @@ class GomokuUI:
         # Disconnection tracking
         self.opponent_disconnect_time = None
         self.opponent_disconnect_timeout = 120  # seconds (not used with graceful termination)
+        self._leave_game_rect = pygame.Rect((self.WINDOW_WIDTH - 200) // 2, 520, 200, 50)
+        self._leave_game_hover = False  # Updated from mouse motion events
+        self._opponent_disc_backdrop = None  # Dimmed snapshot of the paused game
+        
+        # Reconnection / countdown progress bar, shared by both disconnect screens
+        self._progress_bar = pygame.Surface((self.PROGRESS_BAR_WIDTH, 20), pygame.SRCALPHA)
+        self._progress_bar_pos = ((self.WINDOW_WIDTH - self.PROGRESS_BAR_WIDTH) // 2, 450)
+        self._progress_bar_key = None
+        # Full-width band holding the progress / countdown line above the bar
+        status_height = self.font_medium.get_height() + 4
+        self._disconnect_status_band = pygame.Rect(0, 400 - status_height // 2, self.WINDOW_WIDTH, status_height)
+        self._presented_disconnect_reason = None
         self.reconnection_attempt = 0
         self.max_reconnection_attempts = 12
         self.disconnect_reason = ""
@@ -271,9 +488,22 @@ class GomokuUI:
         self.text_input_active = False
         self.text_input_content = ""
         self.text_input_prompt = ""
+        self._last_submit_ms = -KEY_DEGLITCH_MS
+        self._last_escape_ms = -KEY_DEGLITCH_MS
+        
+        # Display presentation (partial updates for static menu screens)
+        self._dirty_rects = None  # None means the whole frame may have changed
+        self._last_presented_state = None
+        self._force_full_flip = True
+        
+        # Text input cursor, toggled by CURSOR_BLINK_EVENT
+        self._cursor_visible = True
+        self._drawn_text_input = None  # (content, cursor visible) last drawn
+        pygame.time.set_timer(CURSOR_BLINK_EVENT, CURSOR_BLINK_MS)
         
         # Clock for FPS
         self.clock = pygame.time.Clock()
+        self._idle_frame = False  # Whether the last _draw had nothing to redraw
         self.running = True
         
         # Sound system
@@ -281,17 +511,128 @@ class GomokuUI:
         self.music_enabled = True
         self.sounds = {}
         self.background_music = None
+        self._music_lock = threading.Lock()  # Serializes mixer.music load/play/stop and _music_playing
+        self._music_loaded = False  # Track stays loaded across stop()/play()
+        self._music_playing = False  # Flipped only by the play/stop helpers; the track loops forever
         self._load_sounds()
         
         # Background images
         self.background_images = {}
         self._load_background_images()
         
-        # Start background music automatically
-        self._play_background_music()
+        # Start background music automatically (decoding happens off the main thread)
+        threading.Thread(target=self._play_background_music, daemon=True).start()
         
         # Initialize UI elements
         self._init_ui_elements()
+        
+        # Per-state draw functions
+        self._draw_handlers = {
+            UIState.MAIN_MENU: self._draw_main_menu,
+            UIState.GAME_MODE_SELECT: self._draw_game_mode_select,
+            UIState.AI_DIFFICULTY_SELECT: self._draw_ai_difficulty_select,
+            UIState.AI_PLAYER_COUNT_SELECT: self._draw_ai_player_count_select,
+            UIState.GAMEPLAY: self._draw_gameplay,
+            UIState.PAUSE_MENU: self._draw_pause_menu,
+            UIState.GAME_OVER: self._draw_game_over,
+            UIState.SETTINGS: self._draw_settings,
+            UIState.ABOUT: self._draw_about,
+            UIState.PLAYER_NAME_INPUT: self._draw_player_name_input,
+            UIState.SERVER_SELECT: self._draw_server_select,
+            UIState.LOBBY_BROWSER: self._draw_lobby_browser,
+            UIState.ROOM_CREATE: self._draw_room_create,
+            UIState.ROOM_WAITING: self._draw_room_waiting,
+            UIState.CONNECTION_LOST: self._draw_connection_lost,
+            UIState.OPPONENT_DISCONNECTED: self._draw_opponent_disconnected,
+        }
+        # State -> (event types the screen handles, handler)
+        self._event_handlers = {
+            UIState.MAIN_MENU: (BUTTON_EVENT_TYPES, self._handle_main_menu_events),
+            UIState.GAME_MODE_SELECT: (BUTTON_EVENT_TYPES, self._handle_game_mode_events),
+            UIState.AI_DIFFICULTY_SELECT: (BUTTON_EVENT_TYPES, self._handle_ai_difficulty_events),
+            UIState.AI_PLAYER_COUNT_SELECT: (BUTTON_EVENT_TYPES, self._handle_ai_player_count_events),
+            UIState.GAMEPLAY: (KEYBOARD_SCREEN_EVENT_TYPES, self._handle_gameplay_events),
+            UIState.PAUSE_MENU: (BUTTON_EVENT_TYPES, self._handle_pause_menu_events),
+            UIState.GAME_OVER: (BUTTON_EVENT_TYPES, self._handle_game_over_events),
+            UIState.SETTINGS: (BUTTON_EVENT_TYPES, self._handle_settings_events),
+            UIState.PLAYER_NAME_INPUT: (KEYBOARD_SCREEN_EVENT_TYPES, self._handle_player_name_input_events),
+            UIState.SERVER_SELECT: (KEYBOARD_SCREEN_EVENT_TYPES, self._handle_server_select_events),
+            UIState.LOBBY_BROWSER: (BUTTON_EVENT_TYPES, self._handle_lobby_browser_events),
+            UIState.ROOM_CREATE: (KEYBOARD_SCREEN_EVENT_TYPES, self._handle_room_create_events),
+            UIState.ROOM_WAITING: (BUTTON_EVENT_TYPES, self._handle_room_waiting_events),
+            UIState.ABOUT: (BUTTON_EVENT_TYPES, self._handle_about_events),
+            UIState.OPPONENT_DISCONNECTED: ({pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN},
+                                            self._handle_opponent_disconnected_events),
+        }
+        # ESC maps a state either to the state to return to or to a callable
+        self._escape_targets = {
+            UIState.GAME_MODE_SELECT: UIState.MAIN_MENU,
+            UIState.AI_DIFFICULTY_SELECT: self._escape_ai_difficulty_select,
+            UIState.AI_PLAYER_COUNT_SELECT: UIState.GAME_MODE_SELECT,
+            UIState.PLAYER_NAME_INPUT: UIState.SERVER_SELECT,
+            UIState.SERVER_SELECT: UIState.GAME_MODE_SELECT,
+            UIState.LOBBY_BROWSER: self._disconnect_from_lobby,
+            UIState.ROOM_CREATE: UIState.LOBBY_BROWSER,
+            UIState.ROOM_WAITING: self._leave_room,
+            UIState.GAMEPLAY: self._escape_gameplay,
+            UIState.PAUSE_MENU: UIState.GAMEPLAY,
+            UIState.SETTINGS: UIState.MAIN_MENU,
+            UIState.ABOUT: UIState.MAIN_MENU,
+            UIState.OPPONENT_DISCONNECTED: self._escape_opponent_disconnected,
+        }
+    
+    @property
+    def server_config_manager(self):
+        """Server configuration manager, loaded on first use"""
+        if self._server_config_manager is None:
+            from server_config import get_server_config
+            self._server_config_manager = get_server_config()
+        return self._server_config_manager
+    
+    @property
+    def player_names(self) -> Dict[Player, str]:
+        """Display name per player"""
+        return self._player_names
+    
+    @player_names.setter
+    def player_names(self, names: Dict[Player, str]):
+        self._player_names = names
+        self._pause_info_dirty = True
+        self._game_over_key = None
+    
+    @property
+    def pause_allowance(self) -> Dict[Player, int]:
+        """Pauses left per player"""
+        return self._pause_allowance
+    
+    @pause_allowance.setter
+    def pause_allowance(self, allowance: Dict[Player, int]):
+        self._pause_allowance = allowance
+        self._pause_info_dirty = True
+    
+    @property
+    def current_room_list(self) -> list:
+        """Rooms shown in the lobby browser"""
+        return self._current_room_list
+    
+    @current_room_list.setter
+    def current_room_list(self, rooms: list):
+        self._current_room_list = rooms
+        # Lay out the list rows once per update instead of per click and frame
+        start_y = 200
+        item_height = 60
+        self._room_rects = [pygame.Rect(150, start_y + i * (item_height + 10), 500, item_height)
+                            for i in range(len(rooms))]
+        # Keep rendered rows only for rooms that are still listed unchanged
+        live_rooms = {self._room_row_key(room) for room in rooms}
+        self._room_surface_cache = {key: surfaces for key, surfaces in self._room_surface_cache.items()
+                                    if key[:-1] in live_rooms}
+    
+    @staticmethod
+    def _room_row_key(room: dict) -> tuple:
+        """Fields of a room that its lobby row text is rendered from"""
+        return (room.get("name", "Unknown Room"), room.get("host_name", "Unknown"),
+                room.get("players", 0), room.get("max_players", 2))
     
     def check_saved_game(self):
         """Check if a saved game exists"""
@@ -335,6 +676,10 @@ class GomokuUI:
                     self.background_images["start"], 
                     (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
                 )
+                # Bake in a dark overlay for better text readability
+                self.background_images["start"] = self._darken_background(
+                    self.background_images["start"], 120
+                )
             
             # Load game image
             game_image_path = os.path.join(img_dir, "image_game.webp")
@@ -345,12 +690,25 @@ class GomokuUI:
                     self.background_images["game"], 
                     (self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
                 )
+                # Bake in a subtle overlay for better visibility
+                self.background_images["game"] = self._darken_background(
+                    self.background_images["game"], 60
+                )
             
             print("✅ Background images loaded successfully")
         except Exception as e:
             print(f"⚠️ Error loading background images: {e}")
             self.background_images = {}
     
+    def _darken_background(self, image: pygame.Surface, alpha: int) -> pygame.Surface:
+        """Composite a black overlay onto a background image once, at load time"""
+        background = image.convert()
+        overlay = pygame.Surface(background.get_size())
+        overlay.set_alpha(alpha)
+        overlay.fill(Colors.BLACK)
+        background.blit(overlay, (0, 0))
+        return background
+    
     def _play_sound(self, sound_name: str):
         """Play a sound effect if sounds are enabled"""
         if not self.sounds_enabled:
@@ -374,83 +732,95 @@ class GomokuUI:
             return
             
         try:
-            # Only start music if it's not already playing
-            if not pygame.mixer.music.get_busy():
-                pygame.mixer.music.load(self.background_music)
+            # Runs on the startup thread as well as the main thread, so the
+            # check, play and flag update happen under one lock
+            with self._music_lock:
+                # Only start music if it's not already playing
+                if self._music_playing:
+                    print("🎵 Background music already playing")
+                    return
+                self._ensure_music_loaded()
+                if not self.music_enabled:
+                    return  # Disabled while the track was loading
                 pygame.mixer.music.play(-1)  # Loop indefinitely
                 pygame.mixer.music.set_volume(0.3)  # Lower volume for background
-                print(f"🎵 Background music started: {os.path.basename(self.background_music)}")
-            else:
-                print("🎵 Background music already playing")
+                self._music_playing = True
+            print(f"🎵 Background music started: {os.path.basename(self.background_music)}")
         except Exception as e:
             print(f"⚠️ Error playing background music: {e}")
     
+    def _ensure_music_loaded(self):
+        """Load the background track once; later plays reuse the loaded stream
+
+        Caller must hold _music_lock.
+        """
+        if not self._music_loaded:
+            pygame.mixer.music.load(self.background_music)
+            self._music_loaded = True
+    
     def _stop_background_music(self):
         """Stop background music"""
-        try:
-            pygame.mixer.music.stop()
-        except:
-            pass
+        with self._music_lock:
+            self._music_playing = False
+            try:
+                pygame.mixer.music.stop()
+            except:
+                pass
     
     def _draw_gradient_background(self, use_image=None):
         """Draw a modern gradient background with optional image"""
         # Determine which background to use
         if use_image == "start" and "start" in self.background_images:
-            # Draw start image with overlay
+            # Draw start image (dark overlay baked in at load time)
             self.screen.blit(self.background_images["start"], (0, 0))
-            # Add dark overlay for better text readability
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            overlay.set_alpha(120)  # Darker overlay for start screen
-            overlay.fill(Colors.BLACK)
-            self.screen.blit(overlay, (0, 0))
         elif use_image == "game" and "game" in self.background_images:
-            # Draw game image with subtle overlay
+            # Draw game image (subtle overlay baked in at load time)
             self.screen.blit(self.background_images["game"], (0, 0))
-            # Add subtle overlay for better visibility
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            overlay.set_alpha(60)  # Lighter overlay for gameplay
-            overlay.fill(Colors.BLACK)
-            self.screen.blit(overlay, (0, 0))
         else:
-            # Default gradient background
-            # Fill with base color first (faster)
-            self.screen.fill(Colors.BACKGROUND)
-            
-            # Add enhanced gradient overlay with more depth
-            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            overlay.set_alpha(50)  # Increased alpha for more visible effect
-            for y in range(0, self.WINDOW_HEIGHT, 2):  # More lines for smoother gradient
-                ratio = y / self.WINDOW_HEIGHT
-                # More pronounced gradient
-                color_val = int(255 * ratio * 0.15)
-                pygame.draw.line(overlay, (color_val, color_val, color_val), 
-                               (0, y), (self.WINDOW_WIDTH, y), 2)
-            self.screen.blit(overlay, (0, 0))
-            
-            # Add subtle vignette effect (darkened edges) - optimized
-            edge_overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-            edge_overlay.set_alpha(10)
-            edge_overlay.fill((0, 0, 0))
-            # Create gradient edges by drawing rectangles with decreasing alpha
-            edge_width = 50
-            for i in range(edge_width):
-                alpha = int(10 * (1 - i / edge_width))
-                if alpha > 0:
-                    edge_surf = pygame.Surface((self.WINDOW_WIDTH, 1))
-                    edge_surf.set_alpha(alpha)
-                    edge_surf.fill((0, 0, 0))
-                    # Top edge
-                    self.screen.blit(edge_surf, (0, i))
-                    # Bottom edge
-                    self.screen.blit(edge_surf, (0, self.WINDOW_HEIGHT - 1 - i))
-                    
-                    edge_surf = pygame.Surface((1, self.WINDOW_HEIGHT))
-                    edge_surf.set_alpha(alpha)
-                    edge_surf.fill((0, 0, 0))
-                    # Left edge
-                    self.screen.blit(edge_surf, (i, 0))
-                    # Right edge
-                    self.screen.blit(edge_surf, (self.WINDOW_WIDTH - 1 - i, 0))
+            # Default gradient background with vignette (pre-rendered)
+            self.screen.blit(self._bg_gradient, (0, 0))
+    
+    def _build_vignette(self):
+        """Pre-render the four darkened edge strips of the vignette"""
+        edge_width = 50
+        top = pygame.Surface((self.WINDOW_WIDTH, edge_width), pygame.SRCALPHA)
+        left = pygame.Surface((edge_width, self.WINDOW_HEIGHT), pygame.SRCALPHA)
+        
+        # Alpha fades out linearly from the edge towards the centre
+        for i in range(edge_width):
+            alpha = int(10 * (1 - i / edge_width))
+            top.fill((0, 0, 0, alpha), (0, i, self.WINDOW_WIDTH, 1))
+            left.fill((0, 0, 0, alpha), (i, 0, 1, self.WINDOW_HEIGHT))
+        
+        bottom = pygame.transform.flip(top, False, True)
+        right = pygame.transform.flip(left, True, False)
+        self._vignette_strips = [
+            (top, (0, 0)),
+            (bottom, (0, self.WINDOW_HEIGHT - edge_width)),
+            (left, (0, 0)),
+            (right, (self.WINDOW_WIDTH - edge_width, 0)),
+        ]
+    
+    def _build_gradient_background(self):
+        """Pre-render the default background: base color, gradient and vignette"""
+        background = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        background.fill(Colors.BACKGROUND)
+        
+        # Vertical gradient, one shade per two rows; built as a single column
+        # and stretched to full width
+        column = pygame.Surface((1, self.WINDOW_HEIGHT))
+        for y in range(0, self.WINDOW_HEIGHT, 2):
+            ratio = y / self.WINDOW_HEIGHT
+            color_val = int(255 * ratio * 0.15)
+            column.fill((color_val, color_val, color_val), (0, y, 1, 2))
+        overlay = pygame.transform.scale(column, (self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        overlay.set_alpha(50)
+        background.blit(overlay, (0, 0))
+        
+        # Subtle vignette effect (darkened edges)
+        background.blits(self._vignette_strips, doreturn=False)
+        
+        self._bg_gradient = background.convert()
     
     def _wrap_text(self, text: str, font: pygame.font.Font, max_width: int) -> list:
         """Wrap text to fit within max_width"""
@@ -460,9 +830,9 @@ class GomokuUI:
         
         for word in words:
             test_line = current_line + word + " "
-            test_surface = font.render(test_line, True, (0, 0, 0))
             
-            if test_surface.get_width() <= max_width:
+            # Measure only; rendering each candidate line is far slower
+            if font.size(test_line)[0] <= max_width:
                 current_line = test_line
             else:
                 if current_line:
@@ -582,55 +952,61 @@ class GomokuUI:
     def run(self):
         """Main game loop"""
         while self.running:
+            self._frame_now = time.monotonic()
             self._handle_events()
             self._update()
             self._draw()
-            self.clock.tick(60)
+            # Nothing changed on a static screen: poll input at a lower rate
+            self.clock.tick(IDLE_FPS if self._idle_frame else ACTIVE_FPS)
         
+        # Let a pending save reach the disk before exiting
+        self._save_queue.join()
         pygame.quit()
         sys.exit()
     
     def _handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
+        for event in self._coalesce_events(pygame.event.get()):
             if event.type == pygame.QUIT:
                 self._cleanup_and_quit()
             
+            # Window contents may have been lost, present the whole frame
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._force_full_flip = True
+            
+            if event.type == CURSOR_BLINK_EVENT:
+                self._cursor_visible = not self._cursor_visible
+                continue
+            
+            if event.type == AI_DONE_EVENT:
+                self._collect_ai_move()
+                continue
+            
             # Handle ESC key for navigation
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self._handle_escape_key()
             
             # Handle different UI states
-            if self.ui_state == UIState.MAIN_MENU:
-                self._handle_main_menu_events(event)
-            elif self.ui_state == UIState.GAME_MODE_SELECT:
-                self._handle_game_mode_events(event)
-            elif self.ui_state == UIState.AI_DIFFICULTY_SELECT:
-                self._handle_ai_difficulty_events(event)
-            elif self.ui_state == UIState.AI_PLAYER_COUNT_SELECT:
-                self._handle_ai_player_count_events(event)
-            elif self.ui_state == UIState.GAMEPLAY:
-                self._handle_gameplay_events(event)
-            elif self.ui_state == UIState.PAUSE_MENU:
-                self._handle_pause_menu_events(event)
-            elif self.ui_state == UIState.GAME_OVER:
-                self._handle_game_over_events(event)
-            elif self.ui_state == UIState.SETTINGS:
-                self._handle_settings_events(event)
-            elif self.ui_state == UIState.PLAYER_NAME_INPUT:
-                self._handle_player_name_input_events(event)
-            elif self.ui_state == UIState.SERVER_SELECT:
-                self._handle_server_select_events(event)
-            elif self.ui_state == UIState.LOBBY_BROWSER:
-                self._handle_lobby_browser_events(event)
-            elif self.ui_state == UIState.ROOM_CREATE:
-                self._handle_room_create_events(event)
-            elif self.ui_state == UIState.ROOM_WAITING:
-                self._handle_room_waiting_events(event)
-            elif self.ui_state == UIState.ABOUT:
-                self._handle_about_events(event)
-            elif self.ui_state == UIState.OPPONENT_DISCONNECTED:
-                self._handle_opponent_disconnected_events(event)
+            entry = self._event_handlers.get(self.ui_state)
+            if entry and event.type in entry[0]:
+                entry[1](event)
+    
+    def _collect_ai_move(self):
+        """Take the finished AI move off the result queue for _update to play"""
+        while not self.ai_result_queue.empty():
+            self._ai_move = self.ai_result_queue.get_nowait()
+            self._ai_move_ready = True
+    
+    def _coalesce_events(self, events: list) -> list:
+        """Keep only the latest event of each compressible type, preserving order"""
+        latest = {}
+        for event in events:
+            if event.type in COMPRESSIBLE_EVENT_TYPES:
+                latest[event.type] = event
+        if not latest:
+            return events
+        return [event for event in events
+                if event.type not in COMPRESSIBLE_EVENT_TYPES or latest[event.type] is event]
     
     def _handle_main_menu_events(self, event):
         """Handle main menu events"""
@@ -639,7 +1015,7 @@ class GomokuUI:
         # Update continue button state
         buttons[1].enabled = self.saved_game_exists
         
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("main_menu", event):
             if button.handle_event(event):
                 if i == 0:  # New Game
                     self.ui_state = UIState.GAME_MODE_SELECT
@@ -654,9 +1030,7 @@ class GomokuUI:
     
     def _handle_game_mode_events(self, event):
         """Handle game mode selection events"""
-        buttons = self.buttons["game_mode"]
-        
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("game_mode", event):
             if button.handle_event(event):
                 if i == 0:  # Local PvP
                     self.game_mode = GameMode.LOCAL_PVP
@@ -673,10 +1047,9 @@ class GomokuUI:
     
     def _handle_ai_difficulty_events(self, event):
         """Handle AI difficulty selection events"""
-        buttons = self.buttons["ai_difficulty"]
         difficulties = ["easy", "medium", "hard", "expert"]
         
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("ai_difficulty", event):
             if button.handle_event(event):
                 if i < 4:  # Difficulty selection
                     self.ai_difficulty = difficulties[i]
@@ -689,9 +1062,7 @@ class GomokuUI:
     
     def _handle_ai_player_count_events(self, event):
         """Handle AI player count selection events"""
-        buttons = self.buttons["ai_player_count"]
-        
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("ai_player_count", event):
             if button.handle_event(event):
                 if i < 4:  # Player count selection (2, 3, 4, 5)
                     self.num_ai_players = i + 2  # 2, 3, 4, or 5 players
@@ -701,9 +1072,7 @@ class GomokuUI:
     
     def _handle_network_setup_events(self, event):
         """Handle network setup events"""
-        buttons = self.buttons["network_setup"]
-        
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("network_setup", event):
             if button.handle_event(event):
                 if i == 0:  # Start/Connect
                     self._setup_network_game()
@@ -727,32 +1096,28 @@ class GomokuUI:
             elif event.key == pygame.K_p:  # Toggle between showing all players and current player only
                 self.show_all_players = not self.show_all_players
         
-        buttons = self.buttons["gameplay"]
-
         # Handle button clicks (require actual click on the button)
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("gameplay", event):
             if button.handle_event(event):  # ← gate all actions on a real button click
                 if i == 0:  # Pause
-                    if (not self.paused
-                            and not self.pause_sent
-                            and self.pause_allowance[self.game.current_player] > 0):
+                    if not self.paused and self.pause_allowance[self.game.current_player] > 0:
                         self.paused = True
                         self.pause_initiator = self.my_player
-                        self.pause_sent = True
                         self.ui_state = UIState.PAUSE_MENU
-                        self.pause_start_time = time.time()
+                        self.pause_start_time = self._frame_now
                         self.pause_allowance[self.game.current_player] -= 1  # consume 1 token
+                        self._pause_info_dirty = True
 
                         # Freeze/Sync the move timer
                         if self.turn_start_time:
-                            elapsed_time = time.time() - self.turn_start_time
+                            elapsed_time = self._frame_now - self.turn_start_time
                             self.elapsed_before_pause += elapsed_time
                             self.turn_start_time = None
 
                         if self.is_network_game and self.network_manager:
                             # Share the remaining move time (not pause limit)
                             remaining_turn = max(0, self.move_time_limit - self.elapsed_before_pause)
-                            pause_timestamp = time.time()  # Record when pause was initiated
+                            pause_timestamp = self._server_now()  # Record when pause was initiated
                             self.network_manager.send_message("player_pause", {
                                 "player": self.player_names[self.game.current_player],
                                 "remaining_turn": remaining_turn,
@@ -762,10 +1127,6 @@ class GomokuUI:
                 elif i == 1:  # Resign
                     self._resign_game()
 
-        # Reset debounce when mouse is released (so next click can pause again)
-        if event.type == pygame.MOUSEBUTTONUP and event.button == 1:
-            self.pause_sent = False
-
         # Handle board clicks for making moves (only on left click down)
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._can_make_move():
@@ -775,9 +1136,7 @@ class GomokuUI:
 
     def _handle_pause_menu_events(self, event):
         """Handle pause menu events"""
-        buttons = self.buttons["pause_menu"]
-
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("pause_menu", event):
             if button.handle_event(event):
                 if i == 0:  # Resume
                     # Only initiator can resume (in network games)
@@ -788,16 +1147,15 @@ class GomokuUI:
                     # Clear pause state
                     self.paused = False
                     self.pause_start_time = None
-                    self.pause_sent = False  # allow future pauses again
 
                     # Resume move timer from where it left off
                     remaining_turn = max(0, self.move_time_limit - self.elapsed_before_pause)
-                    self.turn_start_time = time.time()
+                    self.turn_start_time = self._frame_now
 
                     # Calculate how long we were paused (for synchronization)
                     pause_duration_used = 0
                     if self.pause_start_time:
-                        pause_duration_used = time.time() - self.pause_start_time
+                        pause_duration_used = self._frame_now - self.pause_start_time
 
                     self.ui_state = UIState.GAMEPLAY
                     
@@ -809,7 +1167,8 @@ class GomokuUI:
                         self.network_manager.send_message("player_resume", {
                             "player": self.player_names[self.game.current_player],
                             "remaining_turn": remaining_turn,
-                            "pause_duration_used": pause_duration_used  # Send how long we paused
+                            "pause_duration_used": pause_duration_used,  # Send how long we paused
+                            "resume_timestamp": self._server_now()
                         })
                 elif i == 1:  # Save Game
                     # Only allow save in Local PvP mode
@@ -830,11 +1189,12 @@ class GomokuUI:
                 main_menu_button = buttons[-1]
                 main_menu_button.enabled = True
                 if main_menu_button.handle_event(event):
-                    print(f"🔍 DEBUG: Disconnect win Main Menu clicked")
-                    print(f"🔍 DEBUG: is_network_game = {self.is_network_game}")
-                    print(f"🔍 DEBUG: game_mode = {self.game_mode}")
-                    print(f"🔍 DEBUG: network_manager = {self.network_manager}")
-                    print(f"🔍 DEBUG: room_info = {getattr(self, 'room_info', None)}")
+                    if self.verbose_debug:
+                        print(f"🔍 DEBUG: Disconnect win Main Menu clicked\n"
+                              f"🔍 DEBUG: is_network_game = {self.is_network_game}\n"
+                              f"🔍 DEBUG: game_mode = {self.game_mode}\n"
+                              f"🔍 DEBUG: network_manager = {self.network_manager}\n"
+                              f"🔍 DEBUG: room_info = {self.room_info}")
                     
                     # Check if we're in a network game by mode OR by network_manager presence
                     if self.is_network_game or self.game_mode == GameMode.NETWORK_GAME:
@@ -856,7 +1216,7 @@ class GomokuUI:
             button.enabled = True
         
         # Handle button clicks
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("game_over", event):
             if button.handle_event(event):
                 if i == 0:  # New Game
                     if self.is_network_game:
@@ -881,9 +1241,7 @@ class GomokuUI:
     
     def _handle_settings_events(self, event):
         """Handle settings events"""
-        buttons = self.buttons["settings"]
-        
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("settings", event):
             if button.handle_event(event):
                 if i == 0:  # Sound toggle
                     # Toggle sound setting
@@ -916,22 +1274,36 @@ class GomokuUI:
                 elif i == 4:  # Back
                     self.ui_state = UIState.MAIN_MENU
     
+    def _edit_text_input(self, event, max_length: int) -> bool:
+        """Apply a KEYDOWN to the text input, return True when Enter submits it"""
+        # Keep the cursor visible while typing
+        self._cursor_visible = True
+        if event.key == pygame.K_BACKSPACE:
+            self.text_input_content = self.text_input_content[:-1]
+        elif event.key == pygame.K_RETURN:
+            # Ignore a bouncing or repeated Enter so a room is not created twice
+            now = pygame.time.get_ticks()
+            if now - self._last_submit_ms < KEY_DEGLITCH_MS:
+                return False
+            self._last_submit_ms = now
+            return True
+        elif len(self.text_input_content) < max_length:
+            char = event.unicode
+            # Plain ASCII needs no Unicode category lookup
+            if char and (" " <= char < "\x7f" or char.isprintable()):
+                self.text_input_content += char
+        return False
+    
     def _handle_player_name_input_events(self, event):
         """Handle player name input events"""
         # Handle text input
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE:
-                self.text_input_content = self.text_input_content[:-1]
-            elif event.key == pygame.K_RETURN:
-                if self.text_input_content.strip():
-                    self.player_name = self.text_input_content.strip()
-                    self._connect_to_lobby()
-            elif len(self.text_input_content) < 20 and event.unicode.isprintable():
-                self.text_input_content += event.unicode
+        if event.type == pygame.KEYDOWN and self._edit_text_input(event, 20):
+            if self.text_input_content.strip():
+                self.player_name = self.text_input_content.strip()
+                self._connect_to_lobby()
         
         # Handle buttons
-        buttons = self.buttons["player_name_input"]
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("player_name_input", event):
             if button.handle_event(event):
                 if i == 0:  # Continue
                     if self.text_input_content.strip():
@@ -945,17 +1317,13 @@ class GomokuUI:
         # Handle room list clicks
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check if clicked on a room in the list
-            start_y = 200
-            item_height = 60
-            for i, room in enumerate(self.current_room_list):
-                room_rect = pygame.Rect(150, start_y + i * (item_height + 10), 500, item_height)  # Match the drawing rect
+            for room, room_rect in zip(self.current_room_list, self._room_rects):
                 if room_rect.collidepoint(event.pos):
                     self.selected_room = room
                     break
         
         # Handle buttons
-        buttons = self.buttons["lobby_browser"]
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("lobby_browser", event):
             if button.handle_event(event):
                 if i == 0:  # Create Room
                     self.ui_state = UIState.ROOM_CREATE
@@ -971,18 +1339,12 @@ class GomokuUI:
     def _handle_room_create_events(self, event):
         """Handle room creation events"""
         # Handle text input for room name
-        if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE:
-                self.text_input_content = self.text_input_content[:-1]
-            elif event.key == pygame.K_RETURN:
-                if self.text_input_content.strip():
-                    self._create_room(self.text_input_content.strip())
-            elif len(self.text_input_content) < 30 and event.unicode.isprintable():
-                self.text_input_content += event.unicode
+        if event.type == pygame.KEYDOWN and self._edit_text_input(event, 30):
+            if self.text_input_content.strip():
+                self._create_room(self.text_input_content.strip())
         
         # Handle buttons
-        buttons = self.buttons["room_create"]
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("room_create", event):
             if button.handle_event(event):
                 if i == 0:  # Create
                     if self.text_input_content.strip():
@@ -992,23 +1354,18 @@ class GomokuUI:
     
     def _handle_room_waiting_events(self, event):
         """Handle room waiting events"""
-        buttons = self.buttons["room_waiting"]
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("room_waiting", event):
             if button.handle_event(event):
                 if i == 0:  # Leave Room
                     self._leave_room()
     
     def _handle_opponent_disconnected_events(self, event):
         """Handle opponent disconnected screen events"""
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEMOTION:
+            self._leave_game_hover = self._leave_game_rect.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             # Check if "Leave Game" button was clicked
-            button_width = 200
-            button_height = 50
-            button_x = (self.WINDOW_WIDTH - button_width) // 2
-            button_y = 520
-            button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-            
-            if button_rect.collidepoint(event.pos):
+            if self._leave_game_rect.collidepoint(event.pos):
                 # Leave the game and return to main menu
                 self._leave_room()
                 self.opponent_disconnect_time = None
@@ -1016,37 +1373,34 @@ class GomokuUI:
     
     def _handle_escape_key(self):
         """Handle ESC key press for navigation"""
-        if self.ui_state == UIState.GAME_MODE_SELECT:
-            self.ui_state = UIState.MAIN_MENU
-        elif self.ui_state == UIState.AI_DIFFICULTY_SELECT:
-            if self.num_ai_players > 2:
-                self.ui_state = UIState.AI_PLAYER_COUNT_SELECT
-            else:
-                self.ui_state = UIState.GAME_MODE_SELECT
-        elif self.ui_state == UIState.AI_PLAYER_COUNT_SELECT:
-            self.ui_state = UIState.GAME_MODE_SELECT
-        elif self.ui_state == UIState.PLAYER_NAME_INPUT:
-            self.ui_state = UIState.SERVER_SELECT
-        elif self.ui_state == UIState.SERVER_SELECT:
+        # One physical press must not skip through two screens
+        now = pygame.time.get_ticks()
+        if now - self._last_escape_ms < KEY_DEGLITCH_MS:
+            return
+        self._last_escape_ms = now
+        
+        target = self._escape_targets.get(self.ui_state)
+        if isinstance(target, UIState):
+            self.ui_state = target
+        elif target:
+            target()
+    
+    def _escape_ai_difficulty_select(self):
+        """Return from difficulty selection to the screen that led there"""
+        if self.num_ai_players > 2:
+            self.ui_state = UIState.AI_PLAYER_COUNT_SELECT
+        else:
             self.ui_state = UIState.GAME_MODE_SELECT
-        elif self.ui_state == UIState.LOBBY_BROWSER:
-            self._disconnect_from_lobby()
-        elif self.ui_state == UIState.ROOM_CREATE:
-            self.ui_state = UIState.LOBBY_BROWSER
-        elif self.ui_state == UIState.ROOM_WAITING:
-            self._leave_room()
-        elif self.ui_state == UIState.GAMEPLAY and not self.is_network_game:
+    
+    def _escape_gameplay(self):
+        """Open the pause menu (local games only)"""
+        if not self.is_network_game:
             self.ui_state = UIState.PAUSE_MENU
-        elif self.ui_state == UIState.PAUSE_MENU:
-            self.ui_state = UIState.GAMEPLAY
-        elif self.ui_state == UIState.SETTINGS:
-            self.ui_state = UIState.MAIN_MENU
-        elif self.ui_state == UIState.ABOUT:
-            self.ui_state = UIState.MAIN_MENU
-        elif self.ui_state == UIState.OPPONENT_DISCONNECTED:
-            # Allow leaving game when opponent is disconnected
-            self._leave_room()
-            self.ui_state = UIState.MAIN_MENU
+    
+    def _escape_opponent_disconnected(self):
+        """Allow leaving game when opponent is disconnected"""
+        self._leave_room()
+        self.ui_state = UIState.MAIN_MENU
     
     def _cleanup_and_quit(self):
         """Properly cleanup network connections before quitting"""
@@ -1056,7 +1410,7 @@ class GomokuUI:
         if self.network_manager:
             try:
                 # Leave room if in one
-                if self.ui_state == UIState.ROOM_WAITING and hasattr(self, 'room_info') and self.room_info:
+                if self.ui_state == UIState.ROOM_WAITING and self.room_info:
                     self.network_manager.leave_room()
                 
                 # Disconnect from server
@@ -1068,34 +1422,36 @@ class GomokuUI:
         
         self.running = False
     
+    def _server_now(self) -> float:
+        """Current server wall-clock time, corrected for the measured clock skew"""
+        if self.network_manager:
+            return self.network_manager.server_time()
+        return time.time()
+    
+    def _server_time_to_local(self, timestamp: float) -> float:
+        """Map a wall-clock timestamp from the server onto the monotonic clock"""
+        return time.monotonic() - (self._server_now() - timestamp)
+
     def _update(self):
         """Update game state"""
-        # Handle network messages if connected
-        if self.network_manager and self.network_manager.connected:
-            # Give network time to process messages
-            try:
-                # This allows the network threads to process messages
-                import time
-                time.sleep(0.001)  # Small delay to prevent blocking
-            except:
-                pass
-        import time
+        # Run handlers for network messages received since the last frame,
+        # then send whatever non-urgent requests queued up
+        if self.network_manager:
+            self.network_manager.drain_nowait()
+            self.network_manager.flush_batch()
+        now = self._frame_now
 
         # Enforce per-move 20s limit
         if self.ui_state == UIState.GAMEPLAY and self.game.game_state == GameState.PLAYING:
             if self.turn_start_time is None:
-                self.turn_start_time = time.time()
+                self.turn_start_time = now
                 
             # Skip countdown while paused
             if self.paused:
                 return
 
-            if self.turn_start_time:
-                elapsed = self.elapsed_before_pause + (time.time() - self.turn_start_time)
-            else:
-                elapsed = self.elapsed_before_pause  # frozen time during pause
-
-            if elapsed > self.move_time_limit:
+            time_left, _ = self._move_clock()
+            if time_left < 0:
                 print(f"⏰ Player {self.game.current_player.name} exceeded 30 s — auto-resign.")
                 # For network games, make sure we're resigning the correct player
                 if self.is_network_game:
@@ -1118,52 +1474,35 @@ class GomokuUI:
                 self.game.current_player != Player.BLACK and 
                 self.game.game_state == GameState.PLAYING):
                 
-                # Get the AI player for current player
-                current_ai = self.ai_players.get(self.game.current_player)
-                if not current_ai and self.ai_player and self.game.current_player == Player.WHITE:
-                    current_ai = self.ai_player  # Fallback for backward compatibility
-                
-                if current_ai:
-                    # Start AI thinking if not already started
-                    if not self.ai_thinking and (self.ai_thread is None or not self.ai_thread.is_alive()):
-                        self._start_ai_thinking(current_ai)
-                    
-                    # Check if AI has finished thinking
-                    elif self.ai_thinking and self.ai_move_result is not None:
-                        move = self.ai_move_result
-                        self.ai_move_result = None
+                if self.ai_thinking:
+                    # Play the move once _handle_events has collected it from AI_DONE_EVENT
+                    if self._ai_move_ready:
+                        move = self._ai_move
+                        self._ai_move_ready = False
+                        self._ai_move = None
+                        current_ai = self._active_ai
                         self.ai_thinking = False
+                        self._active_ai = None
                         
                         # Store AI debug statistics
                         if current_ai:
                             self.ai_debug_stats = current_ai.get_statistics()
-                            # Print debug info to console
-                            if self.ai_debug_stats:
-                                print("\n" + "="*60)
-                                print(f"🔍 AI DEBUG STATISTICS ({self.game.current_player.name})")
-                                print("="*60)
-                                print(f"Nodes Evaluated: {self.ai_debug_stats['nodes_evaluated']}")
-                                print(f"Pruning Count: {self.ai_debug_stats['pruning_count']}")
-                                print(f"Pruning Efficiency: {self.ai_debug_stats['pruning_efficiency']:.2f}%")
-                                print(f"Max Depth Reached: {self.ai_debug_stats['max_depth_reached']}")
-                                print(f"Search Time: {self.ai_debug_stats['search_time']:.3f}s")
-                                print(f"Nodes/Second: {self.ai_debug_stats['nodes_per_second']:.0f}")
-                                if self.ai_debug_stats['nodes_by_depth']:
-                                    print("\nNodes by Depth:")
-                                    for depth, count in sorted(self.ai_debug_stats['nodes_by_depth'].items()):
-                                        print(f"  Depth {depth}: {count} nodes")
-                                if self.ai_debug_stats['move_evaluations']:
-                                    print("\nTop Move Evaluations:")
-                                    sorted_moves = sorted(self.ai_debug_stats['move_evaluations'], 
-                                                        key=lambda x: x['score'], reverse=True)
-                                    for i, eval_info in enumerate(sorted_moves[:5]):  # Show top 5
-                                        move_info = eval_info['move']
-                                        print(f"  {i+1}. Move ({move_info[0]}, {move_info[1]}): Score={eval_info['score']:.1f}, "
-                                              f"Alpha={eval_info['alpha']:.1f}, Beta={eval_info['beta']:.1f}")
-                                print("="*60 + "\n")
+                            # Print debug info to console while the debug view is on
+                            if self.ai_debug_stats and self.ai_debug_enabled:
+                                self._print_ai_debug_stats(self.ai_debug_stats)
                         
                         if move:
                             self._make_move(move[0], move[1])
+                
+                # Start AI thinking if not already started
+                elif self.ai_thread is None or not self.ai_thread.is_alive():
+                    # Get the AI player for current player
+                    current_ai = self.ai_players.get(self.game.current_player)
+                    if not current_ai and self.ai_player and self.game.current_player == Player.WHITE:
+                        current_ai = self.ai_player  # Fallback for backward compatibility
+                    
+                    if current_ai:
+                        self._start_ai_thinking(current_ai)
             
             # Check for game over
             if self.game.game_state != GameState.PLAYING:
@@ -1174,69 +1513,96 @@ class GomokuUI:
                         self._play_sound("winner")
         # While paused, auto-resume after per-pause limit (no cumulative depletion)
         if self.paused and self.pause_start_time:
-            elapsed_pause = time.time() - self.pause_start_time
+            elapsed_pause = now - self.pause_start_time
             if elapsed_pause >= self.per_pause_limit:
                 print("Pause expired automatically")
                 self.paused = False
                 self.pause_start_time = None
-                self.pause_sent = False
                 self.ui_state = UIState.GAMEPLAY
 
                 # Resume move timer from where it left off
-                self.turn_start_time = time.time()
+                self.turn_start_time = now
+    
+    def _move_clock(self) -> Tuple[float, int]:
+        """Time left and whole seconds left on the move timer at this frame"""
+        timer = (self.turn_start_time, self.elapsed_before_pause, self.move_time_limit)
+        if timer != self._turn_timer_key:
+            if self.turn_start_time:
+                self._turn_deadline = self.turn_start_time + self.move_time_limit - self.elapsed_before_pause
+            else:
+                self._turn_deadline = None  # frozen time during pause
+            self._turn_timer_key = timer
+        
+        if self._turn_deadline is None:
+            time_left = self.move_time_limit - self.elapsed_before_pause
+        else:
+            time_left = self._turn_deadline - self._frame_now
+        return time_left, max(0, int(time_left))
+    
+    def _print_ai_debug_stats(self, stats: Dict[str, Any]):
+        """Print the last AI search statistics to the console in one write"""
+        lines = [
+            "\n" + "=" * 60,
+            f"🔍 AI DEBUG STATISTICS ({self.game.current_player.name})",
+            "=" * 60,
+            f"Nodes Evaluated: {stats['nodes_evaluated']}",
+            f"Pruning Count: {stats['pruning_count']}",
+            f"Pruning Efficiency: {stats['pruning_efficiency']:.2f}%",
+            f"Max Depth Reached: {stats['max_depth_reached']}",
+            f"Search Time: {stats['search_time']:.3f}s",
+            f"Nodes/Second: {stats['nodes_per_second']:.0f}",
+        ]
+        if stats['nodes_by_depth']:
+            lines.append("\nNodes by Depth:")
+            for depth, count in sorted(stats['nodes_by_depth'].items()):
+                lines.append(f"  Depth {depth}: {count} nodes")
+        if stats['move_evaluations']:
+            lines.append("\nTop Move Evaluations:")
+            # Only the top 5 are shown, no need to sort every evaluation
+            top_moves = heapq.nlargest(5, stats['move_evaluations'], key=itemgetter('score'))
+            for i, eval_info in enumerate(top_moves):
+                move_info = eval_info['move']
+                lines.append(f"  {i+1}. Move ({move_info[0]}, {move_info[1]}): Score={eval_info['score']:.1f}, "
+                             f"Alpha={eval_info['alpha']:.1f}, Beta={eval_info['beta']:.1f}")
+        lines.append("=" * 60 + "\n")
+        print("\n".join(lines))
     
     def _draw(self):
         """Draw the current UI state with modern effects"""
+        # A static menu whose buttons are all settled looks exactly like the
+        # frame already on screen, so there is nothing to draw or present
+        button_key = STATIC_MENU_STATES.get(self.ui_state)
+        text_input = None
+        if self.ui_state in TEXT_INPUT_STATES:
+            button_key = TEXT_INPUT_STATES[self.ui_state]
+            text_input = (self.text_input_content, self._cursor_visible)
+        if (button_key and not self._force_full_flip and
+                self.ui_state == self._last_presented_state and
+                text_input == self._drawn_text_input and
+                not any(button.needs_redraw() for button in self.buttons[button_key])):
+            self._idle_frame = True
+            return
+        self._idle_frame = False
+        
+        self._dirty_rects = None
+        
         # Determine which background to use
-        if self.ui_state == UIState.GAMEPLAY or self.ui_state == UIState.PAUSE_MENU or self.ui_state == UIState.GAME_OVER:
+        if self.ui_state in GAME_BACKGROUND_STATES:
             # Use game background during gameplay
             self._draw_gradient_background(use_image="game")
         else:
             # Use start background for menus
             self._draw_gradient_background(use_image="start")
         
-        if self.ui_state == UIState.MAIN_MENU:
-            self._draw_main_menu()
-        elif self.ui_state == UIState.GAME_MODE_SELECT:
-            self._draw_game_mode_select()
-        elif self.ui_state == UIState.AI_DIFFICULTY_SELECT:
-            self._draw_ai_difficulty_select()
-        elif self.ui_state == UIState.AI_PLAYER_COUNT_SELECT:
-            self._draw_ai_player_count_select()
-        elif self.ui_state == UIState.GAMEPLAY:
-            self._draw_gameplay()
-        elif self.ui_state == UIState.PAUSE_MENU:
-            self._draw_pause_menu()
-        elif self.ui_state == UIState.GAME_OVER:
-            self._draw_game_over()
-        elif self.ui_state == UIState.SETTINGS:
-            self._draw_settings()
-        elif self.ui_state == UIState.ABOUT:
-            self._draw_about()
-        elif self.ui_state == UIState.PLAYER_NAME_INPUT:
-            self._draw_player_name_input()
-        elif self.ui_state == UIState.SERVER_SELECT:
-            self._draw_server_select()
-        elif self.ui_state == UIState.LOBBY_BROWSER:
-            self._draw_lobby_browser()
-        elif self.ui_state == UIState.ROOM_CREATE:
-            self._draw_room_create()
-        elif self.ui_state == UIState.ROOM_WAITING:
-            self._draw_room_waiting()
-        elif self.ui_state == UIState.CONNECTION_LOST:
-            self._draw_connection_lost()
-        elif self.ui_state == UIState.OPPONENT_DISCONNECTED:
-            self._draw_opponent_disconnected()
+        draw_handler = self._draw_handlers.get(self.ui_state)
+        if draw_handler:
+            draw_handler()
             
         if self.ui_state in [UIState.GAMEPLAY, UIState.PAUSE_MENU] and (
             self.turn_start_time or self.elapsed_before_pause
         ):
-            # Calculate frozen or live remaining time
-            if self.turn_start_time:
-                elapsed = self.elapsed_before_pause + (time.time() - self.turn_start_time)
-            else:
-                elapsed = self.elapsed_before_pause
-            remaining = max(0, int(self.move_time_limit - elapsed))
+            # Frozen or live remaining time
+            _, remaining = self._move_clock()
 
             # Color logic
             if remaining > 10:
@@ -1247,89 +1613,104 @@ class GomokuUI:
                 color = Colors.ERROR
 
             # === 1️⃣ Main move timer ===
-            timer_rect = pygame.Rect(self.WINDOW_WIDTH - 180, 20, 130, 50)  # Increased height
+            timer_rect = self._timer_rect
             # Background panel for better visibility
-            timer_bg = pygame.Surface((timer_rect.width, timer_rect.height))
-            timer_bg.set_alpha(240)
-            timer_bg.fill((20, 20, 30))  # Dark background
-            self.screen.blit(timer_bg, timer_rect)
+            self.screen.blit(self._timer_bg_surface, timer_rect)
             pygame.draw.rect(self.screen, color, timer_rect, 3)  # Thicker border
             # Text with shadow
-            timer_shadow = self.font_medium.render(f"{remaining:02d}s", True, (0, 0, 0))
-            timer_shadow_rect = timer_shadow.get_rect(center=(timer_rect.centerx + 1, timer_rect.centery + 1))
-            self.screen.blit(timer_shadow, timer_shadow_rect)
-            timer_text = self.font_medium.render(f"{remaining:02d}s", True, color)
+            self._blit_centered(self.font_medium, f"{remaining:02d}s", (0, 0, 0), (timer_rect.centerx + 1, timer_rect.centery + 1))
+            timer_text = self._render_cached(self.font_medium, f"{remaining:02d}s", color)
             self.screen.blit(timer_text, timer_text.get_rect(center=timer_rect.center))
 
             # Draw list icon button
-            button_color = (100, 100, 100, 180) if not self.show_pause_info else (70, 130, 180, 220)
-            button_surface = pygame.Surface((self.pause_icon_rect.width, self.pause_icon_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(button_surface, button_color, (0, 0, self.pause_icon_rect.width, self.pause_icon_rect.height), 0, 5)
-            
-            # Draw list icon (three horizontal lines)
-            line_height = 2
-            line_gap = 4
-            line_width = 16
-            
-            # Draw three horizontal lines
-            for i in range(3):
-                y_pos = self.pause_icon_rect.height // 2 - line_gap + (i * (line_height + line_gap)) - 2
-                pygame.draw.rect(button_surface, (255, 255, 255), 
-                               ((self.pause_icon_rect.width - line_width) // 2, y_pos, 
-                                line_width, line_height), 0, 2)
-            
-            self.screen.blit(button_surface, self.pause_icon_rect)
+            if self.show_pause_info:
+                self.screen.blit(self._pause_icon_surface_on, self.pause_icon_rect)
+            else:
+                self.screen.blit(self._pause_icon_surface_off, self.pause_icon_rect)
             
             # === Pause info boxes (moved to the right to avoid icon) ===
             if True:  # Always show at least the current player
-                y = 10
-                box_width = 220  # Increased width
-                box_height = 42  # Increased height
-                x_offset = 45  # Move right to avoid overlapping with list icon
-                
-                # Get players to show (current player only or all players)
-                if hasattr(self.game, 'players') and self.game.players:
-                    players_to_show = self.game.players if self.show_all_players else [self.game.current_player]
-                else:
-                    # Fallback for 2-player games
-                    players_to_show = [Player.BLACK, Player.WHITE] if self.show_all_players else [self.game.current_player]
-                
-                for player in players_to_show:
-                    # Skip if player doesn't have pause allowance (shouldn't happen, but safety check)
-                    if player not in self.pause_allowance:
-                        continue
-                        
-                    label = self.player_names.get(player, f"Player {player.name}")
-                    pauses_left = self.pause_allowance[player]
-                    pause_time = self.per_pause_limit  # constant per pause, not a running pool
-
-                    pause_rect = pygame.Rect(20 + x_offset, y, box_width, box_height)
-                    
+                for pause_rect, pause_text, is_current in self._get_pause_info_rows():
                     # Background panel for better visibility
-                    pause_bg = pygame.Surface((pause_rect.width, pause_rect.height))
-                    pause_bg.set_alpha(240)
-                    pause_bg.fill((20, 20, 30))  # Dark background
-                    self.screen.blit(pause_bg, pause_rect)
+                    self.screen.blit(self._pause_bg_surface, pause_rect)
                     
                     # Highlight current player's box with colored border
-                    if self.game.current_player == player:
+                    if is_current:
                         pygame.draw.rect(self.screen, Colors.SUCCESS, pause_rect, 3)  # Green border for current player
                     else:
                         pygame.draw.rect(self.screen, Colors.WHITE, pause_rect, 2)  # White border for others
 
-                    pause_text = f"{label}: {pauses_left}× {pause_time}s"
                     # Text with shadow
-                    text_shadow = self.font_info.render(pause_text, True, (0, 0, 0))
-                    text_shadow_rect = text_shadow.get_rect(center=(pause_rect.centerx + 1, pause_rect.centery + 1))
-                    self.screen.blit(text_shadow, text_shadow_rect)
+                    self._blit_centered(self.font_info, pause_text, (0, 0, 0), (pause_rect.centerx + 1, pause_rect.centery + 1))
                     
                     # Highlight current player's text
-                    text_color = Colors.SUCCESS if self.game.current_player == player else Colors.WHITE
-                    text_surface = self.font_info.render(pause_text, True, text_color)
+                    text_color = Colors.SUCCESS if is_current else Colors.WHITE
+                    text_surface = self._render_cached(self.font_info, pause_text, text_color)
                     self.screen.blit(text_surface, text_surface.get_rect(center=pause_rect.center))
-                    
-                    y += box_height + 8
-        pygame.display.flip()
+        
+        # Static menus only need the buttons whose hover state changed
+        if button_key and text_input == self._drawn_text_input:
+            self._dirty_rects = [button.draw_rect for button in self.buttons[button_key] if button.dirty]
+        self._drawn_text_input = text_input
+        
+        self._present_frame()
+    
+    def _get_pause_info_rows(self) -> List[Tuple[pygame.Rect, str, bool]]:
+        """Pause info boxes as (rect, text, is_current), rebuilt only when they change"""
+        key = (self.game, self.game.current_player, self.show_all_players)
+        if not self._pause_info_dirty and key == self._pause_info_key:
+            return self._pause_info_rows
+        
+        y = 10
+        box_width = 220  # Increased width
+        box_height = 42  # Increased height
+        x_offset = 45  # Move right to avoid overlapping with list icon
+        
+        # Get players to show (current player only or all players)
+        if self.game.players:
+            players_to_show = self.game.players if self.show_all_players else [self.game.current_player]
+        else:
+            # Fallback for 2-player games
+            players_to_show = [Player.BLACK, Player.WHITE] if self.show_all_players else [self.game.current_player]
+        
+        rows = []
+        for player in players_to_show:
+            # Skip if player doesn't have pause allowance (shouldn't happen, but safety check)
+            if player not in self.pause_allowance:
+                continue
+            
+            label = self.player_names.get(player, f"Player {player.name}")
+            pauses_left = self.pause_allowance[player]
+            pause_time = self.per_pause_limit  # constant per pause, not a running pool
+            
+            pause_rect = pygame.Rect(20 + x_offset, y, box_width, box_height)
+            rows.append((pause_rect, f"{label}: {pauses_left}× {pause_time}s",
+                         self.game.current_player == player))
+            y += box_height + 8
+        
+        self._pause_info_rows = rows
+        self._pause_info_key = key
+        self._pause_info_dirty = False
+        return rows
+    
+    def _present_frame(self):
+        """Push the frame to the display, updating only dirty rects when cheap"""
+        rects = self._dirty_rects
+        full_flip = (self._force_full_flip or rects is None or
+                     self.ui_state != self._last_presented_state)
+        if not full_flip:
+            # update(rects) only pays off for a few small regions
+            dirty_area = sum(rect.width * rect.height for rect in rects)
+            full_flip = (len(rects) > 3 or
+                         dirty_area > (self.WINDOW_WIDTH * self.WINDOW_HEIGHT) // 4)
+        
+        if full_flip:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+        
+        self._last_presented_state = self.ui_state
+        self._force_full_flip = False
     
     def _draw_main_menu(self):
         """Draw main menu with modern effects"""
@@ -1337,48 +1718,30 @@ class GomokuUI:
         title_text = "GOMOKU"
         
         # Multiple shadow layers for 3D effect
-        for offset in [(3, 3), (2, 2), (1, 1)]:
-            title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-            title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + offset[0], 100 + offset[1]))
-            shadow_surf = pygame.Surface(title_shadow.get_size())
-            shadow_surf.set_alpha(40 // offset[0])
-            shadow_surf.fill((0, 0, 0))
-            self.screen.blit(title_shadow, title_shadow_rect)
+        title_shadow = self._render_cached(self.font_large, title_text, (0, 0, 0))
+        blit_seq = [
+            (title_shadow, title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + dx, 100 + dy)))
+            for dx, dy in ((3, 3), (2, 2), (1, 1))
+        ]
         
         # Main title with gradient-like effect (brighter)
-        title = self.font_large.render(title_text, True, Colors.WHITE)
+        title = self._render_cached(self.font_large, title_text, Colors.WHITE)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        blit_seq.append((title, title_rect))
         
         # Glow effect around title
-        glow_surf = pygame.Surface((title_rect.width + 20, title_rect.height + 20))
-        glow_surf.set_alpha(30)
-        glow_surf.fill(Colors.ACCENT)
-        glow_rect = glow_surf.get_rect(center=title_rect.center)
-        self.screen.blit(glow_surf, glow_rect)
+        blit_seq.append((self._title_glow_surface, self._title_glow_surface.get_rect(center=title_rect.center)))
         
         # Subtitle with modern styling and shadow
-        subtitle_shadow = self.font_medium.render("Five in a Row", True, (0, 0, 0))
-        subtitle_shadow_rect = subtitle_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 141))
-        self.screen.blit(subtitle_shadow, subtitle_shadow_rect)
-        
-        subtitle = self.font_medium.render("Five in a Row", True, Colors.WHITE)
-        subtitle_rect = subtitle.get_rect(center=(self.WINDOW_WIDTH // 2, 140))
-        self.screen.blit(subtitle, subtitle_rect)
+        subtitle_shadow = self._render_cached(self.font_medium, "Five in a Row", (0, 0, 0))
+        blit_seq.append((subtitle_shadow, subtitle_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 141))))
+        subtitle = self._render_cached(self.font_medium, "Five in a Row", Colors.WHITE)
+        blit_seq.append((subtitle, subtitle.get_rect(center=(self.WINDOW_WIDTH // 2, 140))))
+        self.screen.blits(blit_seq, False)
         
-        # Enhanced decorative line with glow
+        # Enhanced decorative line with glow (pre-composited strip)
         line_y = 155
-        # Glow line
-        for i in range(3):
-            alpha = 20 - i * 5
-            glow_line = pygame.Surface((200, 3))
-            glow_line.set_alpha(alpha)
-            glow_line.fill(Colors.ACCENT)
-            self.screen.blit(glow_line, (self.WINDOW_WIDTH // 2 - 100, line_y - 1 + i))
-        # Main line
-        pygame.draw.line(self.screen, Colors.ACCENT, 
-                        (self.WINDOW_WIDTH // 2 - 100, line_y),
-                        (self.WINDOW_WIDTH // 2 + 100, line_y), 3)
+        self.screen.blit(self._title_glow_strip, (self.WINDOW_WIDTH // 2 - 100, line_y - 1))
         
         # Buttons with modern effects
         for button in self.buttons["main_menu"]:
@@ -1388,13 +1751,9 @@ class GomokuUI:
         """Draw game mode selection with enhanced visibility"""
         # Title with shadow and better contrast
         title_text = "Select Game Mode"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 102))
-        self.screen.blit(title_shadow, title_shadow_rect)
+        self._blit_centered(self.font_large, title_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 2, 102))
         
-        title = self.font_large.render(title_text, True, Colors.WHITE)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, title_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 100))
         
         for button in self.buttons["game_mode"]:
             button.draw(self.screen)
@@ -1403,13 +1762,9 @@ class GomokuUI:
         """Draw AI difficulty selection with enhanced visibility"""
         # Title with shadow and better contrast
         title_text = "Select AI Difficulty"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 102))
-        self.screen.blit(title_shadow, title_shadow_rect)
+        self._blit_centered(self.font_large, title_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 2, 102))
         
-        title = self.font_large.render(title_text, True, Colors.WHITE)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, title_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 100))
         
         for button in self.buttons["ai_difficulty"]:
             button.draw(self.screen)
@@ -1418,23 +1773,15 @@ class GomokuUI:
         """Draw AI player count selection screen"""
         # Title with shadow and better contrast
         title_text = "Select Number of Players"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 102))
-        self.screen.blit(title_shadow, title_shadow_rect)
+        self._blit_centered(self.font_large, title_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 2, 102))
         
-        title = self.font_large.render(title_text, True, Colors.WHITE)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, title_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 100))
         
         # Subtitle
         subtitle_text = "You will be Player 1 (Black). Others will be AI opponents."
-        subtitle_shadow = self.font_small.render(subtitle_text, True, (0, 0, 0))
-        subtitle_shadow_rect = subtitle_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 151))
-        self.screen.blit(subtitle_shadow, subtitle_shadow_rect)
+        self._blit_centered(self.font_small, subtitle_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 1, 151))
         
-        subtitle = self.font_small.render(subtitle_text, True, Colors.WHITE)
-        subtitle_rect = subtitle.get_rect(center=(self.WINDOW_WIDTH // 2, 150))
-        self.screen.blit(subtitle, subtitle_rect)
+        self._blit_centered(self.font_small, subtitle_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 150))
         
         for button in self.buttons["ai_player_count"]:
             button.draw(self.screen)
@@ -1464,24 +1811,24 @@ class GomokuUI:
     def _draw_pause_menu(self):
         """Draw pause menu overlay"""
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._dim_overlay, (0, 0))
         
         # Draw pause menu
-        title = self.font_large.render("PAUSED", True, Colors.WHITE)
+        title = self._render_cached(self.font_large, "PAUSED", Colors.WHITE)
         # === Show live pause countdown while paused ===
         if self.paused and self.pause_start_time:
-            elapsed_pause = time.time() - self.pause_start_time
+            elapsed_pause = self._frame_now - self.pause_start_time
             remaining_pause = max(0, int(self.per_pause_limit - elapsed_pause))
 
-            pause_rect = pygame.Rect(self.WINDOW_WIDTH // 2 - 80, 180, 160, 50)
-            pygame.draw.rect(self.screen, Colors.BACKGROUND, pause_rect)
-            pygame.draw.rect(self.screen, Colors.WARNING, pause_rect, 2)
+            pause_rect = self._pause_countdown_rect
+            self.screen.blit(self._pause_countdown_box, pause_rect)
 
-            pause_text = self.font_medium.render(f"Pause: {remaining_pause:02d}s", True, Colors.WARNING)
-            self.screen.blit(pause_text, pause_text.get_rect(center=pause_rect.center))
+            # The label only changes once a second
+            if remaining_pause != self._last_pause_remaining:
+                self._last_pause_remaining = remaining_pause
+                pause_text = self._render_cached(self.font_medium, f"Pause: {remaining_pause:02d}s", Colors.WARNING)
+                self._pause_text_blit = (pause_text, pause_text.get_rect(center=pause_rect.center))
+            self.screen.blit(*self._pause_text_blit)
 
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 150))
         self.screen.blit(title, title_rect)
@@ -1507,42 +1854,14 @@ class GomokuUI:
         self._draw_board()
         
         # Draw overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        # Draw game over message with player names
-        if self.game.winner:
-            winner_name = self.player_names.get(self.game.winner, self.game.winner.name)
-            message = f"{winner_name} WINS!"
-            color = Colors.WHITE
-        elif self.game.game_state == GameState.BLACK_WINS:
-            winner_name = self.player_names.get(Player.BLACK, "Black")
-            message = f"{winner_name} WINS!"
-            color = Colors.WHITE
-        elif self.game.game_state == GameState.WHITE_WINS:
-            winner_name = self.player_names.get(Player.WHITE, "White")
-            message = f"{winner_name} WINS!"
-            color = Colors.WHITE
-        else:
-            message = "Draw!"
-            color = Colors.YELLOW
-        
-        title = self.font_large.render(message, True, color)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(title, title_rect)
+        self.screen.blit(self._dim_overlay, (0, 0))
         
-        # Show disconnect message if applicable
-        if self.is_disconnect_win and self.disconnect_reason:
-            disconnect_msg = self.font_medium.render(self.disconnect_reason, True, Colors.YELLOW)
-            disconnect_rect = disconnect_msg.get_rect(center=(self.WINDOW_WIDTH // 2, 250))
-            self.screen.blit(disconnect_msg, disconnect_rect)
-            
-            # Additional note
-            note = self.font_small.render("Opponent has left the game", True, Colors.LIGHT_GRAY)
-            note_rect = note.get_rect(center=(self.WINDOW_WIDTH // 2, 290))
-            self.screen.blit(note, note_rect)
+        # Result text changes at most once per game
+        key = (self.game.winner, self.game.game_state, self.is_disconnect_win, self.disconnect_reason)
+        if key != self._game_over_key:
+            self._game_over_key = key
+            self._game_over_blits = self._layout_game_over_text()
+        self.screen.blits(self._game_over_blits, False)
         
         # Draw buttons ONLY if not a disconnect win (graceful termination)
         # When opponent disconnects, don't show rematch/new game buttons
@@ -1562,48 +1881,53 @@ class GomokuUI:
         """Draw settings menu with enhanced visibility"""
         # Title with shadow and better contrast
         title_text = "Settings"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 102))
-        self.screen.blit(title_shadow, title_shadow_rect)
+        self._blit_centered(self.font_large, title_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 2, 102))
         
-        title = self.font_large.render(title_text, True, Colors.WHITE)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, title_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 100))
         
         # Instructions with shadow
         instruction_text = "Click buttons to toggle settings"
-        instruction_shadow = self.font_small.render(instruction_text, True, (0, 0, 0))
-        instruction_shadow_rect = instruction_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 151))
-        self.screen.blit(instruction_shadow, instruction_shadow_rect)
+        self._blit_centered(self.font_small, instruction_text, (0, 0, 0), (self.WINDOW_WIDTH // 2 + 1, 151))
         
-        instruction = self.font_small.render(instruction_text, True, Colors.WHITE)
-        instruction_rect = instruction.get_rect(center=(self.WINDOW_WIDTH // 2, 150))
-        self.screen.blit(instruction, instruction_rect)
+        self._blit_centered(self.font_small, instruction_text, Colors.WHITE, (self.WINDOW_WIDTH // 2, 150))
         
         for button in self.buttons["settings"]:
             button.draw(self.screen)
     
     def _draw_about(self):
         """Draw about page with team members and game info"""
+        # None of the page text ever changes, so it is composed once over the
+        # static menu background that _draw has just put on screen
+        if self._about_surface is None:
+            self._about_surface = self.screen.copy()
+            self._render_about_content(self._about_surface)
+        self.screen.blit(self._about_surface, (0, 0))
+        
+        # Buttons
+        for button in self.buttons["about"]:
+            button.draw(self.screen)
+    
+    def _render_about_content(self, target: pygame.Surface):
+        """Render the static about page text onto target"""
         # Title with shadow
         title_text = "About Gomoku"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
+        title_shadow = self._render_cached(self.font_large, title_text, (0, 0, 0))
         title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 52))
-        self.screen.blit(title_shadow, title_shadow_rect)
+        target.blit(title_shadow, title_shadow_rect)
         
-        title = self.font_large.render(title_text, True, Colors.WHITE)
+        title = self._render_cached(self.font_large, title_text, Colors.WHITE)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 50))
-        self.screen.blit(title, title_rect)
+        target.blit(title, title_rect)
         
         y_offset = 100
         
         # Team Members Section
-        team_title = self.font_medium.render("Team Members - Group 6", True, Colors.ACCENT)
-        team_title_shadow = self.font_medium.render("Team Members - Group 6", True, (0, 0, 0))
+        team_title = self._render_cached(self.font_medium, "Team Members - Group 6", Colors.ACCENT)
+        team_title_shadow = self._render_cached(self.font_medium, "Team Members - Group 6", (0, 0, 0))
         team_title_shadow_rect = team_title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, y_offset + 1))
-        self.screen.blit(team_title_shadow, team_title_shadow_rect)
+        target.blit(team_title_shadow, team_title_shadow_rect)
         team_title_rect = team_title.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))
-        self.screen.blit(team_title, team_title_rect)
+        target.blit(team_title, team_title_rect)
         y_offset += 40
         
         # Team members list
@@ -1616,21 +1940,21 @@ class GomokuUI:
         
         for name, student_id in team_members:
             member_text = f"{name} - {student_id}"
-            member_shadow = self.font_small.render(member_text, True, (0, 0, 0))
-            self.screen.blit(member_shadow, (self.WINDOW_WIDTH // 2 - 150 + 1, y_offset + 1))
-            member_surf = self.font_small.render(member_text, True, Colors.WHITE)
-            self.screen.blit(member_surf, (self.WINDOW_WIDTH // 2 - 150, y_offset))
+            member_shadow = self._render_cached(self.font_small, member_text, (0, 0, 0))
+            target.blit(member_shadow, (self.WINDOW_WIDTH // 2 - 150 + 1, y_offset + 1))
+            member_surf = self._render_cached(self.font_small, member_text, Colors.WHITE)
+            target.blit(member_surf, (self.WINDOW_WIDTH // 2 - 150, y_offset))
             y_offset += 30
         
         y_offset += 20
         
         # Game Controls Section
-        controls_title = self.font_medium.render("Game Controls", True, Colors.ACCENT)
-        controls_title_shadow = self.font_medium.render("Game Controls", True, (0, 0, 0))
+        controls_title = self._render_cached(self.font_medium, "Game Controls", Colors.ACCENT)
+        controls_title_shadow = self._render_cached(self.font_medium, "Game Controls", (0, 0, 0))
         controls_title_shadow_rect = controls_title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, y_offset + 1))
-        self.screen.blit(controls_title_shadow, controls_title_shadow_rect)
+        target.blit(controls_title_shadow, controls_title_shadow_rect)
         controls_title_rect = controls_title.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))
-        self.screen.blit(controls_title, controls_title_rect)
+        target.blit(controls_title, controls_title_rect)
         y_offset += 40
         
         controls = [
@@ -1642,35 +1966,25 @@ class GomokuUI:
         ]
         
         for control in controls:
-            control_shadow = self.font_small.render(control, True, (0, 0, 0))
-            self.screen.blit(control_shadow, (self.WINDOW_WIDTH // 2 - 200 + 1, y_offset + 1))
-            control_surf = self.font_small.render(control, True, Colors.WHITE)
-            self.screen.blit(control_surf, (self.WINDOW_WIDTH // 2 - 200, y_offset))
+            control_shadow = self._render_cached(self.font_small, control, (0, 0, 0))
+            target.blit(control_shadow, (self.WINDOW_WIDTH // 2 - 200 + 1, y_offset + 1))
+            control_surf = self._render_cached(self.font_small, control, Colors.WHITE)
+            target.blit(control_surf, (self.WINDOW_WIDTH // 2 - 200, y_offset))
             y_offset += 25
-        
-        # Buttons
-        for button in self.buttons["about"]:
-            button.draw(self.screen)
     
     def _handle_about_events(self, event):
         """Handle about page events"""
-        buttons = self.buttons["about"]
-        
-        for i, button in enumerate(buttons):
+        for i, button in self._buttons_for_event("about", event):
             if button.handle_event(event):
                 if i == 0:  # Back
                     self.ui_state = UIState.MAIN_MENU
     
     def _draw_player_name_input(self):
         """Draw player name input screen"""
-        title = self.font_large.render("Enter Your Name", True, Colors.BLACK)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, "Enter Your Name", Colors.BLACK, (self.WINDOW_WIDTH // 2, 100))
         
         # Instruction
-        instruction = self.font_medium.render("Please enter your player name:", True, Colors.GRAY)
-        instruction_rect = instruction.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(instruction, instruction_rect)
+        self._blit_centered(self.font_medium, "Please enter your player name:", Colors.GRAY, (self.WINDOW_WIDTH // 2, 200))
         
         # Text input box
         input_rect = pygame.Rect(self.WINDOW_WIDTH // 2 - 150, 250, 300, 40)
@@ -1680,23 +1994,21 @@ class GomokuUI:
         # Text content
         display_text = self.text_input_content if self.text_input_content else "Enter name here..."
         text_color = Colors.BLACK if self.text_input_content else Colors.GRAY
-        text_surface = self.font_medium.render(display_text, True, text_color)
+        text_surface = self._render_cached(self.font_medium, display_text, text_color)
         text_rect = text_surface.get_rect()
         text_rect.centery = input_rect.centery
         text_rect.x = input_rect.x + 10
         self.screen.blit(text_surface, text_rect)
         
         # Cursor
-        if len(self.text_input_content) > 0:
+        if self.text_input_content and self._cursor_visible:
             cursor_x = text_rect.right + 2
             pygame.draw.line(self.screen, Colors.BLACK, 
                            (cursor_x, input_rect.y + 5), 
                            (cursor_x, input_rect.bottom - 5), 2)
         
         # Help text
-        help_text = self.font_small.render("Press Enter to continue or click Continue button", True, Colors.GRAY)
-        help_rect = help_text.get_rect(center=(self.WINDOW_WIDTH // 2, 310))
-        self.screen.blit(help_text, help_rect)
+        self._blit_centered(self.font_small, "Press Enter to continue or click Continue button", Colors.GRAY, (self.WINDOW_WIDTH // 2, 310))
         
         # Buttons
         for button in self.buttons["player_name_input"]:
@@ -1706,154 +2018,156 @@ class GomokuUI:
         """Draw server selection screen with improved visibility"""
         # Title with shadow and better contrast
         title_text = "Select Server"
-        title_shadow = self.font_large.render(title_text, True, (0, 0, 0))
-        title_shadow_rect = title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 52))
-        self.screen.blit(title_shadow, title_shadow_rect)
-        
-        title = self.font_large.render(title_text, True, Colors.WHITE)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 50))
-        self.screen.blit(title, title_rect)
+        title_shadow = self._render_cached(self.font_large, title_text, (0, 0, 0))
+        title = self._render_cached(self.font_large, title_text, Colors.WHITE)
+        blit_seq = [
+            (title_shadow, title_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 2, 52))),
+            (title, title.get_rect(center=(self.WINDOW_WIDTH // 2, 50))),
+        ]
         
         # Current server info with better visibility
         current_config = self.server_config_manager.get_current_config()
         if current_config:
             current_text = f"Current: {current_config.name}"
-            current_shadow = self.font_info.render(current_text, True, (0, 0, 0))
-            current_shadow_rect = current_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 91))
-            self.screen.blit(current_shadow, current_shadow_rect)
-            
-            current_surface = self.font_info.render(current_text, True, Colors.ACCENT)
-            current_rect = current_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 90))
-            self.screen.blit(current_surface, current_rect)
+            current_shadow = self._render_cached(self.font_info, current_text, (0, 0, 0))
+            blit_seq.append((current_shadow, current_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 91))))
+            current_surface = self._render_cached(self.font_info, current_text, Colors.ACCENT)
+            blit_seq.append((current_surface, current_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 90))))
+        self.screen.blits(blit_seq, False)
         
         # Server list with improved visibility
         configs = self.server_config_manager.get_all_configs()
+        current_name = self.server_config_manager.current_config
         start_y = 130
         
+        # Loop-invariant lookups bound once
+        screen = self.screen
+        panel_surface = self._server_panel_surface
+        row_surfaces = self._server_row_surfaces
+        indicator_text = "CURRENT"
+        indicator_shadow = self._render_cached(self.font_info, indicator_text, (0, 0, 0))
+        indicator = self._render_cached(self.font_info, indicator_text, Colors.SUCCESS)
+        
         for i, (name, config) in enumerate(configs.items()):
             y_pos = start_y + i * 70
             
             # Background panel for better readability
-            panel_rect = pygame.Rect(80, y_pos - 5, 640, 65)
-            panel = pygame.Surface((panel_rect.width, panel_rect.height))
-            panel.set_alpha(180)
-            panel.fill((20, 20, 30))
-            self.screen.blit(panel, panel_rect)
+            panel_rect = panel_surface.get_rect(topleft=(80, y_pos - 5))
+            screen.blit(panel_surface, panel_rect)
             
             # Border for selected server
-            if name == self.server_config_manager.current_config:
-                pygame.draw.rect(self.screen, Colors.SUCCESS, panel_rect, 3)
-            
-            # Server name and type - larger font, bright white
-            server_text = f"{name} ({config.server_type.value})"
-            server_shadow = self.font_info.render(server_text, True, (0, 0, 0))
-            self.screen.blit(server_shadow, (100 + 1, y_pos + 1))
-            server_surface = self.font_info.render(server_text, True, Colors.WHITE)
-            self.screen.blit(server_surface, (100, y_pos))
-            
-            # Server details - larger font, bright cyan/white
-            details_text = f"{config.host}:{config.port}"
-            if config.use_ssl:
-                details_text += " (SSL)"
-            details_shadow = self.font_small.render(details_text, True, (0, 0, 0))
-            self.screen.blit(details_shadow, (100 + 1, y_pos + 28))
-            details_surface = self.font_small.render(details_text, True, (200, 255, 255))  # Bright cyan
-            self.screen.blit(details_surface, (100, y_pos + 27))
+            if name == current_name:
+                screen.blit(self._selected_panel_border, panel_rect)
+            
+            # Server name/type and details (shadow + text pairs)
+            server_shadow, server_surface, details_shadow, details_surface = row_surfaces(name, config)
+            blit_seq = [
+                (server_shadow, (100 + 1, y_pos + 1)),
+                (server_surface, (100, y_pos)),
+                (details_shadow, (100 + 1, y_pos + 28)),
+                (details_surface, (100, y_pos + 27)),
+            ]
             
             # Current indicator - larger and more visible
-            if name == self.server_config_manager.current_config:
-                indicator_text = "CURRENT"
-                indicator_shadow = self.font_info.render(indicator_text, True, (0, 0, 0))
-                self.screen.blit(indicator_shadow, (550 + 1, y_pos + 15))
-                indicator = self.font_info.render(indicator_text, True, Colors.SUCCESS)
-                self.screen.blit(indicator, (550, y_pos + 14))
+            if name == current_name:
+                blit_seq.append((indicator_shadow, (550 + 1, y_pos + 15)))
+                blit_seq.append((indicator, (550, y_pos + 14)))
+            screen.blits(blit_seq, False)
         
         # Instructions with better visibility
-        instructions = [
-            "Click on a server to select it",
-            "Press Enter to continue with selected server",
-            "ESC to go back"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text_shadow = self.font_small.render(instruction, True, (0, 0, 0))
-            text_shadow_rect = text_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 450 + i * 22 + 1))
-            self.screen.blit(text_shadow, text_shadow_rect)
-            
-            text = self.font_small.render(instruction, True, Colors.WHITE)
-            text_rect = text.get_rect(center=(self.WINDOW_WIDTH // 2, 450 + i * 22))
-            self.screen.blit(text, text_rect)
+        self.screen.blits(self._server_select_instructions, False)
         
         # Buttons
         for button in self.buttons["server_select"]:
             button.draw(self.screen)
     
+    def _server_row_surfaces(self, name: str, config) -> Tuple[pygame.Surface, ...]:
+        """Return the rendered name and details text (with shadows) for a server row"""
+        version = self.server_config_manager.version
+        if version != self._server_text_version:
+            self._server_text_cache.clear()
+            self._server_text_version = version
+        
+        key = (name, config.server_type.value, config.host, config.port, config.use_ssl)
+        surfaces = self._server_text_cache.get(key)
+        if surfaces is None:
+            # Server name and type - larger font, bright white
+            server_text = f"{name} ({config.server_type.value})"
+            # Server details - larger font, bright cyan/white
+            details_text = f"{config.host}:{config.port}"
+            if config.use_ssl:
+                details_text += " (SSL)"
+            # Each string is rasterised once; its shadow is a recoloured copy
+            surfaces = (
+                self._render_cached(self.font_info, server_text, (0, 0, 0)),
+                self._render_cached(self.font_info, server_text, Colors.WHITE),
+                self._render_cached(self.font_small, details_text, (0, 0, 0)),
+                self._render_cached(self.font_small, details_text, (200, 255, 255)),  # Bright cyan
+            )
+            self._server_text_cache[key] = surfaces
+        return surfaces
+    
     def _draw_lobby_browser(self):
         """Draw lobby browser screen"""
-        title = self.font_large.render(f"Welcome, {self.player_name}!", True, Colors.BLACK)
+        title = self._render_cached(self.font_large, f"Welcome, {self.player_name}!", Colors.BLACK)
         title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 50))
         self.screen.blit(title, title_rect)
         
         # Room list title
-        rooms_title = self.font_medium.render("Available Games:", True, Colors.BLACK)
+        rooms_title = self._render_cached(self.font_medium, "Available Games:", Colors.BLACK)
         rooms_title_rect = rooms_title.get_rect(x=200, y=150)
         self.screen.blit(rooms_title, rooms_title_rect)
         
         # Room list
         if self.current_room_list:
-            start_y = 200
-            item_height = 60
-            
-            for i, room in enumerate(self.current_room_list):
-                y = start_y + i * (item_height + 10)
-                room_rect = pygame.Rect(150, y, 500, item_height)  # Reduced width from 600 to 500, moved left
+            # Loop-invariant lookups bound once
+            screen = self.screen
+            draw_rect = pygame.draw.rect
+            row_cache = self._room_surface_cache
+            row_key = self._room_row_key
+            selected_id = self.selected_room["room_id"] if self.selected_room else None
+            
+            text_blits = []
+            for room, room_rect in zip(self.current_room_list, self._room_rects):
                 
                 # Background color with better visual feedback
-                is_selected = (self.selected_room and room["room_id"] == self.selected_room["room_id"])
+                is_selected = selected_id is not None and room["room_id"] == selected_id
                 
                 if is_selected:
                     # Selected room: modern accent color with green border
-                    pygame.draw.rect(self.screen, Colors.ACCENT, room_rect)
-                    pygame.draw.rect(self.screen, Colors.SUCCESS, room_rect, 3)
+                    draw_rect(screen, Colors.ACCENT, room_rect)
+                    draw_rect(screen, Colors.SUCCESS, room_rect, 3)
                     text_color = Colors.WHITE
                 else:
                     # Unselected room: clean white background
-                    pygame.draw.rect(self.screen, Colors.CARD_BG, room_rect)
-                    pygame.draw.rect(self.screen, Colors.GRAY, room_rect, 2)
+                    draw_rect(screen, Colors.CARD_BG, room_rect)
+                    draw_rect(screen, Colors.GRAY, room_rect, 2)
                     text_color = Colors.TEXT_PRIMARY
                 
-                # Room info
-                room_name = room.get("name", "Unknown Room")
-                host_name = room.get("host_name", "Unknown")
-                player_count = room.get("players", 0)
-                max_players = room.get("max_players", 2)
-                
-                # Room name
-                name_surface = self.font_medium.render(room_name, True, text_color)
-                name_rect = name_surface.get_rect(x=room_rect.x + 10, y=room_rect.y + 5)
-                self.screen.blit(name_surface, name_rect)
+                # Room info, rendered once per room contents and selection
+                key = (*row_key(room), is_selected)
+                surfaces = row_cache.get(key)
+                if surfaces is None:
+                    room_name, host_name, player_count, max_players = key[:-1]
+                    name_surface = self.font_medium.render(room_name, True, text_color).convert_alpha()
+                    
+                    # Host and player info with appropriate color
+                    info_text = f"Host: {host_name} | Players: {player_count}/{max_players}"
+                    info_color = Colors.LIGHT_GRAY if is_selected else Colors.TEXT_SECONDARY
+                    info_surface = self.font_small.render(info_text, True, info_color).convert_alpha()
+                    surfaces = row_cache[key] = (name_surface, info_surface)
                 
-                # Host and player info with appropriate color
-                info_text = f"Host: {host_name} | Players: {player_count}/{max_players}"
-                info_color = Colors.LIGHT_GRAY if is_selected else Colors.TEXT_SECONDARY
-                info_surface = self.font_small.render(info_text, True, info_color)
-                info_rect = info_surface.get_rect(x=room_rect.x + 10, y=room_rect.y + 35)
-                self.screen.blit(info_surface, info_rect)
+                name_surface, info_surface = surfaces
+                text_blits.append((name_surface, (room_rect.x + 10, room_rect.y + 5)))
+                text_blits.append((info_surface, (room_rect.x + 10, room_rect.y + 35)))
+            
+            # Rows do not overlap, so all text can go after the row backgrounds
+            screen.blits(text_blits, False)
         else:
-            no_rooms = self.font_medium.render("No games available. Create one!", True, Colors.GRAY)
-            no_rooms_rect = no_rooms.get_rect(center=(self.WINDOW_WIDTH // 2, 300))
-            self.screen.blit(no_rooms, no_rooms_rect)
+            self._blit_centered(self.font_medium, "No games available. Create one!", Colors.GRAY, (self.WINDOW_WIDTH // 2, 300))
         
         # Instructions
-        instructions = [
-            "Click on a room to select it",
-            "Use buttons below to create, join, or refresh"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text = self.font_small.render(instruction, True, Colors.GRAY)
-            text_rect = text.get_rect(center=(self.WINDOW_WIDTH // 2, 450 + i * 25))
-            self.screen.blit(text, text_rect)
+        self.screen.blits(self._lobby_instructions, False)
         
         # Buttons
         for button in self.buttons["lobby_browser"]:
@@ -1861,14 +2175,10 @@ class GomokuUI:
     
     def _draw_room_create(self):
         """Draw room creation screen"""
-        title = self.font_large.render("Create New Room", True, Colors.BLACK)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, "Create New Room", Colors.BLACK, (self.WINDOW_WIDTH // 2, 100))
         
         # Instruction
-        instruction = self.font_medium.render("Enter room name:", True, Colors.GRAY)
-        instruction_rect = instruction.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(instruction, instruction_rect)
+        self._blit_centered(self.font_medium, "Enter room name:", Colors.GRAY, (self.WINDOW_WIDTH // 2, 200))
         
         # Text input box
         input_rect = pygame.Rect(self.WINDOW_WIDTH // 2 - 200, 250, 400, 40)
@@ -1878,57 +2188,83 @@ class GomokuUI:
         # Text content
         display_text = self.text_input_content if self.text_input_content else "Enter room name..."
         text_color = Colors.BLACK if self.text_input_content else Colors.GRAY
-        text_surface = self.font_medium.render(display_text, True, text_color)
+        text_surface = self._render_cached(self.font_medium, display_text, text_color)
         text_rect = text_surface.get_rect()
         text_rect.centery = input_rect.centery
         text_rect.x = input_rect.x + 10
         self.screen.blit(text_surface, text_rect)
         
         # Cursor
-        if len(self.text_input_content) > 0:
+        if self.text_input_content and self._cursor_visible:
             cursor_x = text_rect.right + 2
             pygame.draw.line(self.screen, Colors.BLACK, 
                            (cursor_x, input_rect.y + 5), 
                            (cursor_x, input_rect.bottom - 5), 2)
         
         # Help text
-        help_text = self.font_small.render("Press Enter to create or click Create button", True, Colors.GRAY)
-        help_rect = help_text.get_rect(center=(self.WINDOW_WIDTH // 2, 310))
-        self.screen.blit(help_text, help_rect)
+        self._blit_centered(self.font_small, "Press Enter to create or click Create button", Colors.GRAY, (self.WINDOW_WIDTH // 2, 310))
         
         # Buttons
         for button in self.buttons["room_create"]:
             button.draw(self.screen)
     
+    def _layout_game_over_text(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Render and place the game over message and disconnect note"""
+        # Draw game over message with player names
+        if self.game.winner:
+            winner_name = self.player_names.get(self.game.winner, self.game.winner.name)
+            message = f"{winner_name} WINS!"
+            color = Colors.WHITE
+        elif self.game.game_state == GameState.BLACK_WINS:
+            winner_name = self.player_names.get(Player.BLACK, "Black")
+            message = f"{winner_name} WINS!"
+            color = Colors.WHITE
+        elif self.game.game_state == GameState.WHITE_WINS:
+            winner_name = self.player_names.get(Player.WHITE, "White")
+            message = f"{winner_name} WINS!"
+            color = Colors.WHITE
+        else:
+            message = "Draw!"
+            color = Colors.YELLOW
+        
+        lines = [(self.font_large, message, color, 200)]
+        
+        # Show disconnect message if applicable
+        if self.is_disconnect_win and self.disconnect_reason:
+            lines.append((self.font_medium, self.disconnect_reason, Colors.YELLOW, 250))
+            # Additional note
+            lines.append((self.font_small, "Opponent has left the game", Colors.LIGHT_GRAY, 290))
+        
+        blits = []
+        for font, text, text_color, y in lines:
+            surface = self._render_cached(font, text, text_color)
+            blits.append((surface, surface.get_rect(center=(self.WINDOW_WIDTH // 2, y))))
+        return blits
+    
     def _draw_room_waiting(self):
         """Draw room waiting screen"""
-        title = self.font_large.render("Waiting for Players", True, Colors.BLACK)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 100))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, "Waiting for Players", Colors.BLACK, (self.WINDOW_WIDTH // 2, 100))
         
         if self.room_info:
             room_name = self.room_info.get("name", "Unknown Room")
-            room_title = self.font_medium.render(f"Room: {room_name}", True, Colors.BLACK)
-            room_title_rect = room_title.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-            self.screen.blit(room_title, room_title_rect)
-            
             player_count = self.room_info.get("players", 0)
             max_players = self.room_info.get("max_players", 2)
             
-            status_text = f"Players: {player_count}/{max_players}"
-            status_surface = self.font_medium.render(status_text, True, Colors.GRAY)
-            status_rect = status_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 250))
-            self.screen.blit(status_surface, status_rect)
-            
-            if player_count >= max_players:
-                ready_text = "Game can start!"
-                ready_surface = self.font_medium.render(ready_text, True, Colors.GREEN)
-            else:
-                ready_text = "Waiting for more players..."
-                ready_surface = self.font_medium.render(ready_text, True, Colors.GRAY)
+            # Labels only change when the room does; skip formatting otherwise
+            key = (room_name, player_count, max_players)
+            if key != self._room_waiting_key:
+                self._room_waiting_key = key
+                self._room_waiting_labels = [
+                    (f"Room: {room_name}", Colors.BLACK, 200),
+                    (f"Players: {player_count}/{max_players}", Colors.GRAY, 250),
+                ]
+                if player_count >= max_players:
+                    self._room_waiting_labels.append(("Game can start!", Colors.GREEN, 300))
+                else:
+                    self._room_waiting_labels.append(("Waiting for more players...", Colors.GRAY, 300))
             
-            ready_rect = ready_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 300))
-            self.screen.blit(ready_surface, ready_rect)
+            for text, color, y in self._room_waiting_labels:
+                self._blit_centered(self.font_medium, text, color, (self.WINDOW_WIDTH // 2, y))
         
         # Buttons
         for button in self.buttons["room_waiting"]:
@@ -1937,230 +2273,407 @@ class GomokuUI:
     def _draw_connection_lost(self):
         """Draw connection lost screen with reconnection progress"""
         # Dim the background
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._connection_lost_overlay, (0, 0))
         
         # Title
-        title = self.font_large.render("Connection Lost", True, Colors.RED)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, "Connection Lost", Colors.RED, (self.WINDOW_WIDTH // 2, 200))
         
         # Reason
         if self.disconnect_reason:
-            try:
-                reason_lines = self._wrap_text(self.disconnect_reason, self.font_medium, self.WINDOW_WIDTH - 200)
-                y_offset = 280
-                for line in reason_lines:
-                    reason_surface = self.font_medium.render(line, True, Colors.WHITE)
-                    reason_rect = reason_surface.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))
-                    self.screen.blit(reason_surface, reason_rect)
-                    y_offset += 40
-            except Exception as e:
-                # Fallback if text wrapping fails
-                reason_surface = self.font_medium.render("Connection to server lost", True, Colors.WHITE)
-                reason_rect = reason_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 280))
-                self.screen.blit(reason_surface, reason_rect)
+            self.screen.blits(self._disconnect_reason_blits("Connection to server lost"), False)
         
         # Reconnection progress
         if self.reconnection_attempt > 0:
             progress_text = f"Reconnecting... Attempt {self.reconnection_attempt}/{self.max_reconnection_attempts}"
-            progress_surface = self.font_medium.render(progress_text, True, Colors.YELLOW)
-            progress_rect = progress_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 400))
-            self.screen.blit(progress_surface, progress_rect)
-            
-            # Progress bar
-            bar_width = 400
-            bar_height = 20
-            bar_x = (self.WINDOW_WIDTH - bar_width) // 2
-            bar_y = 450
-            
-            # Background bar
-            pygame.draw.rect(self.screen, Colors.DARK_GRAY, 
-                           (bar_x, bar_y, bar_width, bar_height), border_radius=10)
-            
-            # Progress fill
-            progress = self.reconnection_attempt / self.max_reconnection_attempts
-            fill_width = int(bar_width * progress)
-            pygame.draw.rect(self.screen, Colors.YELLOW,
-                           (bar_x, bar_y, fill_width, bar_height), border_radius=10)
+            self._blit_centered(self.font_medium, progress_text, Colors.YELLOW, (self.WINDOW_WIDTH // 2, 400))
+            
+            # Progress bar, with the fill in integer pixels
+            fill_width = self.PROGRESS_BAR_WIDTH * self.reconnection_attempt // self.max_reconnection_attempts
+            self.screen.blit(self._progress_bar_surface(fill_width, Colors.YELLOW), self._progress_bar_pos)
         
         # Instructions
-        instruction = self.font_small.render("Please wait while we reconnect you...", True, Colors.LIGHT_GRAY)
-        instruction_rect = instruction.get_rect(center=(self.WINDOW_WIDTH // 2, 520))
-        self.screen.blit(instruction, instruction_rect)
+        self._blit_centered(self.font_small, "Please wait while we reconnect you...", Colors.LIGHT_GRAY, (self.WINDOW_WIDTH // 2, 520))
+        
+        # Only the attempt line and bar change once the screen is up
+        self._dirty_rects = self._disconnect_dirty_rects(
+            self._disconnect_status_band, self._progress_bar.get_rect(topleft=self._progress_bar_pos))
+    
+    def _disconnect_dirty_rects(self, *rects: pygame.Rect) -> Optional[List[pygame.Rect]]:
+        """Regions a disconnect screen may change, or None when its reason text changed"""
+        if self.disconnect_reason != self._presented_disconnect_reason:
+            self._presented_disconnect_reason = self.disconnect_reason
+            return None
+        return list(rects)
+    
+    def _progress_bar_surface(self, fill_width: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Rounded progress bar, redrawn only when its fill width or colour changes"""
+        key = (fill_width, color)
+        if key != self._progress_bar_key:
+            bar = self._progress_bar
+            bar.fill((0, 0, 0, 0))
+            pygame.draw.rect(bar, Colors.DARK_GRAY, bar.get_rect(), border_radius=10)
+            pygame.draw.rect(bar, color, (0, 0, fill_width, bar.get_height()), border_radius=10)
+            self._progress_bar_key = key
+        return self._progress_bar
+    
+    def _disconnect_reason_blits(self, fallback: str) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        """Wrapped disconnect_reason lines, laid out again only when the reason changes"""
+        key = (self.disconnect_reason, fallback)
+        if key == self._reason_layout_key:
+            return self._reason_layout
+        
+        try:
+            lines = self._wrap_text(self.disconnect_reason, self.font_medium, self.WINDOW_WIDTH - 200)
+        except Exception:
+            # Fallback if text wrapping fails
+            lines = [fallback]
+        
+        blits = []
+        y_offset = 280
+        for line in lines:
+            surface = self._render_cached(self.font_medium, line, Colors.WHITE)
+            blits.append((surface, surface.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))))
+            y_offset += 40
+        
+        self._reason_layout_key = key
+        self._reason_layout = blits
+        return blits
     
     def _draw_opponent_disconnected(self):
         """Draw opponent disconnected screen with countdown"""
-        # Draw the game board in the background (dimmed)
-        try:
-            self._draw_gameplay()
-        except:
-            # If gameplay drawing fails, just use black background
-            self.screen.fill(Colors.BLACK)
-        
-        # Dim overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+        # The game is paused underneath, so the dimmed board is drawn once
+        # and the snapshot reused while the countdown runs
+        if self._opponent_disc_backdrop is None:
+            # Draw the game board in the background (dimmed)
+            try:
+                self._draw_gameplay()
+            except:
+                # If gameplay drawing fails, just use black background
+                self.screen.fill(Colors.BLACK)
+            
+            # Dim overlay
+            self.screen.blit(self._disconnect_overlay, (0, 0))
+            self._opponent_disc_backdrop = self.screen.copy()
+        else:
+            self.screen.blit(self._opponent_disc_backdrop, (0, 0))
         
         # Title
-        title = self.font_large.render("Opponent Disconnected", True, Colors.WARNING)
-        title_rect = title.get_rect(center=(self.WINDOW_WIDTH // 2, 200))
-        self.screen.blit(title, title_rect)
+        self._blit_centered(self.font_large, "Opponent Disconnected", Colors.WARNING, (self.WINDOW_WIDTH // 2, 200))
         
         # Message
         if self.disconnect_reason:
-            try:
-                message_lines = self._wrap_text(self.disconnect_reason, self.font_medium, self.WINDOW_WIDTH - 200)
-                y_offset = 280
-                for line in message_lines:
-                    message_surface = self.font_medium.render(line, True, Colors.WHITE)
-                    message_rect = message_surface.get_rect(center=(self.WINDOW_WIDTH // 2, y_offset))
-                    self.screen.blit(message_surface, message_rect)
-                    y_offset += 40
-            except Exception as e:
-                # Fallback message
-                message_surface = self.font_medium.render("Your opponent has disconnected", True, Colors.WHITE)
-                message_rect = message_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 280))
-                self.screen.blit(message_surface, message_rect)
+            self.screen.blits(self._disconnect_reason_blits("Your opponent has disconnected"), False)
         
         # Countdown timer
         if self.opponent_disconnect_time:
-            elapsed = time.time() - self.opponent_disconnect_time
-            remaining = max(0, self.opponent_disconnect_timeout - elapsed)
-            
-            countdown_text = f"Waiting for reconnection: {int(remaining)} seconds"
-            countdown_surface = self.font_medium.render(countdown_text, True, Colors.YELLOW)
-            countdown_rect = countdown_surface.get_rect(center=(self.WINDOW_WIDTH // 2, 400))
-            self.screen.blit(countdown_surface, countdown_rect)
-            
-            # Progress bar showing time remaining
-            bar_width = 400
-            bar_height = 20
-            bar_x = (self.WINDOW_WIDTH - bar_width) // 2
-            bar_y = 450
-            
-            # Background bar
-            pygame.draw.rect(self.screen, Colors.DARK_GRAY,
-                           (bar_x, bar_y, bar_width, bar_height), border_radius=10)
-            
-            # Time remaining fill
-            progress = remaining / self.opponent_disconnect_timeout
-            fill_width = int(bar_width * progress)
-            color = Colors.GREEN if progress > 0.5 else (Colors.WARNING if progress > 0.25 else Colors.RED)
-            pygame.draw.rect(self.screen, color,
-                           (bar_x, bar_y, fill_width, bar_height), border_radius=10)
+            # Work in whole milliseconds so the bar and colour need no float math
+            elapsed = self._frame_now - self.opponent_disconnect_time
+            timeout_ms = int(self.opponent_disconnect_timeout * 1000)
+            remaining_ms = max(0, int((self.opponent_disconnect_timeout - elapsed) * 1000))
+            
+            countdown_text = f"Waiting for reconnection: {remaining_ms // 1000} seconds"
+            self._blit_centered(self.font_medium, countdown_text, Colors.YELLOW, (self.WINDOW_WIDTH // 2, 400))
+            
+            # Progress bar showing time remaining; green above half, then warning above a quarter
+            fill_width = self.PROGRESS_BAR_WIDTH * remaining_ms // timeout_ms
+            if remaining_ms * 2 > timeout_ms:
+                color = Colors.GREEN
+            elif remaining_ms * 4 > timeout_ms:
+                color = Colors.WARNING
+            else:
+                color = Colors.RED
+            self.screen.blit(self._progress_bar_surface(fill_width, color), self._progress_bar_pos)
         
         # Leave game button
-        button_width = 200
-        button_height = 50
-        button_x = (self.WINDOW_WIDTH - button_width) // 2
-        button_y = 520
-        
-        button_rect = pygame.Rect(button_x, button_y, button_width, button_height)
-        mouse_pos = pygame.mouse.get_pos()
-        is_hover = button_rect.collidepoint(mouse_pos)
-        
-        button_color = Colors.RED if is_hover else Colors.DARK_GRAY
+        button_rect = self._leave_game_rect
+        button_color = Colors.RED if self._leave_game_hover else Colors.DARK_GRAY
         pygame.draw.rect(self.screen, button_color, button_rect, border_radius=10)
+        self._blit_centered(self.font_medium, "Leave Game", Colors.WHITE, button_rect.center)
         
-        leave_text = self.font_medium.render("Leave Game", True, Colors.WHITE)
-        leave_rect = leave_text.get_rect(center=button_rect.center)
-        self.screen.blit(leave_text, leave_rect)
+        # Only the countdown, its bar and the button hover change once the screen is up
+        self._dirty_rects = self._disconnect_dirty_rects(
+            self._disconnect_status_band, self._progress_bar.get_rect(topleft=self._progress_bar_pos), button_rect)
     
     def _draw_board(self):
         """Draw the game board with modern effects"""
-        # Draw board background with shadow
-        board_rect = pygame.Rect(self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y, 
-                                self.BOARD_SIZE, self.BOARD_SIZE)
+        # Board shadow, background, border and grid lines (pre-rendered)
+        self.screen.blit(self._board_surface, (self.BOARD_OFFSET_X, self.BOARD_OFFSET_Y))
+        
+        # Occupied cells only change when a move is made or undone, so the
+        # full board scan runs once per move rather than once per frame
+        key = (self.game.board, len(self.game.move_history))
+        if key != self._stone_layer_key:
+            sprites = self._stone_sprites
+            empty = Player.EMPTY
+            self._stone_blits = [(sprites[player], topleft)
+                                 for board_row, topleft_row in zip(self.game.board, self._cell_toplefts)
+                                 for player, topleft in zip(board_row, topleft_row)
+                                 if player is not empty]
+            self._stone_layer_key = key
+        
+        # Draw stones and the last-move ring in a single batched blit
+        stone_blits = self._stone_blits
+        if self.last_move_pos:
+            row, col = self.last_move_pos
+            stone_blits = stone_blits + [(self._last_move_ring, self._cell_toplefts[row][col])]
+        self.screen.blits(stone_blits, doreturn=False)
+    
+    def _build_board_surface(self):
+        """Pre-render the static board (shadow, background, border and grid lines)"""
+        # Leave a margin for the drop shadow, offset 4px down-right; the 2px
+        # grid lines also overhang the board edge by one pixel
+        size = self.BOARD_SIZE + 4
+        surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        board_rect = pygame.Rect(0, 0, self.BOARD_SIZE, self.BOARD_SIZE)
         
         # Shadow effect
-        shadow_rect = pygame.Rect(self.BOARD_OFFSET_X + 4, self.BOARD_OFFSET_Y + 4,
-                                 self.BOARD_SIZE, self.BOARD_SIZE)
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height))
-        shadow_surface.set_alpha(40)
-        shadow_surface.fill(Colors.BLACK)
-        self.screen.blit(shadow_surface, shadow_rect)
-        
-        # Board background with subtle gradient
-        pygame.draw.rect(self.screen, Colors.LIGHT_BROWN, board_rect)
+        surface.fill((0, 0, 0, 40), board_rect.move(4, 4))
         
-        # Add subtle border
-        pygame.draw.rect(self.screen, Colors.DARK_BROWN, board_rect, 3)
+        # Board background with subtle border
+        pygame.draw.rect(surface, Colors.LIGHT_BROWN, board_rect)
+        pygame.draw.rect(surface, Colors.DARK_BROWN, board_rect, 3)
         
-        # Draw grid lines
+        # Grid lines
         for i in range(GomokuGame.BOARD_SIZE + 1):
-            # Vertical lines
-            x = self.BOARD_OFFSET_X + i * self.CELL_SIZE
-            pygame.draw.line(self.screen, Colors.BLACK, 
-                           (x, self.BOARD_OFFSET_Y), 
-                           (x, self.BOARD_OFFSET_Y + self.BOARD_SIZE), 2)
-            
-            # Horizontal lines
-            y = self.BOARD_OFFSET_Y + i * self.CELL_SIZE
-            pygame.draw.line(self.screen, Colors.BLACK, 
-                           (self.BOARD_OFFSET_X, y), 
-                           (self.BOARD_OFFSET_X + self.BOARD_SIZE, y), 2)
-        
-        # Draw stones
-        for row in range(GomokuGame.BOARD_SIZE):
-            for col in range(GomokuGame.BOARD_SIZE):
-                if self.game.board[row][col] != Player.EMPTY:
-                    self._draw_stone(row, col, self.game.board[row][col])
+            offset = i * self.CELL_SIZE
+            pygame.draw.line(surface, Colors.BLACK, (offset, 0), (offset, self.BOARD_SIZE), 2)
+            pygame.draw.line(surface, Colors.BLACK, (0, offset), (self.BOARD_SIZE, offset), 2)
         
-        # Highlight last move
-        if self.last_move_pos:
-            self._highlight_last_move(self.last_move_pos[0], self.last_move_pos[1])
+        self._board_surface = surface.convert_alpha()
     
-    def _draw_stone(self, row: int, col: int, player: Player):
-        """Draw a stone on the board with color based on player"""
-        center_x = self.BOARD_OFFSET_X + col * self.CELL_SIZE + self.CELL_SIZE // 2
-        center_y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE + self.CELL_SIZE // 2
+    def _build_stone_sprites(self):
+        """Pre-render one stone sprite per player colour"""
+        center = (self.CELL_SIZE // 2, self.CELL_SIZE // 2)
         radius = self.CELL_SIZE // 2 - 3
         
-        # Get player color from mapping
-        player_colors = {
-            Player.BLACK: (0, 0, 0),           # Black
-            Player.WHITE: (255, 255, 255),    # White
-            Player.RED: (220, 38, 38),        # Red
-            Player.BLUE: (37, 99, 235),       # Blue
-            Player.GREEN: (34, 197, 94)       # Green
-        }
-        
-        color = player_colors.get(player, Colors.BLACK)
-        
-        # Border color: white for dark colors, black for light colors
-        if player == Player.WHITE:
-            border_color = Colors.BLACK
-        else:
-            border_color = Colors.WHITE
-        
-        pygame.draw.circle(self.screen, color, (center_x, center_y), radius)
-        pygame.draw.circle(self.screen, border_color, (center_x, center_y), radius, 2)
+        for player, color in PLAYER_COLORS.items():
+            # Border color: white for dark colors, black for light colors
+            border_color = Colors.BLACK if player == Player.WHITE else Colors.WHITE
+            
+            sprite = pygame.Surface((self.CELL_SIZE, self.CELL_SIZE), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, color, center, radius)
+            pygame.draw.circle(sprite, border_color, center, radius, 2)
+            self._stone_sprites[player] = sprite.convert_alpha()
+        
+        # Red ring around the most recent stone
+        ring = pygame.Surface((self.CELL_SIZE, self.CELL_SIZE), pygame.SRCALPHA)
+        pygame.draw.circle(ring, Colors.RED, center, self.CELL_SIZE // 2 - 1, 3)
+        self._last_move_ring = ring.convert_alpha()
+    
+    def _build_hud_surfaces(self):
+        """Pre-render the translucent HUD panels (timer, pause info, AI debug)"""
+        self._timer_bg_surface = pygame.Surface((130, 50))
+        self._timer_bg_surface.fill((20, 20, 30))  # Dark background
+        self._timer_bg_surface = self._timer_bg_surface.convert()
+        self._timer_bg_surface.set_alpha(240)
+        
+        self._pause_bg_surface = pygame.Surface((220, 42))
+        self._pause_bg_surface.fill((20, 20, 30))  # Dark background
+        self._pause_bg_surface = self._pause_bg_surface.convert()
+        self._pause_bg_surface.set_alpha(240)
+        
+        # Debug panel background with its accent border baked in
+        self._debug_panel_surface = pygame.Surface((260, 300), pygame.SRCALPHA)
+        self._debug_panel_surface.fill((10, 10, 20, 240))  # Very dark background
+        pygame.draw.rect(self._debug_panel_surface, Colors.ACCENT, self._debug_panel_surface.get_rect(), 3)
+        self._debug_panel_surface = self._debug_panel_surface.convert_alpha()
+        
+        # Game info panels depend on player count and mode, built per size on demand
+        self._info_panels = {}
+        self._timer_rect = pygame.Rect(self.WINDOW_WIDTH - 180, 20, 130, 50)
+        
+        # Pause menu countdown box; its label is re-rendered when the second changes
+        self._pause_countdown_rect = pygame.Rect(self.WINDOW_WIDTH // 2 - 80, 180, 160, 50)
+        self._pause_countdown_box = pygame.Surface(self._pause_countdown_rect.size)
+        self._pause_countdown_box.fill(Colors.BACKGROUND)
+        pygame.draw.rect(self._pause_countdown_box, Colors.WARNING, self._pause_countdown_box.get_rect(), 2)
+        self._pause_countdown_box = self._pause_countdown_box.convert()
+        self._last_pause_remaining = None
+        self._pause_text_blit = None
+        
+        self._pause_icon_surface_off = self._build_list_icon((100, 100, 100, 180))
+        self._pause_icon_surface_on = self._build_list_icon((70, 130, 180, 220))
+    
+    def _build_overlay_surfaces(self):
+        """Pre-render the screen dimmers, menu glow and server list panel surfaces"""
+        self._dim_overlay = self._build_dim_overlay(128)
+        self._disconnect_overlay = self._build_dim_overlay(180)
+        self._connection_lost_overlay = self._build_dim_overlay(200)
+        
+        title_width, title_height = self.font_large.size("GOMOKU")
+        self._title_glow_surface = pygame.Surface((title_width + 20, title_height + 20))
+        self._title_glow_surface.fill(Colors.ACCENT)
+        self._title_glow_surface = self._title_glow_surface.convert()
+        self._title_glow_surface.set_alpha(30)
+        
+        # Three faint 3px glow lines, each one row lower, under the solid
+        # accent line; all one colour, so their alphas combine per row
+        self._title_glow_strip = pygame.Surface((201, 5), pygame.SRCALPHA)
+        self._title_glow_strip.fill((*Colors.ACCENT, 0))
+        row_alpha = [0] * 5
+        for i in range(3):
+            alpha = 20 - i * 5
+            for row in range(i, i + 3):
+                row_alpha[row] += alpha - row_alpha[row] * alpha // 255
+        for row, alpha in enumerate(row_alpha):
+            self._title_glow_strip.fill((*Colors.ACCENT, alpha), (0, row, 200, 1))
+        pygame.draw.line(self._title_glow_strip, Colors.ACCENT, (0, 1), (200, 1), 3)
+        self._title_glow_strip = self._title_glow_strip.convert_alpha()
+        
+        self._server_panel_surface = pygame.Surface((640, 65))
+        self._server_panel_surface.fill((20, 20, 30))
+        self._server_panel_surface = self._server_panel_surface.convert()
+        self._server_panel_surface.set_alpha(180)
+        
+        self._selected_panel_border = pygame.Surface(self._server_panel_surface.get_size(), pygame.SRCALPHA)
+        pygame.draw.rect(self._selected_panel_border, Colors.SUCCESS, self._selected_panel_border.get_rect(), 3)
+        self._selected_panel_border = self._selected_panel_border.convert_alpha()
+    
+    def _build_dim_overlay(self, alpha: int) -> pygame.Surface:
+        """Full-window black surface blended at the given alpha"""
+        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        overlay.fill(Colors.BLACK)
+        overlay = overlay.convert()
+        overlay.set_alpha(alpha)
+        return overlay
     
-    def _highlight_last_move(self, row: int, col: int):
-        """Highlight the last move"""
-        center_x = self.BOARD_OFFSET_X + col * self.CELL_SIZE + self.CELL_SIZE // 2
-        center_y = self.BOARD_OFFSET_Y + row * self.CELL_SIZE + self.CELL_SIZE // 2
-        radius = self.CELL_SIZE // 2 - 1
+    def _build_instruction_blits(self):
+        """Pre-render the fixed instruction lines of the server and lobby screens"""
+        server_instructions = [
+            "Click on a server to select it",
+            "Press Enter to continue with selected server",
+            "ESC to go back"
+        ]
+        self._server_select_instructions = []
+        for i, instruction in enumerate(server_instructions):
+            text_shadow = self._render_cached(self.font_small, instruction, (0, 0, 0))
+            self._server_select_instructions.append(
+                (text_shadow, text_shadow.get_rect(center=(self.WINDOW_WIDTH // 2 + 1, 450 + i * 22 + 1))))
+            text = self._render_cached(self.font_small, instruction, Colors.WHITE)
+            self._server_select_instructions.append(
+                (text, text.get_rect(center=(self.WINDOW_WIDTH // 2, 450 + i * 22))))
+        
+        lobby_instructions = [
+            "Click on a room to select it",
+            "Use buttons below to create, join, or refresh"
+        ]
+        self._lobby_instructions = []
+        for i, instruction in enumerate(lobby_instructions):
+            text = self.font_small.render(instruction, True, Colors.GRAY).convert_alpha()
+            self._lobby_instructions.append((text, text.get_rect(center=(self.WINDOW_WIDTH // 2, 450 + i * 25))))
+    
+    def _build_list_icon(self, button_color: Tuple[int, int, int, int]) -> pygame.Surface:
+        """Render the pause-info toggle: a rounded button with a list icon"""
+        width, height = self.pause_icon_rect.size
+        button_surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(button_surface, button_color, (0, 0, width, height), 0, 5)
+        
+        # Draw list icon (three horizontal lines)
+        line_height = 2
+        line_gap = 4
+        line_width = 16
         
-        pygame.draw.circle(self.screen, Colors.RED, (center_x, center_y), radius, 3)
+        for i in range(3):
+            y_pos = height // 2 - line_gap + (i * (line_height + line_gap)) - 2
+            pygame.draw.rect(button_surface, (255, 255, 255),
+                             ((width - line_width) // 2, y_pos, line_width, line_height), 0, 2)
+        
+        return button_surface.convert_alpha()
+    
+    def _render_cached(self, font: pygame.font.Font, text: str,
+                       color: Tuple[int, int, int]) -> pygame.Surface:
+        """Render text once and reuse the surface while it stays the same"""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Countdown values and pause counts churn; keep the cache small
+            if len(self._text_cache) >= 512:
+                self._text_cache.clear()
+                self._text_shapes.clear()
+            shape = self._text_shapes.get((font, text))
+            if shape is None:
+                surface = font.render(text, True, color).convert_alpha()
+                self._text_shapes[(font, text)] = surface
+            else:
+                # Same glyph coverage in another colour (e.g. the drop shadow
+                # of a label): recolour a copy instead of rasterising again
+                surface = shape.copy()
+                surface.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+                surface.fill(color, special_flags=pygame.BLEND_RGB_ADD)
+            self._text_cache[key] = surface
+        return surface
+    
+    def _shadowed_blits(self, font: pygame.font.Font, text: str, color: Tuple[int, int, int],
+                        pos: Tuple[int, int]) -> Tuple[Tuple[pygame.Surface, Tuple[int, int]], ...]:
+        """Blit pairs for text with a 1px drop shadow, both from the render cache"""
+        x, y = pos
+        return ((self._render_cached(font, text, (0, 0, 0)), (x + 1, y + 1)),
+                (self._render_cached(font, text, color), pos))
+    
+    def _blit_centered(self, font: pygame.font.Font, text: str,
+                       color: Tuple[int, int, int], center: Tuple[int, int]):
+        """Blit cached text centred on center, reusing its computed position"""
+        key = (font, text, color, center)
+        placed = self._placed_text.get(key)
+        if placed is None:
+            if len(self._placed_text) >= 512:
+                self._placed_text.clear()
+            surface = self._render_cached(font, text, color)
+            placed = self._placed_text[key] = (surface, surface.get_rect(center=center).topleft)
+        self.screen.blit(*placed)
     
     def _draw_game_info(self):
         """Draw game information panel with enhanced visibility and proper text wrapping"""
         info_x = 520  # Adjusted for new board position
         info_y = 120  # Moved up to align with new board position
+        
+        # Everything except the AI thinking line changes only between turns
+        your_role = self.network_game_info.get('your_role', 'black') if self.network_game_info else None
+        key = (self.game.current_player, len(self.game.move_history), tuple(self.game.players),
+               tuple(self.player_names.items()), self.game_mode, self.ai_debug_enabled,
+               self.ai_player is not None, self.ai_difficulty, self.is_network_game,
+               self.waiting_for_network, your_role)
+        if key != self._game_info_key:
+            self._game_info_key = key
+            self._game_info_layout = self._layout_game_info(info_x, info_y, your_role)
+        
+        panel_blit, header_blits, separator, body_blits = self._game_info_layout
+        self.screen.blit(*panel_blit)
+        self.screen.blits(header_blits, False)
+        pygame.draw.line(self.screen, Colors.ACCENT, separator[0], separator[1], 2)
+        self.screen.blits(body_blits, False)
+        
+        # AI info - only show if debug panel is not enabled
+        if self.game_mode == GameMode.AI_GAME and self.ai_player and not self.ai_debug_enabled:
+            ai_y = info_y + 160
+            
+            # Show thinking animation
+            if self.ai_thinking:
+                thinking_time = self._frame_now - self.thinking_start_time
+                dots = "." * (int(thinking_time * 2) % 4)
+                thinking_text = f"AI Thinking{dots}"
+                
+                # Add a subtle pulsing effect
+                pulse = abs(math.sin(thinking_time * 3)) * 0.3 + 0.7
+                thinking_color = (int(100 * pulse), int(200 * pulse), int(255 * pulse))
+                self.screen.blits(self._shadowed_blits(self.font_info, thinking_text, thinking_color,
+                                                       (info_x, ai_y + 29)), False)
+            else:
+                stats = self.ai_player.get_statistics()
+                if stats["nodes_evaluated"] > 0:
+                    stats_text = f"AI Nodes: {stats['nodes_evaluated']}"
+                    self.screen.blits(self._shadowed_blits(self.font_info, stats_text, Colors.WHITE,
+                                                           (info_x, ai_y + 29)), False)
+    
+    def _layout_game_info(self, info_x: int, info_y: int, your_role: Optional[str]) -> tuple:
+        """Render and place the static part of the game info panel"""
         panel_width = 240  # Slightly reduced width to ensure fit
         panel_padding = 15
-        text_margin = 5
         max_text_width = panel_width - (2 * panel_padding) - 20  # Account for padding and scrollbar
         
         # Create semi-transparent background panel for better readability
         # Adjust height based on number of players and debug panel
-        num_players = len(self.game.players) if hasattr(self.game, 'players') else 2
+        num_players = len(self.game.players)
         base_height = 80  # Base height for title and separator
         player_section_height = num_players * 30  # Increased line height for better readability
         moves_section_height = 50  # Moves and mode info
@@ -2177,39 +2690,23 @@ class GomokuUI:
         # Ensure minimum height
         panel_height = max(panel_height, 200)
         
-        # Create panel surface with rounded corners
-        info_panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        # Panel surface with rounded corners, one per panel size
+        info_panel = self._info_panels.get((panel_width, panel_height))
+        if info_panel is None:
+            info_panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            pygame.draw.rect(info_panel, (20, 20, 30, 230), (0, 0, panel_width, panel_height), border_radius=8)
+            pygame.draw.rect(info_panel, Colors.ACCENT, (0, 0, panel_width, panel_height), 3, border_radius=8)
+            info_panel = self._info_panels[(panel_width, panel_height)] = info_panel.convert_alpha()
         
-        # Draw rounded rectangle for panel
-        pygame.draw.rect(info_panel, (20, 20, 30, 230), (0, 0, panel_width, panel_height), border_radius=8)
-        pygame.draw.rect(info_panel, Colors.ACCENT, (0, 0, panel_width, panel_height), 3, border_radius=8)
+        panel_blit = (info_panel, (info_x - panel_padding, info_y - panel_padding))
         
-        self.screen.blit(info_panel, (info_x - panel_padding, info_y - panel_padding))
-        
-        # Helper function to render wrapped text
-        def render_text_with_wrap(text, font, color, x, y, max_width):
-            words = text.split(' ')
-            lines = []
-            current_line = []
-            
-            for word in words:
-                test_line = ' '.join(current_line + [word])
-                test_width = font.size(test_line)[0]
-                
-                if test_width <= max_width:
-                    current_line.append(word)
-                else:
-                    lines.append(' '.join(current_line))
-                    current_line = [word]
-            
-            if current_line:
-                lines.append(' '.join(current_line))
-            
+        # Helper function to lay out wrapped text as shadow + text blits
+        def wrap_text_blits(blits, text, font, color, x, y, max_width):
+            lines = self._wrap_words(text, font, max_width)
             for i, line in enumerate(lines):
-                text_surface = font.render(line, True, color)
-                text_shadow = font.render(line, True, (0, 0, 0))
-                self.screen.blit(text_shadow, (x + 1, y + (i * (font.get_height() + 2)) + 1))
-                self.screen.blit(text_surface, (x, y + (i * (font.get_height() + 2))))
+                line_y = y + (i * (font.get_height() + 2))
+                blits.append((self._render_cached(font, line, (0, 0, 0)), (x + 1, line_y + 1)))
+                blits.append((self._render_cached(font, line, color), (x, line_y)))
             
             return len(lines) * (font.get_height() + 2)
         
@@ -2218,7 +2715,9 @@ class GomokuUI:
         current_text = f"Current Player: {current_player_name}"
         
         # Render current player text with wrapping
-        y_offset = render_text_with_wrap(
+        header_blits = []
+        y_offset = wrap_text_blits(
+            header_blits,
             current_text, 
             self.font_info, 
             Colors.WHITE, 
@@ -2229,54 +2728,50 @@ class GomokuUI:
         
         # Add separator line after current player
         separator_y = info_y + y_offset + 5
-        pygame.draw.line(self.screen, Colors.ACCENT, 
-                        (info_x - 10, separator_y),
-                        (info_x + panel_width - 25, separator_y), 2)
+        separator = ((info_x - 10, separator_y), (info_x + panel_width - 25, separator_y))
         
         # Show all players in the game (supports 2-5 players)
         player_y = separator_y + 10
         line_height = 30  # Increased line height
         
         # Get all players in the game
-        if hasattr(self.game, 'players') and self.game.players:
+        if self.game.players:
             all_players = self.game.players
         else:
             # Fallback for 2-player games
             all_players = [Player.BLACK, Player.WHITE]
         
-        # Player symbols/colors mapping
-        player_symbols = {
-            Player.BLACK: "●",
-            Player.WHITE: "○",
-            Player.RED: "◆",
-            Player.BLUE: "■",
-            Player.GREEN: "▲"
-        }
-        
         # Show all players with current player highlighting
+        body_blits = []
+        player_names = self.player_names
+        current_player = self.game.current_player
+        player_font = self.font_small  # Slightly smaller font for player info
+        
+        # "(YOU)" indicator ONLY for network games (not AI games)
+        you = None
+        if self.is_network_game and your_role:
+            you = {'black': Player.BLACK, 'white': Player.WHITE}.get(your_role)
+        
         for i, player in enumerate(all_players):
-            player_name = self.player_names.get(player, f"Player {i+1}")
-            symbol = player_symbols.get(player, "●")
+            player_name = player_names.get(player, f"Player {i+1}")
+            symbol = PLAYER_SYMBOLS.get(player, "●")
             
             # Highlight current player with green color
-            if self.game.current_player == player:
+            if player is current_player:
                 player_color = Colors.SUCCESS  # Green for current player
                 player_text = f"{symbol} {player_name} ←"
             else:
                 player_color = Colors.WHITE
                 player_text = f"{symbol} {player_name}"
             
-            # Add "(YOU)" indicator ONLY for network games (not AI games)
-            if self.is_network_game and hasattr(self, 'network_game_info'):
-                your_role = self.network_game_info.get('your_role', 'black')
-                if (your_role == 'black' and player == Player.BLACK) or \
-                   (your_role == 'white' and player == Player.WHITE):
-                    player_text += " (YOU)"
+            if player is you:
+                player_text += " (YOU)"
             
             # Draw player info with wrapping
-            lines_used = render_text_with_wrap(
+            lines_used = wrap_text_blits(
+                body_blits,
                 player_text,
-                self.font_small,  # Slightly smaller font for player info
+                player_font,
                 player_color,
                 info_x,
                 player_y,
@@ -2288,49 +2783,15 @@ class GomokuUI:
         # Move count - positioned after all players
         move_y = player_y + 10  # Add spacing after players
         move_text = f"Moves: {len(self.game.move_history)}"
-        move_shadow = self.font_info.render(move_text, True, (0, 0, 0))
-        self.screen.blit(move_shadow, (info_x + 1, move_y + 1))
-        move_surface = self.font_info.render(move_text, True, Colors.WHITE)
-        self.screen.blit(move_surface, (info_x, move_y))
-        
-        # Game mode - positioned after move count
-        mode_y = move_y + 28
-        mode_text = f"Mode: {self.game_mode.value.replace('_', ' ').title()}"
-        # mode_shadow = self.font_info.render(mode_text, True, (0, 0, 0))
-        # self.screen.blit(mode_shadow, (info_x + 1, mode_y + 1))
-        # mode_surface = self.font_info.render(mode_text, True, Colors.WHITE)
-        # self.screen.blit(mode_surface, (info_x, mode_y))
+        body_blits.append((self._render_cached(self.font_info, move_text, (0, 0, 0)), (info_x + 1, move_y + 1)))
+        body_blits.append((self._render_cached(self.font_info, move_text, Colors.WHITE), (info_x, move_y)))
         
         # AI info - only show if debug panel is not enabled
         if self.game_mode == GameMode.AI_GAME and self.ai_player and not self.ai_debug_enabled:
             ai_y = info_y + 160
             ai_text = f"AI Difficulty: {self.ai_difficulty.title()}"
-            ai_shadow = self.font_info.render(ai_text, True, (0, 0, 0))
-            self.screen.blit(ai_shadow, (info_x + 1, ai_y + 1))
-            ai_surface = self.font_info.render(ai_text, True, Colors.WHITE)
-            self.screen.blit(ai_surface, (info_x, ai_y))
-            
-            # Show thinking animation
-            if self.ai_thinking:
-                thinking_time = time.time() - self.thinking_start_time
-                dots = "." * (int(thinking_time * 2) % 4)
-                thinking_text = f"AI Thinking{dots}"
-                
-                # Add a subtle pulsing effect
-                pulse = abs(math.sin(thinking_time * 3)) * 0.3 + 0.7
-                thinking_color = (int(100 * pulse), int(200 * pulse), int(255 * pulse))
-                thinking_shadow = self.font_info.render(thinking_text, True, (0, 0, 0))
-                self.screen.blit(thinking_shadow, (info_x + 1, ai_y + 30))
-                thinking_surface = self.font_info.render(thinking_text, True, thinking_color)
-                self.screen.blit(thinking_surface, (info_x, ai_y + 29))
-            else:
-                stats = self.ai_player.get_statistics()
-                if stats["nodes_evaluated"] > 0:
-                    stats_text = f"AI Nodes: {stats['nodes_evaluated']}"
-                    stats_shadow = self.font_info.render(stats_text, True, (0, 0, 0))
-                    self.screen.blit(stats_shadow, (info_x + 1, ai_y + 30))
-                    stats_surface = self.font_info.render(stats_text, True, Colors.WHITE)
-                    self.screen.blit(stats_surface, (info_x, ai_y + 29))
+            body_blits.append((self._render_cached(self.font_info, ai_text, (0, 0, 0)), (info_x + 1, ai_y + 1)))
+            body_blits.append((self._render_cached(self.font_info, ai_text, Colors.WHITE), (info_x, ai_y)))
         
         # Network info
         if self.is_network_game:
@@ -2341,36 +2802,82 @@ class GomokuUI:
                 network_text = "Network Game Active"
                 color = Colors.SUCCESS
             
-            network_shadow = self.font_info.render(network_text, True, (0, 0, 0))
-            self.screen.blit(network_shadow, (info_x + 1, info_y + 215))
-            network_surface = self.font_info.render(network_text, True, color)
-            self.screen.blit(network_surface, (info_x, info_y + 214))
+            body_blits.append((self._render_cached(self.font_info, network_text, (0, 0, 0)), (info_x + 1, info_y + 215)))
+            body_blits.append((self._render_cached(self.font_info, network_text, color), (info_x, info_y + 214)))
+        
+        return panel_blit, header_blits, separator, body_blits
+    
+    def _wrap_words(self, text: str, font: pygame.font.Font, max_width: int) -> List[str]:
+        """Greedily wrap text at spaces, summing cached word widths"""
+        wrap_key = (font, text, max_width)
+        lines = self._wrapped_lines.get(wrap_key)
+        if lines is not None:
+            return lines
+        if len(self._wrapped_lines) >= 256:
+            self._wrapped_lines.clear()
+        
+        widths = self._word_widths
+        if len(widths) >= 1024:
+            widths.clear()
+        space_width = font.size(' ')[0]
+        
+        lines = []
+        current_line = []
+        line_width = 0
+        for word in text.split(' '):
+            word_width = widths.get((font, word))
+            if word_width is None:
+                word_width = widths[(font, word)] = font.size(word)[0]
+            
+            test_width = line_width + space_width + word_width if current_line else word_width
+            if test_width <= max_width:
+                current_line.append(word)
+                line_width = test_width
+            else:
+                lines.append(' '.join(current_line))
+                current_line = [word]
+                line_width = word_width
+        
+        if current_line:
+            lines.append(' '.join(current_line))
+        self._wrapped_lines[wrap_key] = lines
+        return lines
     
     def _draw_ai_debug_panel(self):
         """Draw AI debug information panel with real-time thinking display"""
         panel_x = 520
         panel_y = 340  # Moved up slightly to avoid overlap
-        panel_width = 260
-        panel_height = 300  # Increased height for real-time moves
         
-        # Background panel with padding
+        # Background panel with padding, border included
         panel_padding = 15
-        debug_panel = pygame.Surface((panel_width, panel_height))
-        debug_panel.set_alpha(240)
-        debug_panel.fill((10, 10, 20))  # Very dark background
-        self.screen.blit(debug_panel, (panel_x - panel_padding, panel_y - panel_padding))
+        self.screen.blit(self._debug_panel_surface, (panel_x - panel_padding, panel_y - panel_padding))
         
-        # Border
-        border_rect = pygame.Rect(panel_x - panel_padding, panel_y - panel_padding, 
-                                 panel_width, panel_height)
-        pygame.draw.rect(self.screen, Colors.ACCENT, border_rect, 3)
+        # Get real-time stats if AI is thinking
+        real_time_stats = None
+        if self.ai_thinking and self.ai_player:
+            real_time_stats = self.ai_player.get_real_time_stats()
+        
+        # Only lay the text out again when the shown stats change
+        if real_time_stats and real_time_stats.get("is_thinking"):
+            key = (True, real_time_stats.get("current_depth", 0), real_time_stats.get("nodes_evaluated", 0),
+                   real_time_stats.get("best_move_so_far"), real_time_stats.get("best_score_so_far"),
+                   tuple((info.get("move"), info.get("status"), info.get("score"))
+                         for info in real_time_stats.get("current_moves", [])[:5]))
+        else:
+            key = (False, self.ai_debug_stats)
+        if key != self._ai_debug_key:
+            self._ai_debug_key = key
+            self._ai_debug_blits = self._layout_ai_debug_panel(panel_x, panel_y, real_time_stats)
+        
+        self.screen.blits(self._ai_debug_blits, False)
+    
+    def _layout_ai_debug_panel(self, panel_x: int, panel_y: int, real_time_stats: Optional[dict]) -> list:
+        """Render and place the AI debug panel text as shadow + text blits"""
+        blits = []
         
         # Title with larger font
         title_text = "AI Debug Info (Press D)"
-        title_shadow = self.font_info.render(title_text, True, (0, 0, 0))
-        self.screen.blit(title_shadow, (panel_x + 1, panel_y + 1))
-        title = self.font_info.render(title_text, True, Colors.ACCENT)
-        self.screen.blit(title, (panel_x, panel_y))
+        blits.extend(self._shadowed_blits(self.font_info, title_text, Colors.ACCENT, (panel_x, panel_y)))
         
         y_offset = panel_y + 30  # More spacing
         line_height = 20  # Line height for better readability
@@ -2378,27 +2885,16 @@ class GomokuUI:
         # Use larger font for better readability
         debug_font = self.font_small  # Use smaller font to fit more info
         
-        # Get real-time stats if AI is thinking
-        real_time_stats = None
-        if self.ai_thinking and self.ai_player:
-            real_time_stats = self.ai_player.get_real_time_stats()
-        
         # Show real-time thinking info if available
         if real_time_stats and real_time_stats.get("is_thinking"):
             # Current depth
             depth_text = f"Depth: {real_time_stats.get('current_depth', 0)}"
-            depth_shadow = debug_font.render(depth_text, True, (0, 0, 0))
-            self.screen.blit(depth_shadow, (panel_x + 1, y_offset + 1))
-            depth_surf = debug_font.render(depth_text, True, Colors.WHITE)
-            self.screen.blit(depth_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, depth_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height
             
             # Nodes evaluated so far
             nodes_text = f"Nodes: {real_time_stats.get('nodes_evaluated', 0)}"
-            nodes_shadow = debug_font.render(nodes_text, True, (0, 0, 0))
-            self.screen.blit(nodes_shadow, (panel_x + 1, y_offset + 1))
-            nodes_surf = debug_font.render(nodes_text, True, Colors.WHITE)
-            self.screen.blit(nodes_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, nodes_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height
             
             # Best move so far
@@ -2406,20 +2902,14 @@ class GomokuUI:
             best_score = real_time_stats.get("best_score_so_far", float('-inf'))
             if best_move is not None:
                 best_text = f"Best: ({best_move[0]},{best_move[1]})={best_score:.0f}"
-                best_shadow = debug_font.render(best_text, True, (0, 0, 0))
-                self.screen.blit(best_shadow, (panel_x + 1, y_offset + 1))
-                best_surf = debug_font.render(best_text, True, Colors.SUCCESS)
-                self.screen.blit(best_surf, (panel_x, y_offset))
+                blits.extend(self._shadowed_blits(debug_font, best_text, Colors.SUCCESS, (panel_x, y_offset)))
                 y_offset += line_height + 5
             
             # Current moves being evaluated
             current_moves = real_time_stats.get("current_moves", [])
             if current_moves:
                 evaluating_text = "Evaluating Moves:"
-                eval_shadow = debug_font.render(evaluating_text, True, (0, 0, 0))
-                self.screen.blit(eval_shadow, (panel_x + 1, y_offset + 1))
-                eval_surf = debug_font.render(evaluating_text, True, Colors.ACCENT)
-                self.screen.blit(eval_surf, (panel_x, y_offset))
+                blits.extend(self._shadowed_blits(debug_font, evaluating_text, Colors.ACCENT, (panel_x, y_offset)))
                 y_offset += line_height
                 
                 # Show top moves being evaluated (up to 5)
@@ -2439,96 +2929,69 @@ class GomokuUI:
                             move_text = f"  {i+1}. ({move[0]},{move[1]})"
                             move_color = Colors.WHITE
                     
-                    move_shadow = debug_font.render(move_text, True, (0, 0, 0))
-                    self.screen.blit(move_shadow, (panel_x + 1, y_offset + 1))
-                    move_surf = debug_font.render(move_text, True, move_color)
-                    self.screen.blit(move_surf, (panel_x, y_offset))
+                    blits.extend(self._shadowed_blits(debug_font, move_text, move_color, (panel_x, y_offset)))
                     y_offset += line_height - 2
         
         # Show final stats if available (after thinking is done)
         elif self.ai_debug_stats:
             # Nodes evaluated
             nodes_text = f"Nodes: {self.ai_debug_stats['nodes_evaluated']}"
-            nodes_shadow = debug_font.render(nodes_text, True, (0, 0, 0))
-            self.screen.blit(nodes_shadow, (panel_x + 1, y_offset + 1))
-            nodes_surf = debug_font.render(nodes_text, True, Colors.WHITE)
-            self.screen.blit(nodes_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, nodes_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height
             
             # Pruning count
             pruning_text = f"Prunings: {self.ai_debug_stats['pruning_count']}"
-            pruning_shadow = debug_font.render(pruning_text, True, (0, 0, 0))
-            self.screen.blit(pruning_shadow, (panel_x + 1, y_offset + 1))
-            pruning_surf = debug_font.render(pruning_text, True, Colors.SUCCESS)
-            self.screen.blit(pruning_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, pruning_text, Colors.SUCCESS, (panel_x, y_offset)))
             y_offset += line_height
             
             # Pruning efficiency
             efficiency = self.ai_debug_stats.get('pruning_efficiency', 0)
             eff_text = f"Efficiency: {efficiency:.1f}%"
-            eff_shadow = debug_font.render(eff_text, True, (0, 0, 0))
-            self.screen.blit(eff_shadow, (panel_x + 1, y_offset + 1))
             eff_color = Colors.SUCCESS if efficiency > 20 else Colors.WARNING
-            eff_surf = debug_font.render(eff_text, True, eff_color)
-            self.screen.blit(eff_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, eff_text, eff_color, (panel_x, y_offset)))
             y_offset += line_height
             
             # Max depth
             depth_text = f"Max Depth: {self.ai_debug_stats.get('max_depth_reached', 0)}"
-            depth_shadow = debug_font.render(depth_text, True, (0, 0, 0))
-            self.screen.blit(depth_shadow, (panel_x + 1, y_offset + 1))
-            depth_surf = debug_font.render(depth_text, True, Colors.WHITE)
-            self.screen.blit(depth_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, depth_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height
             
             # Search time
             time_text = f"Time: {self.ai_debug_stats.get('search_time', 0):.3f}s"
-            time_shadow = debug_font.render(time_text, True, (0, 0, 0))
-            self.screen.blit(time_shadow, (panel_x + 1, y_offset + 1))
-            time_surf = debug_font.render(time_text, True, Colors.WHITE)
-            self.screen.blit(time_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, time_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height
             
             # Nodes per second
             nps = self.ai_debug_stats.get('nodes_per_second', 0)
             nps_text = f"Nodes/s: {nps:.0f}"
-            nps_shadow = debug_font.render(nps_text, True, (0, 0, 0))
-            self.screen.blit(nps_shadow, (panel_x + 1, y_offset + 1))
-            nps_surf = debug_font.render(nps_text, True, Colors.WHITE)
-            self.screen.blit(nps_surf, (panel_x, y_offset))
+            blits.extend(self._shadowed_blits(debug_font, nps_text, Colors.WHITE, (panel_x, y_offset)))
             y_offset += line_height + 5
             
             # Top move evaluations with scores
             move_evals = self.ai_debug_stats.get('move_evaluations', [])
             if move_evals:
-                sorted_moves = sorted(move_evals, key=lambda x: x['score'], reverse=True)
+                top_moves = heapq.nlargest(5, move_evals, key=itemgetter('score'))
                 top_moves_text = "Final Top Moves:"
-                top_shadow = debug_font.render(top_moves_text, True, (0, 0, 0))
-                self.screen.blit(top_shadow, (panel_x + 1, y_offset + 1))
-                top_surf = debug_font.render(top_moves_text, True, Colors.ACCENT)
-                self.screen.blit(top_surf, (panel_x, y_offset))
+                blits.extend(self._shadowed_blits(debug_font, top_moves_text, Colors.ACCENT, (panel_x, y_offset)))
                 y_offset += line_height
                 
                 # Show top 5 moves with scores
-                for i, eval_info in enumerate(sorted_moves[:5]):
+                for i, eval_info in enumerate(top_moves):
                     move = eval_info['move']
                     score = eval_info['score']
                     move_text = f"{i+1}. ({move[0]},{move[1]}) Score: {score:.0f}"
-                    move_shadow = debug_font.render(move_text, True, (0, 0, 0))
-                    self.screen.blit(move_shadow, (panel_x + 1, y_offset + 1))
                     move_color = Colors.SUCCESS if i == 0 else Colors.WHITE
-                    move_surf = debug_font.render(move_text, True, move_color)
-                    self.screen.blit(move_surf, (panel_x, y_offset))
+                    blits.extend(self._shadowed_blits(debug_font, move_text, move_color, (panel_x, y_offset)))
                     y_offset += line_height - 2
+        
+        return blits
     
     def _get_board_position(self, mouse_pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convert mouse position to board coordinates"""
         x, y = mouse_pos
         
-        if (x < self.BOARD_OFFSET_X or x > self.BOARD_OFFSET_X + self.BOARD_SIZE or
-            y < self.BOARD_OFFSET_Y or y > self.BOARD_OFFSET_Y + self.BOARD_SIZE):
-            return None
-        
+        # Floor division sends positions left of or above the board below zero,
+        # so the cell range check alone covers the board bounds
         col = (x - self.BOARD_OFFSET_X) // self.CELL_SIZE
         row = (y - self.BOARD_OFFSET_Y) // self.CELL_SIZE
         
@@ -2539,28 +3002,24 @@ class GomokuUI:
     
     def _can_make_move(self) -> bool:
         """Check if the current player can make a move"""
-        if self.game.game_state != GameState.PLAYING:
-            return False
-        
-        if self.is_network_game and self.game.current_player != self.my_player:
-            print(f"🚫 Cannot make move: current_player={self.game.current_player.name}, my_player={self.my_player.name if self.my_player else 'None'}")
+        # Prevent moves while AI is thinking
+        if self.ai_thinking or self.game.game_state is not GameState.PLAYING:
             return False
         
-        if self.game_mode == GameMode.AI_GAME and self.game.current_player != Player.BLACK:
+        current_player = self.game.current_player
+        if self.is_network_game and current_player is not self.my_player:
+            print(f"🚫 Cannot make move: current_player={current_player.name}, my_player={self.my_player.name if self.my_player else 'None'}")
             return False
         
-        # Prevent moves while AI is thinking
-        if self.ai_thinking:
-            return False
-        
-        return True
+        # The human always plays black against the AI
+        return self.game_mode != GameMode.AI_GAME or current_player is Player.BLACK
     
     def _make_move(self, row: int, col: int):
         """Make a move on the board"""
         if self.game.make_move(row, col):
             self.last_move_pos = (row, col)
             # Reset turn timer after valid move
-            self.turn_start_time = time.time()  
+            self.turn_start_time = time.monotonic()  
             self.elapsed_before_pause = 0
             
             # Play turn sound
@@ -2581,41 +3040,41 @@ class GomokuUI:
     def _handle_network_move(self, row: int, col: int, timer_state: Dict[str, Any] = None):
         """Handle a move received from the network"""
         try:
-            if self.game.is_valid_move(row, col):
-                if self.game.make_move(row, col):
-                    self.last_move_pos = (row, col)
-                    
-                    # Sync timer with server's timer state (if provided)
-                    if timer_state:
-                        server_turn_start = timer_state.get("turn_start_time")
-                        self.move_time_limit = timer_state.get("move_time_limit", 30)
-                        if server_turn_start:
-                            # Calculate time since server set the timer
-                            time_since_server_reset = time.time() - server_turn_start
-                            self.turn_start_time = time.time()
-                            self.elapsed_before_pause = time_since_server_reset
-                        else:
-                            self.turn_start_time = time.time()
-                            self.elapsed_before_pause = 0
-                    else:
-                        # Fallback: reset timer locally (old behavior)
-                        self.turn_start_time = time.time()
-                        self.elapsed_before_pause = 0
-                    
-                    # Play turn sound
-                    self._play_sound("play_turn")
-                    
-                    # Check if game ended (winner)
-                    if self.game.game_state != GameState.PLAYING:
-                        if self.game.game_state in [GameState.BLACK_WINS, GameState.WHITE_WINS]:
-                            self._play_sound("winner")
-                    
-                    print(f"Network move applied: ({row}, {col})")
+            # make_move does its own validity check; a rejected move means the
+            # boards have diverged
+            if not self.game.make_move(row, col):
+                print(f"Invalid network move received: ({row}, {col})")
+                return
+            self.last_move_pos = (row, col)
+            
+            # Sync timer with server's timer state (if provided)
+            if timer_state:
+                server_turn_start = timer_state.get("turn_start_time")
+                self.move_time_limit = timer_state.get("move_time_limit", 30)
+                if server_turn_start:
+                    # Calculate time since server set the timer
+                    time_since_server_reset = self._server_now() - server_turn_start
+                    self.turn_start_time = time.monotonic()
+                    self.elapsed_before_pause = time_since_server_reset
                 else:
-                    print(f"Failed to apply network move: ({row}, {col})")
+                    self.turn_start_time = time.monotonic()
+                    self.elapsed_before_pause = 0
             else:
-                print(f"Invalid network move received: ({row}, {col})")
-        except Exception as e:
+                # Fallback: reset timer locally (old behavior)
+                self.turn_start_time = time.monotonic()
+                self.elapsed_before_pause = 0
+            
+            # Play turn sound
+            self._play_sound("play_turn")
+            
+            # Check if game ended (winner)
+            if self.game.game_state != GameState.PLAYING:
+                if self.game.game_state in [GameState.BLACK_WINS, GameState.WHITE_WINS]:
+                    self._play_sound("winner")
+            
+            print(f"Network move applied: ({row}, {col})")
+        except (TypeError, ValueError, IndexError, AttributeError) as e:
+            # Malformed coordinates or timer fields from the wire
             print(f"Error handling network move: {e}")
     
     def _start_new_game(self):
@@ -2624,16 +3083,18 @@ class GomokuUI:
         self.turn_start_time = None
         self.elapsed_before_pause = 0
         self.paused = False
-        self.pause_sent = False
         self.pause_start_time = None
         # Reset pause allowances for both players
         self.pause_allowance = {Player.BLACK: 2, Player.WHITE: 2}
         # Clean up any running AI threads
         self.ai_thinking = False
-        self.ai_move_result = None
+        self._active_ai = None
+        self._ai_move_ready = False
+        self._ai_move = None
         if self.ai_thread and self.ai_thread.is_alive():
-            # Thread will finish naturally since it's daemon
-            pass
+            # Thread will finish naturally since it's daemon; its AI players
+            # are still searching, so don't hand them to the new game
+            self._ai_pool = {}
         
         # Initialize game with correct number of players
         if self.game_mode == GameMode.AI_GAME:
@@ -2644,17 +3105,24 @@ class GomokuUI:
         
         # Set player names and AI players based on game mode
         if self.game_mode == GameMode.AI_GAME:
+            from ai_player import AIPlayer
+            
             # Create AI players for all non-human players
             self.ai_players = {}
             self.player_names = {
                 Player.BLACK: "You"
             }
             
-            # Create AI for each non-human player
+            # Create AI for each non-human player, reusing those from earlier games
             for i, player in enumerate(self.game.players[1:], 1):  # Skip BLACK (human)
-                self.ai_players[player] = AIPlayer(player, self.ai_difficulty)
-                player_color = player.name.title()
+                ai = self._ai_pool.get((player, self.ai_difficulty))
+                if ai is None:
+                    ai = self._ai_pool[(player, self.ai_difficulty)] = AIPlayer(player, self.ai_difficulty)
+                else:
+                    ai.reset()
+                self.ai_players[player] = ai
                 self.player_names[player] = f"AI {i} ({self.ai_difficulty.title()})"
+            self._pause_info_dirty = True
             
             # For backward compatibility, keep ai_player for single AI games
             if self.num_ai_players == 2:
@@ -2690,8 +3158,6 @@ class GomokuUI:
     def _save_game(self):
         """Save current game state"""
         try:
-            import json
-            
             game_data = {
                 "board": [[cell.value for cell in row] for row in self.game.board],
                 "current_player": self.game.current_player.value,
@@ -2700,43 +3166,71 @@ class GomokuUI:
                 "ai_difficulty": self.ai_difficulty if self.game_mode == GameMode.AI_GAME else None
             }
             
-            with open("saved_game.json", "w") as f:
-                json.dump(game_data, f)
+            # Hand the snapshot to the writer thread, replacing one still waiting
+            try:
+                self._save_queue.put_nowait(game_data)
+            except queue.Full:
+                try:
+                    self._save_queue.get_nowait()
+                    self._save_queue.task_done()
+                except queue.Empty:
+                    pass
+                self._save_queue.put_nowait(game_data)
             
             self.saved_game_exists = True
-            print("Game saved successfully!")
             
         except Exception as e:
             print(f"Error saving game: {e}")
     
+    def _save_worker(self):
+        """Write queued save snapshots, replacing the save file atomically"""
+        import json
+        
+        while True:
+            game_data = self._save_queue.get()
+            try:
+                with open("saved_game.json.tmp", "w") as f:
+                    json.dump(game_data, f)
+                os.replace("saved_game.json.tmp", "saved_game.json")
+                print("Game saved successfully!")
+            except Exception as e:
+                print(f"Error saving game: {e}")
+            finally:
+                self._save_queue.task_done()
+    
     def _load_game(self):
         """Load saved game state"""
         try:
             import json
             
+            # A save may still be on its way to disk
+            self._save_queue.join()
             with open("saved_game.json", "r") as f:
                 game_data = json.load(f)
             
             # Restore game state
             self.game.reset_game()
             
-            # Restore board
-            for row in range(GomokuGame.BOARD_SIZE):
-                for col in range(GomokuGame.BOARD_SIZE):
-                    self.game.board[row][col] = Player(game_data["board"][row][col])
+            # Restore board, mapping saved values straight to Player members
+            size = GomokuGame.BOARD_SIZE
+            board = [[PLAYER_BY_VALUE[value] for value in row[:size]] for row in game_data["board"][:size]]
+            if len(board) < size or any(len(row) < size for row in board):
+                raise ValueError(f"saved board is smaller than {size}x{size}")
+            self.game.board = board
+            self._stone_layer_key = None
             
             # Restore other state
-            self.game.current_player = Player(game_data["current_player"])
+            self.game.current_player = PLAYER_BY_VALUE[game_data["current_player"]]
             self.game_mode = GameMode(game_data["game_mode"])
             
             if game_data.get("ai_difficulty"):
+                from ai_player import AIPlayer
                 self.ai_difficulty = game_data["ai_difficulty"]
                 self.ai_player = AIPlayer(Player.WHITE, self.ai_difficulty)
             
             # Restore move history
             for move_data in game_data["move_history"]:
-                from gomoku_game import Move
-                move = Move(move_data[0], move_data[1], Player(move_data[2]))
+                move = Move(move_data[0], move_data[1], PLAYER_BY_VALUE[move_data[2]])
                 self.game.move_history.append(move)
             
             if self.game.move_history:
@@ -2785,509 +3279,39 @@ class GomokuUI:
     def _connect_to_lobby(self):
         """Connect to lobby with player name"""
         try:
+            from stable_client import StableGomokuClient
             self.network_manager = StableGomokuClient()
-            
-            # Set up message handlers
-            def handle_connect():
-                print(f"Connected to lobby as {self.player_name}")
-                # Join lobby with player name
-                self.network_manager.join_lobby(self.player_name)
-                self.ui_state = UIState.LOBBY_BROWSER
-                self._refresh_room_list()
-            
-            def handle_disconnect():
-                """Handle disconnection from server"""
-                print("Disconnected from lobby")
-                
-                # Handle different states appropriately
-                if self.ui_state in [UIState.LOBBY_BROWSER, UIState.ROOM_CREATE, UIState.ROOM_WAITING]:
-                    self.ui_state = UIState.MAIN_MENU
-                elif self.ui_state in [UIState.GAMEPLAY, UIState.PAUSE_MENU]:
-                    # If in gameplay, this means the connection was lost
-                    # The opponent disconnect handler should have been triggered
-                    # If not, show a generic disconnect message
-                    if self.ui_state != UIState.OPPONENT_DISCONNECTED and self.ui_state != UIState.CONNECTION_LOST:
-                        self.disconnect_reason = "Connection to server lost"
-                        self.ui_state = UIState.MAIN_MENU
-            
-            def handle_room_list(data):
-                self.current_room_list = data.get("rooms", [])
-                print(f"Received room list: {len(self.current_room_list)} rooms")
-            
-            def handle_room_info(data):
-                if data.get("success"):
-                    self.room_info = data.get("room_info")
-                    if self.room_info:
-                        self.room_id = self.room_info.get("room_id")
-                        message = data.get("message", "")
-                        print(f"Joined/Created room: {self.room_info}")
-                        print(f"Room info message: {message}")
-                        
-                        # Check if we became host (e.g., after opponent left)
-                        if "You are now the host!" in message or "You are the host" in message:
-                            print(f"👑 You became/are the host of the room!")
-                            # If we're in gameplay or game over, this means opponent left
-                            # We should go back to waiting room
-                            if self.ui_state in [UIState.GAMEPLAY, UIState.GAME_OVER, UIState.PAUSE_MENU]:
-                                self.game.reset_game()
-                                self.ui_state = UIState.ROOM_WAITING
-                                self._stop_background_music()
-                                print(f"📋 Opponent left during game - returned to waiting room as host")
-
-                        # Store reconnect info
-                        self.reconnect_info = {
-                            "player_name": self.player_name,
-                            "room_id": self.room_id
-                        }
-                        print(f"Reconnection info stored: {self.reconnect_info}")
-
-                        # Only set to ROOM_WAITING if we're not already in a game state
-                        if self.ui_state not in [UIState.GAMEPLAY, UIState.PAUSE_MENU, UIState.GAME_OVER]:
-                            self.ui_state = UIState.ROOM_WAITING
-                    
-            def handle_player_pause(data):
-                sender = data.get("player", "Unknown")
-                remaining_turn = data.get("remaining_turn", None)
-                pauses_remaining = data.get("pauses_remaining", None)
-                pause_timestamp = data.get("pause_timestamp", None)
-                print(f"🔶 Received pause signal from {sender}")
-
-                # Freeze game on both sides
-                self.paused = True
-                self.ui_state = UIState.PAUSE_MENU
-                
-                # Synchronize pause start time with the initiator's timestamp
-                if pause_timestamp is not None:
-                    self.pause_start_time = pause_timestamp
-                    print(f"Synchronized pause start time with initiator")
-                else:
-                    self.pause_start_time = time.time()  # Fallback to local time
-                
-                # Record who paused — determine opponent
-                if self.my_player == Player.BLACK:
-                    self.pause_initiator = Player.WHITE
-                else:
-                    self.pause_initiator = Player.BLACK
-
-                # Synchronize pause count from the pauser
-                if pauses_remaining is not None:
-                    self.pause_allowance[self.pause_initiator] = pauses_remaining
-                    print(f"Synchronized pause count for {self.pause_initiator.name}: {pauses_remaining} remaining")
-
-                # Synchronize timer with sender
-                if remaining_turn is not None:
-                    self.turn_start_time = None
-                    self.elapsed_before_pause = self.move_time_limit - remaining_turn
-                    print(f"Synchronized pause — remaining turn time: {remaining_turn}s")
-
-            def handle_player_resume(data):
-                sender = data.get("player", "Unknown")
-                remaining_turn = data.get("remaining_turn", None)
-                print(f"▶️ Received resume signal from {sender}")
-
-                self.paused = False
-                self.pause_start_time = None
-                self.ui_state = UIState.GAMEPLAY
-                self.pause_initiator = None  # Reset pause owner
-
-                # Sync countdown continuation
-                if remaining_turn is not None:
-                    self.elapsed_before_pause = self.move_time_limit - remaining_turn
-                    self.turn_start_time = time.time()
-                    print(f"Synchronized resume — remaining turn: {remaining_turn}s")
-            
-            def handle_game_start(data):
-                print("Game starting!")
-                print(f"Game start data: {data}")
-                
-                # Extract player role and names from server
-                your_role = data.get('your_role', 'black')  # 'black' or 'white'
-                your_name = data.get('your_name', self.player_name)
-                opponent_name = data.get('opponent_name', 'Opponent')
-                players_dict = data.get('players', {})
-                your_turn = data.get('your_turn', True)
-                
-                # Set network game info
-                self.network_game_info = {
-                    'your_role': your_role,
-                    'your_name': your_name,
-                    'opponent_name': opponent_name,
-                    'players': players_dict,
-                    'your_turn': your_turn
-                }
-                
-                print(f"You are: {your_name} ({your_role})")
-                print(f"Opponent: {opponent_name}")
-                print(f"Your turn: {your_turn}")
-                
-                self._start_network_game()
-            
-            def handle_game_move(data):
-                print(f"Received move from {data.get('player', 'Unknown')}: ({data.get('row')}, {data.get('col')})")
-                if 'row' in data and 'col' in data:
-                    timer_state = data.get('timer_state')
-                    self._handle_network_move(data['row'], data['col'], timer_state)
-            
-            def handle_timer_sync(data):
-                """Handle timer synchronization from server"""
-                timer_state = data.get('timer_state')
-                if timer_state:
-                    server_turn_start = timer_state.get("turn_start_time")
-                    self.move_time_limit = timer_state.get("move_time_limit", 30)
-                    if server_turn_start:
-                        time_since_server_reset = time.time() - server_turn_start
-                        self.turn_start_time = time.time()
-                        self.elapsed_before_pause = time_since_server_reset
-                    else:
-                        self.turn_start_time = time.time()
-                        self.elapsed_before_pause = 0
-            
-            def handle_new_game_request(data):
-                print(f"Opponent requested a new game")
-                # Show confirmation dialog or automatically accept
-                # For now, automatically accept
-                if self.network_manager:
-                    self.network_manager.send_message("new_game_response", {
-                        "room_id": data.get("room_id"),
-                        "accepted": True
-                    })
-                    print("Accepted new game request")
-            
-            def handle_new_game_response(data):
-                if data.get("accepted"):
-                    print("Opponent accepted new game!")
-                    self._start_network_game()
-                else:
-                    print("Opponent declined new game")
-            
-            def handle_player_resign(data):
-                """Triggered when opponent resigns"""
-                resigned_player = data.get("player", "Unknown")
-                print(f"🏳️ Opponent {resigned_player} resigned.")
-
-                # End the game correctly
-                if self.my_player == Player.BLACK:
-                    winner = Player.BLACK if self.game.current_player == Player.BLACK else Player.WHITE
-                else:
-                    winner = Player.WHITE if self.game.current_player == Player.WHITE else Player.BLACK
-
-                # Opponent resigned → you are the winner
-                self.game.winner = self.my_player
-                self.game.game_state = (
-                    GameState.BLACK_WINS if self.my_player == Player.BLACK else GameState.WHITE_WINS
-                )
-                self.ui_state = UIState.GAME_OVER
-                print(f"🎉 You win! Opponent {resigned_player} has resigned.")
-
-            def handle_resign_ack(data):
-                """Triggered when server confirms your resignation"""
-                msg = data.get("message", "You have resigned.")
-                print(f"✅ Server acknowledged resignation: {msg}")
-
-                # You lose
-                self.ui_state = UIState.GAME_OVER
-                self.game.game_state = (
-                    GameState.WHITE_WINS if self.my_player == Player.BLACK else GameState.BLACK_WINS
-                )
-                self.game.winner = (
-                    Player.WHITE if self.my_player == Player.BLACK else Player.BLACK
-                )
-                
-            def handle_reconnect_success(data):
-                print("🔁 Reconnected successfully!")
-                self.room_id = data.get("room_id")
-
-                board = data.get("board", [])
-                moves = data.get("moves", [])
-                current_player = data.get("current_player", 1)
-                players = data.get("players", {})
-                game_state_str = data.get("game_state", "playing")
-                your_role = data.get("your_role", "black")
-                your_name = data.get("your_name", "You")
-                timer_state = data.get("timer_state", {})
-
-                try:
-                    # --- � Clear old game state completely ---
-                    self.game.board = [[Player.EMPTY for _ in range(15)] for _ in range(15)]
-                    self.game.move_history.clear()
-                    
-                    # --- �🧠 Rebuild game board from server state ---
-                    if board and isinstance(board[0], list):
-                        for r in range(len(board)):
-                            for c in range(len(board[r])):
-                                cell = board[r][c]
-                                self.game.board[r][c] = Player(cell) if cell in [0, 1, 2] else Player.EMPTY
-
-                    # --- 🧩 Rebuild move history ---
-                    from gomoku_game import Move
-                    for mv in moves:
-                        if isinstance(mv, dict):
-                            row, col = mv.get("row"), mv.get("col")
-                            player_name = mv.get("player")
-                            # Determine player ID by name lookup
-                            if players and player_name == players.get("black"):
-                                player = Player.BLACK
-                            else:
-                                player = Player.WHITE
-                            self.game.move_history.append(Move(row, col, player))
-                        elif isinstance(mv, (list, tuple)) and len(mv) >= 3:
-                            self.game.move_history.append(Move(mv[0], mv[1], Player(mv[2])))
-
-                    # --- 🎯 Restore last move marker ---
-                    if self.game.move_history:
-                        last_move = self.game.move_history[-1]
-                        self.last_move_pos = (last_move.row, last_move.col)
-
-                    # --- 🎮 Restore game state ---
-                    self.game.current_player = Player(current_player)
-                    print(f"🔧 CLIENT: Restored current_player={self.game.current_player.name} (value={current_player})")
-                    self.game.game_state = GameState(game_state_str) if isinstance(game_state_str, str) else game_state_str
-                    
-                    # CRITICAL: Sync timer with server's timer state
-                    if timer_state:
-                        server_turn_start = timer_state.get("turn_start_time")
-                        self.move_time_limit = timer_state.get("move_time_limit", 30)
-                        self.elapsed_before_pause = timer_state.get("elapsed_before_pause", 0)
-                        
-                        if server_turn_start:
-                            # Calculate time since server set the timer
-                            time_since_server_reset = time.time() - server_turn_start
-                            self.turn_start_time = time.time()  # Start our timer now
-                            self.elapsed_before_pause = time_since_server_reset  # Account for network delay
-                            print(f"🔧 DEBUG: Synced timer from server - started {time_since_server_reset:.2f}s ago, effective remaining: {self.move_time_limit - time_since_server_reset:.1f}s")
-                        else:
-                            self.turn_start_time = time.time()
-                            print(f"🔧 DEBUG: Server sent no turn_start_time, starting fresh")
-                    else:
-                        # Fallback: fresh timer
-                        self.elapsed_before_pause = 0
-                        self.turn_start_time = time.time()
-                        self.move_time_limit = 30
-                        print(f"🔧 DEBUG: No timer_state from server, using fresh 30s timer")
-                    
-                    # Restore player role
-                    self.my_player = Player.BLACK if your_role == "black" else Player.WHITE
-                    print(f"🔧 DEBUG: my_player set to {self.my_player.name} (role: {your_role})")
-                    
-                    # Restore player name (for UI display)
-                    self.player_name = your_name
-                    
-                    # Restore player names from server data
-                    if players:
-                        self.player_names = {
-                            Player.BLACK: players.get("black", "Player 1"),
-                            Player.WHITE: players.get("white", "Player 2")
-                        }
-                        print(f"🔧 DEBUG: Restored player names: {self.player_names}")
-                        print(f"🔧 DEBUG: You are {self.player_name} ({your_role})")
-                    
-                    # **CRITICAL**: Mark as network game to enable turn validation
-                    self.is_network_game = True
-                    
-                    # Restore winner if game is over
-                    if self.game.game_state in [GameState.BLACK_WINS, GameState.WHITE_WINS]:
-                        self.game.winner = self.game.current_player
-                    
-                    # --- 🎮 Restore UI state ---
-                    if self.game.game_state == GameState.PLAYING:
-                        self.ui_state = UIState.GAMEPLAY
-                        self.paused = False
-                        # Timer already reset above - don't need to check again
-                        # Restart background music if it was playing
-                        if not pygame.mixer.music.get_busy():
-                            self._play_background_music()
-                        print(f"🔧 DEBUG: UI state set to GAMEPLAY, game unpaused, timer running")
-                    else:
-                        # Game is over, show game over screen
-                        self.ui_state = UIState.GAME_OVER
-                        self.paused = False
-                        self.turn_start_time = None
-                        self.elapsed_before_pause = 0
-
-                    # --- 🖼️ Force board redraw ---
-                    self._draw_board()
-                    pygame.display.flip()
-
-                    print(f"✅ Restored {len(moves)} moves and board ({sum(cell != 0 for row in board for cell in row)} stones), turn: {self.game.current_player.name}, state: {self.game.game_state.value}")
-
-                except Exception as e:
-                    print(f"⚠️ Error restoring reconnect state: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    # Fallback: reset to waiting room
-                    self.ui_state = UIState.ROOM_WAITING
-
-            self.network_manager.set_connection_callback("connect", handle_connect)
-            self.network_manager.set_connection_callback("disconnect", handle_disconnect)
-            self.network_manager.set_message_handler("room_list", handle_room_list)
-            self.network_manager.set_message_handler("room_info", handle_room_info)
-            self.network_manager.set_message_handler("game_started", handle_game_start)
-            self.network_manager.set_message_handler("game_move", handle_game_move)
-            self.network_manager.set_message_handler("timer_sync", handle_timer_sync)
-            self.network_manager.set_message_handler("new_game_request", handle_new_game_request)
-            self.network_manager.set_message_handler("new_game_response", handle_new_game_response)
-            self.network_manager.set_message_handler("player_pause", handle_player_pause)
-            self.network_manager.set_message_handler("player_resume", handle_player_resume)
-            self.network_manager.set_message_handler("player_resign", handle_player_resign)
-            self.network_manager.set_message_handler("resign_ack", handle_resign_ack)
-            self.network_manager.set_message_handler("reconnect_success", handle_reconnect_success)
-            
-            def handle_reconnect_failed(data):
-                """Handle failed reconnection"""
-                reason = data.get("reason", "unknown")
-                message = data.get("message", "Failed to reconnect to your game")
-                print(f"❌ Reconnection failed: {message}")
-                
-                self.disconnect_reason = message
-                self.ui_state = UIState.MAIN_MENU
-                
-            def handle_player_disconnected(data):
-                """Handle opponent disconnection"""
-                player_name = data.get("player_name", "Opponent")
-                disconnect_time = data.get("disconnect_time", time.time())
-                timeout_seconds = data.get("timeout_seconds", 120)
-                message = data.get("message", f"{player_name} has disconnected")
-                
-                print(f"⚠️ {message}")
-                print(f"Waiting {timeout_seconds} seconds for reconnection...")
-                
-                self.opponent_disconnect_time = disconnect_time
-                self.opponent_disconnect_timeout = timeout_seconds
-                self.disconnect_reason = message
-                self.ui_state = UIState.OPPONENT_DISCONNECTED
-                
-                # Pause the game and freeze timer
-                self.paused = True
-                # Freeze the timer by saving elapsed time and clearing turn_start_time
-                if self.turn_start_time:
-                    elapsed = time.time() - self.turn_start_time
-                    self.elapsed_before_pause += elapsed
-                    self.turn_start_time = None
-                
-            def handle_player_reconnected(data):
-                """Handle opponent reconnection"""
-                player_name = data.get("player", "Opponent")
-                player_role = data.get("player_role", "")
-                current_player = data.get("current_player")
-                board = data.get("board")
-                moves = data.get("moves")
-                timer_state = data.get("timer_state", {})
-                
-                print(f"✅ {player_name} has reconnected!")
-                print(f"🔧 DEBUG: Syncing timer from server - was paused={self.paused}, ui_state={self.ui_state}")
-                
-                # Sync game state if provided by server
-                if current_player is not None:
-                    self.game.current_player = Player(current_player)
-                    print(f"🔧 CLIENT: Synchronized current_player to {self.game.current_player.name} (value={current_player})")
-                
-                if board and moves is not None:
-                    # Rebuild board state from server
-                    for r in range(min(len(board), 15)):
-                        for c in range(min(len(board[r]), 15)):
-                            cell = board[r][c]
-                            self.game.board[r][c] = Player(cell) if cell in [0, 1, 2] else Player.EMPTY
-                    print(f"🔧 DEBUG: Synchronized board - {sum(cell != 0 for row in board for cell in row)} stones")
-                
-                # Resume the game
-                self.opponent_disconnect_time = None
-                
-                if self.ui_state == UIState.OPPONENT_DISCONNECTED:
-                    self.ui_state = UIState.GAMEPLAY
-                    print(f"🔧 DEBUG: UI state changed to GAMEPLAY")
-                    
-                # CRITICAL: Use server's timer state for synchronization
-                if timer_state:
-                    server_turn_start = timer_state.get("turn_start_time")
-                    self.elapsed_before_pause = timer_state.get("elapsed_before_pause", 0)
-                    self.move_time_limit = timer_state.get("move_time_limit", 30)
-                    # Calculate time since server set the timer
-                    if server_turn_start:
-                        # Adjust for network delay - server set timer at server_turn_start, we received it now
-                        time_since_server_reset = time.time() - server_turn_start
-                        self.turn_start_time = time.time()  # Start our timer now
-                        self.elapsed_before_pause = time_since_server_reset  # Account for delay
-                        print(f"🔧 DEBUG: Synced timer from server - started {time_since_server_reset:.2f}s ago, effective remaining: {self.move_time_limit - time_since_server_reset:.1f}s")
-                    else:
-                        self.turn_start_time = time.time()
-                        print(f"🔧 DEBUG: Server sent no turn_start_time, starting fresh timer")
-                else:
-                    # Fallback: reset timer locally
-                    self.elapsed_before_pause = 0
-                    self.turn_start_time = time.time()
-                    print(f"🔧 DEBUG: No timer_state from server, using local reset")
-                
-                self.paused = False  # Unpause
-                print(f"🔧 DEBUG: Game unpaused, timer running")
-                        
-            def handle_game_ended_disconnect(data):
-                """Handle game ending due to disconnect (graceful termination)"""
-                reason = data.get("reason", "opponent_disconnected")
-                disconnected_player = data.get("disconnected_player", "Opponent")
-                winner = data.get("winner", self.player_name)
-                message = data.get("message", "Game ended due to disconnection")
-                no_rematch = data.get("no_rematch", False)
-                
-                print(f"🏆 {message}")
-                
-                # Set game state to win (you win by forfeit)
-                if self.my_player == Player.BLACK:
-                    self.game.game_state = GameState.BLACK_WINS
-                    self.game.winner = Player.BLACK
-                else:
-                    self.game.game_state = GameState.WHITE_WINS
-                    self.game.winner = Player.WHITE
-                
-                # Store that this was a disconnect win (no rematch allowed)
-                self.disconnect_reason = message
-                self.is_disconnect_win = no_rematch
-                self.ui_state = UIState.GAME_OVER
-                
-                # Play winner sound
-                self._play_sound("winner")
-            
-            def handle_player_left_room(data):
-                """Handle when opponent leaves the room"""
-                player_name = data.get("player_name", "Unknown")
-                print(f"🚪 {player_name} left the room")
-                
-                # If we're in gameplay or game over, move back to waiting room
-                if self.ui_state in [UIState.GAMEPLAY, UIState.GAME_OVER]:
-                    # Reset game state
-                    self.game.reset_game()
-                    self.ui_state = UIState.ROOM_WAITING
-                    # Stop background music
-                    self._stop_background_music()
-                    print(f"📋 Moved back to waiting room (you are now the host)")
-            
-            self.network_manager.set_message_handler("reconnect_failed", handle_reconnect_failed)
-            self.network_manager.set_message_handler("player_disconnected", handle_player_disconnected)
-            self.network_manager.set_message_handler("player_reconnected", handle_player_reconnected)
-            self.network_manager.set_message_handler("game_ended_disconnect", handle_game_ended_disconnect)
-            self.network_manager.set_message_handler("player_left_room", handle_player_left_room)
-            
-            # Set connection callbacks
-            self.network_manager.set_connection_callback("connect", handle_connect)
-            self.network_manager.set_connection_callback("disconnect", handle_disconnect)
-            self.network_manager.set_connection_callback("connection_lost", lambda: (
-                print("🔌 Connection lost!"),
-                setattr(self, "disconnect_reason", "Connection to server lost. Attempting to reconnect..."),
-                setattr(self, "ui_state", UIState.CONNECTION_LOST)
-            ))
-            self.network_manager.set_connection_callback("reconnecting", lambda attempt, max_attempts: (
-                setattr(self, "reconnection_attempt", attempt),
-                setattr(self, "max_reconnection_attempts", max_attempts),
-                print(f"🔄 Reconnection attempt {attempt}/{max_attempts}...")
-            ))
-            self.network_manager.set_connection_callback("reconnect_success", lambda: (
-                print("✅ Successfully reconnected to server!"),
-                setattr(self, "reconnection_attempt", 0)
-            ))
-            self.network_manager.set_connection_callback("reconnect_failed", lambda: (
-                print("❌ Failed to reconnect to server"),
-                setattr(self, "disconnect_reason", "Failed to reconnect to server after multiple attempts"),
-                setattr(self, "ui_state", UIState.MAIN_MENU)
-            ))
+            # Message handlers touch UI state, so run them on the main thread
+            self.network_manager.deferred_dispatch = True
+            
+            # Set up message handlers and connection callbacks
+            self.network_manager.set_message_handlers({
+                "room_list": self._on_room_list,
+                "room_info": self._on_room_info,
+                "player_pause": self._on_player_pause,
+                "player_resume": self._on_player_resume,
+                "game_started": self._on_game_started,
+                "game_move": self._on_game_move,
+                "timer_sync": self._on_timer_sync,
+                "new_game_request": self._on_new_game_request,
+                "new_game_response": self._on_new_game_response,
+                "player_resign": self._on_player_resign,
+                "resign_ack": self._on_resign_ack,
+                "reconnect_success": self._on_reconnect_success,
+                "reconnect_failed": self._on_reconnect_failed,
+                "player_disconnected": self._on_player_disconnected,
+                "player_reconnected": self._on_player_reconnected,
+                "game_ended_disconnect": self._on_game_ended_disconnect,
+                "player_left_room": self._on_player_left_room,
+            })
+            self.network_manager.set_connection_callbacks({
+                "connect": self._on_connect,
+                "disconnect": self._on_disconnect,
+                "connection_lost": self._on_connection_lost,
+                "reconnecting": self._on_reconnecting,
+                "reconnect_success": self._on_server_reconnected,
+                "reconnect_failed": self._on_server_reconnect_failed,
+            })
             
             # Get server configuration
             server_config = self.server_config_manager.get_current_config()
@@ -3311,6 +3335,529 @@ class GomokuUI:
             print(f"Error connecting to lobby: {e}")
             self.ui_state = UIState.GAME_MODE_SELECT
     
+    def _on_connect(self):
+        """Join the lobby once the server connection is up"""
+        print(f"Connected to lobby as {self.player_name}")
+        # Join lobby with player name
+        self.network_manager.join_lobby(self.player_name)
+        self.ui_state = UIState.LOBBY_BROWSER
+        self._refresh_room_list()
+    
+    def _on_disconnect(self):
+        """Handle disconnection from server"""
+        print("Disconnected from lobby")
+
+        # Handle different states appropriately
+        if self.ui_state in [UIState.LOBBY_BROWSER, UIState.ROOM_CREATE, UIState.ROOM_WAITING]:
+            self.ui_state = UIState.MAIN_MENU
+        elif self.ui_state in [UIState.GAMEPLAY, UIState.PAUSE_MENU]:
+            # If in gameplay, this means the connection was lost
+            # The opponent disconnect handler should have been triggered
+            # If not, show a generic disconnect message
+            if self.ui_state != UIState.OPPONENT_DISCONNECTED and self.ui_state != UIState.CONNECTION_LOST:
+                self.disconnect_reason = "Connection to server lost"
+                self.ui_state = UIState.MAIN_MENU
+    
+    def _on_room_list(self, data):
+        """Store the lobby room list sent by the server"""
+        self.current_room_list = data.get("rooms", [])
+        print(f"Received room list: {len(self.current_room_list)} rooms")
+    
+    def _on_room_info(self, data):
+        """Handle the room created / joined reply"""
+        if data.get("success"):
+            self.room_info = data.get("room_info")
+            if self.room_info:
+                self.room_id = self.room_info.get("room_id")
+                message = data.get("message", "")
+                print(f"Joined/Created room: {self.room_info}")
+                print(f"Room info message: {message}")
+
+                # Check if we became host (e.g., after opponent left)
+                if "You are now the host!" in message or "You are the host" in message:
+                    print(f"👑 You became/are the host of the room!")
+                    # If we're in gameplay or game over, this means opponent left
+                    # We should go back to waiting room
+                    if self.ui_state in [UIState.GAMEPLAY, UIState.GAME_OVER, UIState.PAUSE_MENU]:
+                        self.game.reset_game()
+                        self.ui_state = UIState.ROOM_WAITING
+                        self._stop_background_music()
+                        print(f"📋 Opponent left during game - returned to waiting room as host")
+
+                # Store reconnect info
+                self.reconnect_info = {
+                    "player_name": self.player_name,
+                    "room_id": self.room_id
+                }
+                print(f"Reconnection info stored: {self.reconnect_info}")
+
+                # Only set to ROOM_WAITING if we're not already in a game state
+                if self.ui_state not in [UIState.GAMEPLAY, UIState.PAUSE_MENU, UIState.GAME_OVER]:
+                    self.ui_state = UIState.ROOM_WAITING
+    
+    def _on_player_pause(self, data):
+        """Handle a pause from either player"""
+        sender = data.get("player", "Unknown")
+        remaining_turn = data.get("remaining_turn", None)
+        pauses_remaining = data.get("pauses_remaining", None)
+        pause_timestamp = data.get("pause_timestamp", None)
+        print(f"🔶 Received pause signal from {sender}")
+
+        # Freeze game on both sides
+        self.paused = True
+        self.ui_state = UIState.PAUSE_MENU
+
+        # Synchronize pause start time with the initiator's timestamp
+        if pause_timestamp is not None:
+            self.pause_start_time = self._server_time_to_local(pause_timestamp)
+            print(f"Synchronized pause start time with initiator")
+        else:
+            self.pause_start_time = time.monotonic()  # Fallback to local time
+
+        # Record who paused — determine opponent
+        if self.my_player == Player.BLACK:
+            self.pause_initiator = Player.WHITE
+        else:
+            self.pause_initiator = Player.BLACK
+
+        # Synchronize pause count from the pauser
+        if pauses_remaining is not None:
+            self.pause_allowance[self.pause_initiator] = pauses_remaining
+            self._pause_info_dirty = True
+            print(f"Synchronized pause count for {self.pause_initiator.name}: {pauses_remaining} remaining")
+
+        # Synchronize timer with sender
+        if remaining_turn is not None:
+            self.turn_start_time = None
+            self.elapsed_before_pause = self.move_time_limit - remaining_turn
+            print(f"Synchronized pause — remaining turn time: {remaining_turn}s")
+    
+    def _on_player_resume(self, data):
+        """Handle a resume from either player"""
+        sender = data.get("player", "Unknown")
+        remaining_turn = data.get("remaining_turn", None)
+        resume_timestamp = data.get("resume_timestamp", None)
+        print(f"▶️ Received resume signal from {sender}")
+
+        self.paused = False
+        self.pause_start_time = None
+        self.ui_state = UIState.GAMEPLAY
+        self.pause_initiator = None  # Reset pause owner
+
+        # Sync countdown continuation
+        if remaining_turn is not None:
+            self.elapsed_before_pause = self.move_time_limit - remaining_turn
+            # The sender's clock has been running since it resumed
+            if resume_timestamp is not None:
+                self.turn_start_time = min(time.monotonic(), self._server_time_to_local(resume_timestamp))
+            else:
+                self.turn_start_time = time.monotonic()
+            print(f"Synchronized resume — remaining turn: {remaining_turn}s")
+    
+    def _on_game_started(self, data):
+        """Set up the network game when the server starts it"""
+        print("Game starting!")
+        print(f"Game start data: {data}")
+
+        # Extract player role and names from server
+        your_role = data.get('your_role', 'black')  # 'black' or 'white'
+        your_name = data.get('your_name', self.player_name)
+        opponent_name = data.get('opponent_name', 'Opponent')
+        players_dict = data.get('players', {})
+        your_turn = data.get('your_turn', True)
+
+        # Set network game info
+        self.network_game_info = {
+            'your_role': your_role,
+            'your_name': your_name,
+            'opponent_name': opponent_name,
+            'players': players_dict,
+            'your_turn': your_turn
+        }
+
+        print(f"You are: {your_name} ({your_role})")
+        print(f"Opponent: {opponent_name}")
+        print(f"Your turn: {your_turn}")
+
+        self._start_network_game()
+    
+    def _on_game_move(self, data):
+        """Apply a move made by the opponent"""
+        row, col = data.get('row'), data.get('col')
+        print(f"Received move from {data.get('player', 'Unknown')}: ({row}, {col})")
+        if row is None or col is None:
+            return
+        self._handle_network_move(row, col, data.get('timer_state'))
+    
+    def _on_timer_sync(self, data):
+        """Handle timer synchronization from server"""
+        timer_state = data.get('timer_state')
+        if timer_state:
+            server_turn_start = timer_state.get("turn_start_time")
+            self.move_time_limit = timer_state.get("move_time_limit", 30)
+            if server_turn_start:
+                time_since_server_reset = self._server_now() - server_turn_start
+                self.turn_start_time = time.monotonic()
+                self.elapsed_before_pause = time_since_server_reset
+            else:
+                self.turn_start_time = time.monotonic()
+                self.elapsed_before_pause = 0
+    
+    def _on_new_game_request(self, data):
+        """Handle the opponent asking for a new game"""
+        print(f"Opponent requested a new game")
+        # Show confirmation dialog or automatically accept
+        # For now, automatically accept
+        if self.network_manager:
+            self.network_manager.send_message("new_game_response", {
+                "room_id": data.get("room_id"),
+                "accepted": True
+            })
+            print("Accepted new game request")
+    
+    def _on_new_game_response(self, data):
+        """Handle the answer to our new game request"""
+        if data.get("accepted"):
+            print("Opponent accepted new game!")
+            self._start_network_game()
+        else:
+            print("Opponent declined new game")
+    
+    def _on_player_resign(self, data):
+        """Triggered when opponent resigns"""
+        resigned_player = data.get("player", "Unknown")
+        print(f"🏳️ Opponent {resigned_player} resigned.")
+
+        # End the game correctly
+        if self.my_player == Player.BLACK:
+            winner = Player.BLACK if self.game.current_player == Player.BLACK else Player.WHITE
+        else:
+            winner = Player.WHITE if self.game.current_player == Player.WHITE else Player.BLACK
+
+        # Opponent resigned → you are the winner
+        self.game.winner = self.my_player
+        self.game.game_state = (
+            GameState.BLACK_WINS if self.my_player == Player.BLACK else GameState.WHITE_WINS
+        )
+        self.ui_state = UIState.GAME_OVER
+        print(f"🎉 You win! Opponent {resigned_player} has resigned.")
+    
+    def _on_resign_ack(self, data):
+        """Triggered when server confirms your resignation"""
+        msg = data.get("message", "You have resigned.")
+        print(f"✅ Server acknowledged resignation: {msg}")
+
+        # You lose
+        self.ui_state = UIState.GAME_OVER
+        self.game.game_state = (
+            GameState.WHITE_WINS if self.my_player == Player.BLACK else GameState.BLACK_WINS
+        )
+        self.game.winner = (
+            Player.WHITE if self.my_player == Player.BLACK else Player.BLACK
+        )
+    
+    def _on_reconnect_success(self, data):
+        """Restore the game state sent back after we reconnect"""
+        print("🔁 Reconnected successfully!")
+        self.room_id = data.get("room_id")
+
+        board = data.get("board", [])
+        moves = data.get("moves", [])
+        current_player = data.get("current_player", 1)
+        players = data.get("players", {})
+        game_state = data.get("game_state", "playing")
+        your_role = data.get("your_role", "black")
+        your_name = data.get("your_name", "You")
+        timer_state = data.get("timer_state", {})
+
+        try:
+            # --- 🧠 Rebuild game board from server state, replacing the old one ---
+            if board and isinstance(board[0], list):
+                # Clamp to the board size, padding short or missing rows with empty cells
+                size = GomokuGame.BOARD_SIZE
+                rows = board[:size] + [[]] * (size - len(board))
+                self.game.board = [[NETWORK_PLAYER_BY_VALUE.get(cell, Player.EMPTY) for cell in row[:size]]
+                                   + [Player.EMPTY] * (size - len(row))
+                                   for row in rows]
+            else:
+                self.game.board = [[Player.EMPTY for _ in range(GomokuGame.BOARD_SIZE)] for _ in range(GomokuGame.BOARD_SIZE)]
+            self.game.move_history.clear()
+            self._stone_layer_key = None
+
+            # --- 🧩 Rebuild move history ---
+            # Server moves name their player; resolve the black player's name once
+            color_by_name = {players.get("black"): Player.BLACK} if players else {}
+            history = self.game.move_history
+            for mv in moves:
+                if isinstance(mv, dict):
+                    player = color_by_name.get(mv.get("player"), Player.WHITE)
+                    history.append(Move(mv.get("row"), mv.get("col"), player))
+                elif isinstance(mv, (list, tuple)) and len(mv) >= 3:
+                    history.append(Move(mv[0], mv[1], PLAYER_BY_VALUE[mv[2]]))
+
+            # --- 🎯 Restore last move marker ---
+            if self.game.move_history:
+                last_move = self.game.move_history[-1]
+                self.last_move_pos = (last_move.row, last_move.col)
+
+            # --- 🎮 Restore game state ---
+            self.game.current_player = PLAYER_BY_VALUE[current_player]
+            if self.verbose_debug:
+                print(f"🔧 CLIENT: Restored current_player={self.game.current_player.name} (value={current_player})")
+            self.game.game_state = GAME_STATE_BY_VALUE[game_state]
+
+            # CRITICAL: Sync timer with server's timer state
+            if timer_state:
+                server_turn_start = timer_state.get("turn_start_time")
+                self.move_time_limit = timer_state.get("move_time_limit", 30)
+                self.elapsed_before_pause = timer_state.get("elapsed_before_pause", 0)
+
+                if server_turn_start:
+                    # Calculate time since server set the timer
+                    time_since_server_reset = self._server_now() - server_turn_start
+                    self.turn_start_time = time.monotonic()  # Start our timer now
+                    self.elapsed_before_pause = time_since_server_reset  # Account for network delay
+                    if self.verbose_debug:
+                        print(f"🔧 DEBUG: Synced timer from server - started {time_since_server_reset:.2f}s ago, effective remaining: {self.move_time_limit - time_since_server_reset:.1f}s")
+                else:
+                    self.turn_start_time = time.monotonic()
+                    if self.verbose_debug:
+                        print(f"🔧 DEBUG: Server sent no turn_start_time, starting fresh")
+            else:
+                # Fallback: fresh timer
+                self.elapsed_before_pause = 0
+                self.turn_start_time = time.monotonic()
+                self.move_time_limit = 30
+                if self.verbose_debug:
+                    print(f"🔧 DEBUG: No timer_state from server, using fresh 30s timer")
+
+            # Restore player role
+            self.my_player = Player.BLACK if your_role == "black" else Player.WHITE
+            if self.verbose_debug:
+                print(f"🔧 DEBUG: my_player set to {self.my_player.name} (role: {your_role})")
+
+            # Restore player name (for UI display)
+            self.player_name = your_name
+
+            # Restore player names from server data
+            if players:
+                self.player_names = {
+                    Player.BLACK: players.get("black", "Player 1"),
+                    Player.WHITE: players.get("white", "Player 2")
+                }
+                if self.verbose_debug:
+                    print(f"🔧 DEBUG: Restored player names: {self.player_names}")
+                    print(f"🔧 DEBUG: You are {self.player_name} ({your_role})")
+
+            # **CRITICAL**: Mark as network game to enable turn validation
+            self.is_network_game = True
+
+            # Restore winner if game is over
+            if self.game.game_state in [GameState.BLACK_WINS, GameState.WHITE_WINS]:
+                self.game.winner = self.game.current_player
+
+            # --- 🎮 Restore UI state ---
+            if self.game.game_state == GameState.PLAYING:
+                self.ui_state = UIState.GAMEPLAY
+                self.paused = False
+                # Timer already reset above - don't need to check again
+                # Restart background music if it was playing
+                if not self._music_playing:
+                    self._play_background_music()
+                if self.verbose_debug:
+                    print(f"🔧 DEBUG: UI state set to GAMEPLAY, game unpaused, timer running")
+            else:
+                # Game is over, show game over screen
+                self.ui_state = UIState.GAME_OVER
+                self.paused = False
+                self.turn_start_time = None
+                self.elapsed_before_pause = 0
+
+            # --- 🖼️ Force board redraw ---
+            # Handlers run on the main thread just before _draw, so the next
+            # frame repaints the restored board; present it in full
+            self._force_full_flip = True
+
+            print(f"✅ Restored {len(moves)} moves and board, turn: {self.game.current_player.name}, state: {self.game.game_state.value}")
+
+        except (KeyError, ValueError, TypeError, IndexError, AttributeError) as e:
+            # Malformed payload; only format the traceback when debugging
+            print(f"⚠️ Error restoring reconnect state: {e}")
+            if self.verbose_debug:
+                import traceback
+                traceback.print_exc()
+            # Fallback: reset to waiting room
+            self.ui_state = UIState.ROOM_WAITING
+    
+    def _on_reconnect_failed(self, data):
+        """Handle failed reconnection"""
+        reason = data.get("reason", "unknown")
+        message = data.get("message", "Failed to reconnect to your game")
+        print(f"❌ Reconnection failed: {message}")
+
+        self.disconnect_reason = message
+        self.ui_state = UIState.MAIN_MENU
+    
+    def _on_player_disconnected(self, data):
+        """Handle opponent disconnection"""
+        player_name = data.get("player_name", "Opponent")
+        disconnect_time = data.get("disconnect_time")
+        timeout_seconds = data.get("timeout_seconds", 120)
+        message = data.get("message", f"{player_name} has disconnected")
+
+        print(f"⚠️ {message}")
+        print(f"Waiting {timeout_seconds} seconds for reconnection...")
+
+        if disconnect_time is not None:
+            self.opponent_disconnect_time = self._server_time_to_local(disconnect_time)
+        else:
+            self.opponent_disconnect_time = time.monotonic()
+        self.opponent_disconnect_timeout = timeout_seconds
+        self.disconnect_reason = message
+        self.ui_state = UIState.OPPONENT_DISCONNECTED
+        self._opponent_disc_backdrop = None
+        # Hover then follows mouse motion events
+        self._leave_game_hover = self._leave_game_rect.collidepoint(pygame.mouse.get_pos())
+
+        # Pause the game and freeze timer
+        self.paused = True
+        # Freeze the timer by saving elapsed time and clearing turn_start_time
+        if self.turn_start_time:
+            elapsed = time.monotonic() - self.turn_start_time
+            self.elapsed_before_pause += elapsed
+            self.turn_start_time = None
+    
+    def _on_player_reconnected(self, data):
+        """Handle opponent reconnection"""
+        player_name = data.get("player", "Opponent")
+        player_role = data.get("player_role", "")
+        current_player = data.get("current_player")
+        board = data.get("board")
+        moves = data.get("moves")
+        timer_state = data.get("timer_state", {})
+
+        print(f"✅ {player_name} has reconnected!")
+        if self.verbose_debug:
+            print(f"🔧 DEBUG: Syncing timer from server - was paused={self.paused}, ui_state={self.ui_state}")
+
+        # Sync game state if provided by server
+        if current_player is not None:
+            self.game.current_player = PLAYER_BY_VALUE[current_player]
+            if self.verbose_debug:
+                print(f"🔧 CLIENT: Synchronized current_player to {self.game.current_player.name} (value={current_player})")
+
+        if board and moves is not None:
+            # Rebuild board state from server, one row slice at a time; short
+            # or missing server rows are padded with empty cells
+            size = GomokuGame.BOARD_SIZE
+            rows = board[:size] + [[]] * (size - len(board))
+            for board_row, server_row in zip(self.game.board, rows):
+                cells = server_row[:size]
+                board_row[:] = ([NETWORK_PLAYER_BY_VALUE.get(cell, Player.EMPTY) for cell in cells]
+                                + [Player.EMPTY] * (size - len(cells)))
+            self._stone_layer_key = None
+            if self.verbose_debug:
+                print(f"🔧 DEBUG: Synchronized board - {len(moves)} moves")
+
+        # Resume the game
+        self.opponent_disconnect_time = None
+
+        if self.ui_state == UIState.OPPONENT_DISCONNECTED:
+            self.ui_state = UIState.GAMEPLAY
+            if self.verbose_debug:
+                print(f"🔧 DEBUG: UI state changed to GAMEPLAY")
+
+        # CRITICAL: Use server's timer state for synchronization
+        if timer_state:
+            server_turn_start = timer_state.get("turn_start_time")
+            self.elapsed_before_pause = timer_state.get("elapsed_before_pause", 0)
+            self.move_time_limit = timer_state.get("move_time_limit", 30)
+            # Calculate time since server set the timer
+            if server_turn_start:
+                # Adjust for network delay - server set timer at server_turn_start, we received it now
+                time_since_server_reset = self._server_now() - server_turn_start
+                self.turn_start_time = time.monotonic()  # Start our timer now
+                self.elapsed_before_pause = time_since_server_reset  # Account for delay
+                if self.verbose_debug:
+                    print(f"🔧 DEBUG: Synced timer from server - started {time_since_server_reset:.2f}s ago, effective remaining: {self.move_time_limit - time_since_server_reset:.1f}s")
+            else:
+                self.turn_start_time = time.monotonic()
+                if self.verbose_debug:
+                    print(f"🔧 DEBUG: Server sent no turn_start_time, starting fresh timer")
+        else:
+            # Fallback: reset timer locally
+            self.elapsed_before_pause = 0
+            self.turn_start_time = time.monotonic()
+            if self.verbose_debug:
+                print(f"🔧 DEBUG: No timer_state from server, using local reset")
+
+        self.paused = False  # Unpause
+        if self.verbose_debug:
+            print(f"🔧 DEBUG: Game unpaused, timer running")
+    
+    def _on_game_ended_disconnect(self, data):
+        """Handle game ending due to disconnect (graceful termination)"""
+        reason = data.get("reason", "opponent_disconnected")
+        disconnected_player = data.get("disconnected_player", "Opponent")
+        winner = data.get("winner", self.player_name)
+        message = data.get("message", "Game ended due to disconnection")
+        no_rematch = data.get("no_rematch", False)
+
+        print(f"🏆 {message}")
+
+        # Set game state to win (you win by forfeit)
+        if self.my_player == Player.BLACK:
+            self.game.game_state = GameState.BLACK_WINS
+            self.game.winner = Player.BLACK
+        else:
+            self.game.game_state = GameState.WHITE_WINS
+            self.game.winner = Player.WHITE
+
+        # Store that this was a disconnect win (no rematch allowed)
+        self.disconnect_reason = message
+        self.is_disconnect_win = no_rematch
+        self.ui_state = UIState.GAME_OVER
+
+        # Play winner sound
+        self._play_sound("winner")
+    
+    def _on_player_left_room(self, data):
+        """Handle when opponent leaves the room"""
+        player_name = data.get("player_name", "Unknown")
+        print(f"🚪 {player_name} left the room")
+
+        # If we're in gameplay or game over, move back to waiting room
+        if self.ui_state in [UIState.GAMEPLAY, UIState.GAME_OVER]:
+            # Reset game state
+            self.game.reset_game()
+            self.ui_state = UIState.ROOM_WAITING
+            # Stop background music
+            self._stop_background_music()
+            print(f"📋 Moved back to waiting room (you are now the host)")
+    
+    def _on_connection_lost(self):
+        """Show the reconnecting screen when the server connection drops"""
+        print("🔌 Connection lost!")
+        self.disconnect_reason = "Connection to server lost. Attempting to reconnect..."
+        self.ui_state = UIState.CONNECTION_LOST
+    
+    def _on_reconnecting(self, attempt: int, max_attempts: int):
+        """Track the progress of automatic reconnection"""
+        self.reconnection_attempt = attempt
+        self.max_reconnection_attempts = max_attempts
+        print(f"🔄 Reconnection attempt {attempt}/{max_attempts}...")
+    
+    def _on_server_reconnected(self):
+        """Clear the reconnection progress once the connection is back"""
+        print("✅ Successfully reconnected to server!")
+        self.reconnection_attempt = 0
+    
+    def _on_server_reconnect_failed(self):
+        """Give up on the server after the last reconnection attempt"""
+        print("❌ Failed to reconnect to server")
+        self.disconnect_reason = "Failed to reconnect to server after multiple attempts"
+        self.ui_state = UIState.MAIN_MENU
+    
     def _disconnect_from_lobby(self):
         """Disconnect from lobby"""
         if self.network_manager:
@@ -3321,7 +3868,8 @@ class GomokuUI:
     def _refresh_room_list(self):
         """Request updated room list"""
         if self.network_manager:
-            self.network_manager.get_rooms()
+            # Repeated refreshes within a frame collapse into one request
+            self.network_manager.get_rooms(batched=True)
     
     def _create_room(self, room_name: str):
         """Create a new room"""
@@ -3354,7 +3902,7 @@ class GomokuUI:
         self._start_new_game()
         
         # Then override with network game info if available
-        if hasattr(self, 'network_game_info'):
+        if self.network_game_info:
             game_info = self.network_game_info
             
             # Set player role
@@ -3396,7 +3944,7 @@ class GomokuUI:
             # Fallback if no network game info
             self.my_player = Player.BLACK
             self.player_names = {
-                Player.BLACK: getattr(self, 'player_name', 'Player 1'),
+                Player.BLACK: self.player_name,
                 Player.WHITE: "Player 2"
             }
             print(f"Set fallback player names: {self.player_names}")
@@ -3405,7 +3953,7 @@ class GomokuUI:
         """Request a new game in network mode"""
         if self.network_manager:
             # Send new game request to server
-            room_id = self.network_game_info.get('room_id') if hasattr(self, 'network_game_info') else None
+            room_id = self.network_game_info.get('room_id') if self.network_game_info else None
             self.network_manager.send_message("new_game_request", {
                 "room_id": room_id
             })
@@ -3417,7 +3965,7 @@ class GomokuUI:
             # Fallback to local new game
             self._start_new_game()
     
-    def _start_ai_thinking(self, ai_player: AIPlayer = None):
+    def _start_ai_thinking(self, ai_player: "AIPlayer" = None):
         """Start AI thinking in a separate thread"""
         # Use provided AI player or fallback to self.ai_player
         if ai_player is None:
@@ -3426,34 +3974,60 @@ class GomokuUI:
         if self.ai_thinking or not ai_player:
             return
         
+        # Drop any result left over from a search of a previous game
+        while not self.ai_result_queue.empty():
+            self.ai_result_queue.get_nowait()
+        self._ai_move_ready = False
+        self._ai_move = None
+        
         self.ai_thinking = True
-        self.ai_move_result = None
-        self.thinking_start_time = time.time()
+        self._active_ai = ai_player
+        self.thinking_start_time = time.monotonic()
+        
+        # Snapshot the game state on the main thread so the worker never
+        # reads the live board
+        game_copy = GomokuGame(num_players=self.game.num_players)
+        game_copy.board = [row[:] for row in self.game.board]
+        game_copy.current_player = self.game.current_player
+        game_copy.player_index = self.game.player_index
+        game_copy.players = self.game.players[:]
+        game_copy.move_history = self.game.move_history[:]
+        game_copy.game_state = self.game.game_state
         
         def ai_worker():
             try:
-                # Create a copy of the game state for the AI thread
-                game_copy = GomokuGame(num_players=self.game.num_players)
-                game_copy.board = [row[:] for row in self.game.board]
-                game_copy.current_player = self.game.current_player
-                game_copy.player_index = self.game.player_index
-                game_copy.players = self.game.players[:]
-                game_copy.move_history = self.game.move_history[:]
-                game_copy.game_state = self.game.game_state
-                
                 # Get AI move
                 move = ai_player.get_move(game_copy)
-                self.ai_move_result = move
+                self.ai_result_queue.put(move)
+                # _handle_events collects the move when this event arrives
+                pygame.event.post(pygame.event.Event(AI_DONE_EVENT))
+            except pygame.error:
+                pass  # Display already shut down
             except Exception as e:
                 print(f"AI thinking error: {e}")
                 import traceback
                 traceback.print_exc()
-                self.ai_move_result = None
         
         self.ai_thread = threading.Thread(target=ai_worker, daemon=True)
         self.ai_thread.start()
         print(f"AI ({self.game.current_player.name}) started thinking... (difficulty: {self.ai_difficulty})")
     
+    def _buttons_for_event(self, key: str, event) -> Iterable[Tuple[int, Button]]:
+        """Return the (index, button) pairs of a group that can react to the event
+
+        A click is hit-tested against the group's rects in one collidelist
+        call and only offered to the first button under the cursor; other
+        events reach every button so hover and release are tracked.
+        """
+        buttons = self.buttons[key]
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            cached = self._button_rects.get(key)
+            if cached is None or cached[0] is not buttons:
+                cached = self._button_rects[key] = (buttons, [button.rect for button in buttons])
+            index = pygame.Rect(event.pos, (1, 1)).collidelist(cached[1])
+            return [(index, buttons[index])] if index >= 0 else []
+        return enumerate(buttons)
+
     def _update_server_buttons(self):
         """Update server selection buttons (centered for 800px width)"""
         self.buttons["server_select"] = [
@@ -3487,8 +4061,7 @@ class GomokuUI:
                     break
             
             # Check buttons
-            buttons = self.buttons["server_select"]
-            for i, button in enumerate(buttons):
+            for i, button in self._buttons_for_event("server_select", event):
                 if button.handle_event(event):
                     if i == 0:  # Continue
                         self.ui_state = UIState.PLAYER_NAME_INPUT
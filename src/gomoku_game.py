@@ -42,6 +42,8 @@ class GameState(Enum):
 
 class Move:
     """Represents a move in the game"""
+    __slots__ = ("row", "col", "player")
+    
     def __init__(self, row: int, col: int, player: Player):
         self.row = row
         self.col = col
@@ -188,20 +190,16 @@ class GomokuGame:
     
     def is_board_full(self) -> bool:
         """Check if the board is full"""
-        for row in self.board:
-            for cell in row:
-                if cell == Player.EMPTY:
-                    return False
-        return True
+        # Row membership tests run in C rather than a per-cell Python loop
+        return all(Player.EMPTY not in row for row in self.board)
     
     def get_legal_moves(self) -> List[Tuple[int, int]]:
         """Get all legal moves on the board"""
-        moves = []
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                if self.board[row][col] == Player.EMPTY:
-                    moves.append((row, col))
-        return moves
+        empty = Player.EMPTY
+        return [(row, col)
+                for row, cells in enumerate(self.board)
+                for col, cell in enumerate(cells)
+                if cell == empty]
     
     def get_smart_moves(self, limit: int = 50) -> List[Tuple[int, int]]:
         """
@@ -217,21 +215,26 @@ class GomokuGame:
         
         candidate_moves = set()
         
+        # Occupied cells, gathered once; both passes below only look at stones
+        empty = Player.EMPTY
+        occupied = [(row, col)
+                    for row, cells in enumerate(self.board)
+                    for col, cell in enumerate(cells)
+                    if cell != empty]
+        
         # Add moves within 2 squares of existing stones (for better tactical play)
         search_radius = 2
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                if self.board[row][col] != Player.EMPTY:
-                    # Add all positions within search_radius
-                    for dr in range(-search_radius, search_radius + 1):
-                        for dc in range(-search_radius, search_radius + 1):
-                            if dr == 0 and dc == 0:
-                                continue
-                            new_row, new_col = row + dr, col + dc
-                            if (0 <= new_row < self.BOARD_SIZE and 
-                                0 <= new_col < self.BOARD_SIZE and
-                                self.board[new_row][new_col] == Player.EMPTY):
-                                candidate_moves.add((new_row, new_col))
+        for row, col in occupied:
+            # Add all positions within search_radius
+            for dr in range(-search_radius, search_radius + 1):
+                for dc in range(-search_radius, search_radius + 1):
+                    if dr == 0 and dc == 0:
+                        continue
+                    new_row, new_col = row + dr, col + dc
+                    if (0 <= new_row < self.BOARD_SIZE and 
+                        0 <= new_col < self.BOARD_SIZE and
+                        self.board[new_row][new_col] == empty):
+                        candidate_moves.add((new_row, new_col))
         
         # Sort moves by strategic value (closer to center is better early game)
         center = self.BOARD_SIZE // 2
@@ -242,11 +245,9 @@ class GomokuGame:
             center_distance = abs(row - center) + abs(col - center)
             # Calculate proximity to existing stones
             min_distance = self.BOARD_SIZE
-            for r in range(self.BOARD_SIZE):
-                for c in range(self.BOARD_SIZE):
-                    if self.board[r][c] != Player.EMPTY:
-                        dist = max(abs(row - r), abs(col - c))  # Chebyshev distance
-                        min_distance = min(min_distance, dist)
+            for r, c in occupied:
+                dist = max(abs(row - r), abs(col - c))  # Chebyshev distance
+                min_distance = min(min_distance, dist)
             
             # Prefer moves close to existing stones and not too far from center
             score = -min_distance * 10 - center_distance
@@ -477,7 +478,7 @@ class GomokuGame:
         new_game = GomokuGame()
         new_game.board = copy.deepcopy(self.board)
         new_game.current_player = self.current_player
-        new_game.move_history = copy.deepcopy(self.move_history)
+        new_game.move_history = self.move_history.copy()  # Moves are never mutated, share them
         new_game.game_state = self.game_state
         new_game.winner = self.winner
         return new_game
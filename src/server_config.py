@@ -51,6 +51,7 @@ class ServerConfigManager:
         self.config_file = config_file
         self.configs: Dict[str, ServerConfig] = {}
         self.current_config: Optional[str] = None
+        self.version = 0  # Bumped on every change so callers can drop derived caches
         self._load_configs()
         self._ensure_default_configs()
     
@@ -73,6 +74,7 @@ class ServerConfigManager:
     
     def _save_configs(self):
         """Save configurations to file"""
+        self.version += 1
         try:
             data = {
                 'current_config': self.current_config,
@@ -7,8 +7,14 @@ import socket
 import threading
 import json
 import time
+import statistics
+from collections import deque
 from typing import Dict, Any, Optional, Callable
 
+# Compact separators keep boards and move lists small on the wire; any JSON
+# reader still parses them, so peers need not be updated together
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class StableGomokuClient:
     """
@@ -35,6 +41,24 @@ class StableGomokuClient:
         self.message_handlers = {}
         self.connection_callbacks = {}
         
+        # When set, handlers run from drain_nowait() instead of the receive thread
+        self.deferred_dispatch = False
+        self.pending_messages = deque()
+        
+        # Non-urgent outgoing messages, sent together by flush_batch()
+        self.outgoing_batch = []
+        self.batch_interval = 0.016  # About one frame
+        self._batch_lock = threading.Lock()
+        self._last_batch_flush = 0.0
+        
+        # Clock sync with the server: round trips from ping/pong, skew from
+        # the timestamp the server puts on every message (medians shrug off spikes)
+        self._ping_sent_at = None
+        self._rtt_samples = deque(maxlen=32)
+        self._skew_samples = deque(maxlen=32)
+        self.rtt = 0.0
+        self.clock_skew = 0.0  # Local wall clock minus server wall clock, seconds
+        
         # Threading
         self.receive_thread = None
         self.ping_thread = None
@@ -56,6 +80,14 @@ class StableGomokuClient:
         """Set callback for connection events"""
         self.connection_callbacks[event] = callback
     
+    def set_message_handlers(self, handlers: Dict[str, Callable]):
+        """Set handlers for several message types at once"""
+        self.message_handlers.update(handlers)
+    
+    def set_connection_callbacks(self, callbacks: Dict[str, Callable]):
+        """Set callbacks for several connection events at once"""
+        self.connection_callbacks.update(callbacks)
+    
     def connect(self, host: str = "localhost", port: int = 12345) -> bool:
         """Connect to the dedicated server"""
         try:
@@ -126,7 +158,7 @@ class StableGomokuClient:
                 "timestamp": time.time()
             }
             
-            message_json = json.dumps(message) + "\n"
+            message_json = _encode_json(message) + "\n"
             self.socket.send(message_json.encode('utf-8'))
             return True
             
@@ -135,6 +167,29 @@ class StableGomokuClient:
             self.disconnect()
             return False
     
+    def queue_message(self, message_type: str, data: Dict[str, Any] = None, coalesce: bool = False):
+        """Queue a non-urgent message for the next batch
+
+        With coalesce, an earlier queued message of the same type is dropped.
+        """
+        with self._batch_lock:
+            if coalesce:
+                self.outgoing_batch = [m for m in self.outgoing_batch if m["type"] != message_type]
+            self.outgoing_batch.append({"type": message_type, "data": data or {}})
+    
+    def flush_batch(self) -> bool:
+        """Send queued messages in one write once batch_interval has passed"""
+        now = time.monotonic()
+        with self._batch_lock:
+            if not self.outgoing_batch or now - self._last_batch_flush < self.batch_interval:
+                return True
+            messages, self.outgoing_batch = self.outgoing_batch, []
+            self._last_batch_flush = now
+        
+        if len(messages) == 1:
+            return self.send_message(messages[0]["type"], messages[0]["data"])
+        return self.send_message("batch", {"messages": messages})
+    
     def join_lobby(self, player_name: str) -> bool:
         """Join the lobby with player name"""
         self.player_name = player_name
@@ -155,8 +210,11 @@ class StableGomokuClient:
         """Leave current room"""
         return self.send_message("room_leave", {})
     
-    def get_rooms(self) -> bool:
-        """Request room list"""
+    def get_rooms(self, batched: bool = False) -> bool:
+        """Request room list, optionally folded into the next batch"""
+        if batched:
+            self.queue_message("room_list", coalesce=True)
+            return True
         return self.send_message("room_list", {})
     
     def send_game_move(self, row: int, col: int, player_id: int) -> bool:
@@ -183,7 +241,7 @@ class StableGomokuClient:
                     line, self.receive_buffer = self.receive_buffer.split(b'\n', 1)
                     if line:
                         try:
-                            message = json.loads(line.decode('utf-8'))
+                            message = json.loads(line)  # bytes are decoded as UTF-8
                             self._handle_message(message)
                         except json.JSONDecodeError as e:
                             print(f"⚠️  JSON decode error: {e}")
@@ -214,6 +272,16 @@ class StableGomokuClient:
             msg_type = message.get("type")
             data = message.get("data", {})
             
+            if msg_type == "pong" and self._ping_sent_at is not None:
+                self._rtt_samples.append(time.monotonic() - self._ping_sent_at)
+                self._ping_sent_at = None
+                self.rtt = statistics.median(self._rtt_samples)
+            
+            server_time = message.get("timestamp")
+            if server_time is not None:
+                self._skew_samples.append(time.time() - server_time - self.rtt / 2)
+                self.clock_skew = statistics.median(self._skew_samples)
+            
             # Handle built-in messages
             if msg_type == "pong":
                 return
@@ -242,11 +310,26 @@ class StableGomokuClient:
             
             # Call registered handler
             if msg_type in self.message_handlers:
-                self.message_handlers[msg_type](data)
+                if self.deferred_dispatch:
+                    self.pending_messages.append((msg_type, data))
+                else:
+                    self.message_handlers[msg_type](data)
                 
         except Exception as e:
             print(f"⚠️  Message handling error: {e}")
     
+    def drain_nowait(self) -> int:
+        """Run handlers for all queued messages without blocking, return how many ran"""
+        handled = 0
+        while self.pending_messages:
+            msg_type, data = self.pending_messages.popleft()
+            handled += 1
+            try:
+                self.message_handlers[msg_type](data)
+            except Exception as e:
+                print(f"⚠️  Message handling error: {e}")
+        return handled
+    
     def _attempt_reconnection(self):
         """Attempt to reconnect to the server"""
         if self.is_reconnecting:
@@ -324,11 +407,15 @@ class StableGomokuClient:
             self.connection_callbacks["disconnect"]()
     
     def _ping_loop(self):
-        """Send periodic pings"""
+        """Send periodic pings, starting right away so the RTT is known early"""
         while self.running and self.connected:
+            self._ping_sent_at = time.monotonic()
+            self.send_message("ping")
             time.sleep(30)  # Ping every 30 seconds
-            if self.connected:
-                self.send_message("ping")
+    
+    def server_time(self) -> float:
+        """Current time on the server's wall clock, as estimated locally"""
+        return time.time() - self.clock_skew
     
     def is_in_room(self) -> bool:
         """Check if currently in a room"""